@@ -0,0 +1,133 @@
+"""
+Shared helpers for the benchmark suite.
+
+Run it with `make bench`; results are saved (as JSON) below `.benchmarks/` and
+can be compared between runs with `make bench-compare`.
+
+"""
+
+import pytest
+from wtforms import FieldList
+from wtforms import Form
+from wtforms import IntegerField
+from wtforms import StringField
+from wtforms.meta import DefaultMeta
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import set_invalid
+from wtforms_html5 import set_minmax
+from wtforms_html5 import set_minmaxlength
+from wtforms_html5 import set_required
+from wtforms_html5 import set_title
+
+
+class BaselineMeta(DefaultMeta):
+    """
+    The `AutoAttrMeta` of version 0.6, before plans were cached: it computes
+    all auto–attributes with the `set_*` helpers on each render.
+
+    """
+
+    def render_field(self, field, render_kw):
+        field_kw = getattr(field, "render_kw", None)
+        if field_kw is not None:
+            render_kw = dict(field_kw, **render_kw)
+        render_kw = dict(render_kw)
+        set_required(field, render_kw)
+        set_invalid(field, render_kw)
+        set_minmax(field, render_kw)
+        set_minmaxlength(field, render_kw)
+        set_title(field, render_kw)
+        return field.widget(field, **render_kw)
+
+
+METAS = {
+    "default": DefaultMeta,
+    "baseline": BaselineMeta,
+    "autoattr": AutoAttrMeta,
+}
+
+VALIDATOR_MIXES = {
+    "none": lambda i: (StringField, []),
+    "length": lambda i: (StringField, [Length(min=1, max=i + 8)]),
+    "numberrange": lambda i: (IntegerField, [NumberRange(min=0, max=i + 8)]),
+    "required": lambda i: (StringField, [InputRequired()]),
+    "mixed": lambda i: (
+        (IntegerField, [InputRequired(), NumberRange(min=0, max=i + 8)])
+        if i % 2
+        else (StringField, [Length(min=1, max=i + 8)])
+    ),
+}
+
+
+class FormData(dict):
+    """
+    Minimal multidict, to process forms without needing `Werkzeug`.
+
+    """
+
+    def getlist(self, key):
+        return [self[key]] if key in self else []
+
+
+def make_meta(meta, **options):
+    """
+    Returns a `Meta` class based on the *meta* named in `METAS`.
+
+    """
+    return type("Meta", (METAS[meta],), options)
+
+
+def make_form_class(meta, n_fields=50, mix="mixed", **options):
+    """
+    Returns a form class with *n_fields* fields using the validator *mix*.
+
+    The *options* are set on the `Meta` class.
+
+    """
+    attrs = {"Meta": make_meta(meta, **options)}
+    for i in range(n_fields):
+        field_class, validators = VALIDATOR_MIXES[mix](i)
+        attrs[f"field_{i}"] = field_class(
+            validators=validators,
+            description=f"Field {i}",
+        )
+    return type("BenchForm", (Form,), attrs)
+
+
+def make_list_form_class(meta, n_entries, **options):
+    """
+    Returns a form class with a `FieldList` of *n_entries*.
+
+    """
+    attrs = {
+        "Meta": make_meta(meta, **options),
+        "items": FieldList(
+            StringField(validators=[Length(max=64)]),
+            min_entries=n_entries,
+        ),
+    }
+    return type("BenchListForm", (Form,), attrs)
+
+
+def make_formdata(form_class, valid=True):
+    """
+    Returns form data that passes (or fails) the validation of the forms
+    created by :func:`make_form_class`.
+
+    """
+    return FormData(
+        (name, "1" if valid else "x" * 1000) for name in form_class()._fields
+    )
+
+
+def render_form(form):
+    return [field() for field in form]
+
+
+@pytest.fixture(params=list(METAS))
+def meta(request):
+    return request.param
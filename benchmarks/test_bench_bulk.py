@@ -0,0 +1,83 @@
+"""
+Benchmarks for checking batches of records, compared with one form per row.
+
+The throughput is saved as `rows_per_second` in the `extra_info` of each
+benchmark (see the JSON written by `make bench`).
+
+"""
+
+import random
+
+import pytest
+
+from wtforms_html5.bulk import check_records
+from wtforms_html5.bulk import numpy
+
+from .conftest import FormData
+from .conftest import make_form_class
+
+N_FIELDS = 20
+
+
+def make_records(form_class, n_rows, seed=42):
+    rng = random.Random(seed)
+    names = list(form_class()._fields)
+    records = []
+    for _ in range(n_rows):
+        record = dict.fromkeys(names, "1")
+        for name in rng.sample(names, rng.randrange(3)):
+            record[name] = rng.choice(["", "x" * 1000, "-5", "abc", None])
+        records.append(record)
+    return records
+
+
+def validate_forms(form_class, records):
+    return [
+        not form_class(
+            FormData((k, v) for k, v in record.items() if v is not None)
+        ).validate()
+        for record in records
+    ]
+
+
+def check_python(form_class, records):
+    return check_records(form_class, records, use_numpy=False).invalid
+
+
+def check_numpy(form_class, records):
+    return check_records(form_class, records, use_numpy=True).invalid
+
+
+def record_throughput(benchmark, n_rows):
+    if benchmark.stats:  # `None` with `--benchmark-disable`
+        benchmark.extra_info["rows_per_second"] = round(
+            n_rows / benchmark.stats["mean"]
+        )
+
+
+@pytest.mark.benchmark(group="bulk-forms")
+def test_bulk_forms(benchmark):
+    form_class = make_form_class("default", N_FIELDS)
+    records = make_records(form_class, 1000)
+    benchmark(validate_forms, form_class, records)
+    record_throughput(benchmark, len(records))
+
+
+@pytest.mark.benchmark(group="bulk")
+@pytest.mark.parametrize("n_rows", [10000, 100000])
+@pytest.mark.parametrize(
+    "func",
+    [
+        check_python,
+        pytest.param(
+            check_numpy,
+            marks=pytest.mark.skipif(numpy is None, reason="needs NumPy"),
+        ),
+    ],
+    ids=["python", "numpy"],
+)
+def test_bulk(benchmark, n_rows, func):
+    form_class = make_form_class("default", N_FIELDS)
+    records = make_records(form_class, n_rows)
+    benchmark(func, form_class, records)
+    record_throughput(benchmark, n_rows)
@@ -0,0 +1,32 @@
+"""
+Benchmarks for rendering forms from Jinja2 templates.
+
+Compares calling the fields (`{{ field() }}`, i.e. `AutoAttrMeta.render_field`)
+with the `html5` filter of :mod:`wtforms_html5.jinja`.
+
+"""
+
+import pytest
+
+from .conftest import make_form_class
+
+jinja2 = pytest.importorskip("jinja2")
+
+from wtforms_html5.jinja import HTML5Extension
+
+TEMPLATES = {
+    "call": '{% for field in form %}{{ field(class_="x") }}{% endfor %}',
+    "filter": '{% for field in form %}{{ field|html5(class_="x") }}{% endfor %}',
+}
+
+
+@pytest.mark.benchmark(group="jinja")
+@pytest.mark.parametrize("template", list(TEMPLATES))
+def test_render_template(benchmark, template):
+    env = jinja2.Environment(extensions=[HTML5Extension], autoescape=True)
+    tmpl = env.from_string(TEMPLATES[template])
+    form = make_form_class("autoattr", 200)()
+    assert tmpl.render(form=form) == env.from_string(TEMPLATES["call"]).render(
+        form=form
+    )
+    benchmark(tmpl.render, form=form)
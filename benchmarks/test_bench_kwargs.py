@@ -0,0 +1,56 @@
+"""
+Benchmarks for computing render keywords, without rendering widgets.
+
+"""
+
+import pytest
+from wtforms import Form
+from wtforms import StringField
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+
+from wtforms_html5 import get_form_html5_kwargs
+from wtforms_html5 import get_html5_kwargs
+from wtforms_html5 import set_invalid
+from wtforms_html5 import set_minmax
+from wtforms_html5 import set_minmaxlength
+from wtforms_html5 import set_required
+from wtforms_html5 import set_title
+
+from .conftest import make_form_class
+
+
+class HelperForm(Form):
+    field = StringField(
+        validators=[InputRequired(), Length(max=5), NumberRange(max=5)],
+        description="Some help text",
+    )
+
+
+def get_each_html5_kwargs(form):
+    return {name: get_html5_kwargs(field) for name, field in form._fields.items()}
+
+
+@pytest.mark.benchmark(group="kwargs-form")
+@pytest.mark.parametrize("n_fields", [50, 200])
+@pytest.mark.parametrize(
+    "func",
+    [get_each_html5_kwargs, get_form_html5_kwargs],
+    ids=["per-field", "per-form"],
+)
+def test_form_kwargs(benchmark, meta, n_fields, func):
+    form = make_form_class(meta, n_fields)()
+    benchmark(func, form)
+
+
+@pytest.mark.benchmark(group="kwargs-helpers")
+@pytest.mark.parametrize(
+    "helper",
+    [set_required, set_invalid, set_minmax, set_minmaxlength, set_title],
+    ids=lambda helper: helper.__name__,
+)
+def test_helper(benchmark, helper):
+    form = HelperForm()
+    form.field.errors = ["Some error."]
+    benchmark(lambda: helper(form.field, {}))
@@ -0,0 +1,45 @@
+"""
+Benchmarks for prechecking form data, compared with `form.validate()`.
+
+"""
+
+import pytest
+
+from wtforms_html5.precheck import precheck
+
+from .conftest import FormData
+from .conftest import make_form_class
+
+PAYLOADS = {
+    "valid": lambda name, i: "1",
+    "missing": lambda name, i: None,
+    "too-long": lambda name, i: "x" * 1000,
+    "one-bad": lambda name, i: "x" * 1000 if i == 0 else "1",
+}
+
+
+def make_payload(form_class, payload):
+    formdata = FormData()
+    for i, name in enumerate(form_class()._fields):
+        value = PAYLOADS[payload](name, i)
+        if value is not None:
+            formdata[name] = value
+    return formdata
+
+
+def validate(form_class, formdata):
+    return form_class(formdata).validate()
+
+
+def check(form_class, formdata):
+    return not precheck(form_class, formdata)
+
+
+@pytest.mark.benchmark(group="precheck")
+@pytest.mark.parametrize("payload", list(PAYLOADS))
+@pytest.mark.parametrize("func", [validate, check], ids=["validate", "precheck"])
+def test_precheck(benchmark, payload, func):
+    form_class = make_form_class("autoattr", 50)
+    formdata = make_payload(form_class, payload)
+    assert func(form_class, formdata) is (payload == "valid")
+    benchmark(func, form_class, formdata)
@@ -0,0 +1,142 @@
+"""
+Benchmarks for rendering whole forms with `DefaultMeta` and `AutoAttrMeta`
+(and the uncached `AutoAttrMeta` of version 0.6 as baseline).
+
+"""
+
+import pytest
+from wtforms import Form
+from wtforms import RadioField
+from wtforms import SelectField
+from wtforms.validators import InputRequired
+
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5.render import form_etag
+from wtforms_html5.render import iter_render
+from wtforms_html5.render import render_changed
+
+from .conftest import VALIDATOR_MIXES
+from .conftest import make_form_class
+from .conftest import make_formdata
+from .conftest import make_list_form_class
+from .conftest import render_form
+
+CREATE_RENDER = {
+    "baseline": ("baseline", {}),
+    "autoattr": ("autoattr", {}),
+    "autoattr-cached": (
+        "autoattr",
+        {"html5_fragment_cache": True, "html5_codegen": True},
+    ),
+}
+
+
+@pytest.mark.benchmark(group="render-fields")
+@pytest.mark.parametrize("n_fields", [10, 50, 200])
+def test_render_fields(benchmark, meta, n_fields):
+    form = make_form_class(meta, n_fields)()
+    benchmark(render_form, form)
+
+
+@pytest.mark.benchmark(group="render-validators")
+@pytest.mark.parametrize("mix", list(VALIDATOR_MIXES))
+def test_render_validators(benchmark, meta, mix):
+    form = make_form_class(meta, 50, mix)()
+    benchmark(render_form, form)
+
+
+@pytest.mark.benchmark(group="render-errors")
+@pytest.mark.parametrize("valid", [True, False], ids=["clean", "errors"])
+def test_render_errors(benchmark, meta, valid):
+    form_class = make_form_class(meta, 50)
+    form = form_class(make_formdata(form_class, valid))
+    assert form.validate() is valid
+    benchmark(render_form, form)
+
+
+@pytest.mark.benchmark(group="render-fieldlist")
+@pytest.mark.parametrize("n_entries", [10, 100, 1000])
+def test_render_fieldlist(benchmark, meta, n_entries):
+    form = make_list_form_class(meta, n_entries)()
+    benchmark(render_form, form)
+
+
+@pytest.mark.benchmark(group="instantiate")
+@pytest.mark.parametrize("n_fields", [10, 50, 200])
+def test_instantiate(benchmark, meta, n_fields):
+    benchmark(make_form_class(meta, n_fields))
+
+
+@pytest.mark.benchmark(group="create-render")
+@pytest.mark.parametrize("n_fields", [10, 50, 200])
+@pytest.mark.parametrize("setup", list(CREATE_RENDER))
+def test_create_render(benchmark, setup, n_fields):
+    meta, options = CREATE_RENDER[setup]
+    form_class = make_form_class(meta, n_fields, **options)
+    form_class()  # computes the plans
+    benchmark(lambda: render_form(form_class()))
+
+
+@pytest.mark.benchmark(group="render-changed")
+@pytest.mark.parametrize("mode", ["full", "changed"])
+def test_render_changed(benchmark, mode):
+    form_class = make_form_class("autoattr", 50)
+    formdata = make_formdata(form_class)
+    previous = render_changed(form_class(formdata)).fingerprints
+    formdata["field_1"] = formdata["field_2"] = "x" * 1000
+    form = form_class(formdata)
+    assert form.validate() is False
+    if mode == "full":
+        benchmark(lambda: list(iter_render(form)))
+    else:
+        res = benchmark(render_changed, form, previous)
+        assert len(res.html) < 50
+
+
+@pytest.mark.benchmark(group="etag")
+@pytest.mark.parametrize("mode", ["render", "etag"])
+@pytest.mark.parametrize("n_fields", [10, 50, 200])
+def test_form_etag(benchmark, mode, n_fields):
+    form_class = make_form_class("autoattr", n_fields)
+    form = form_class(make_formdata(form_class))
+    if mode == "render":
+        benchmark(lambda: list(iter_render(form)))
+    else:
+        other = form_class(make_formdata(form_class))
+        assert benchmark(form_etag, form) == form_etag(other)
+
+
+@pytest.mark.benchmark(group="render-codegen")
+@pytest.mark.parametrize("codegen", [False, True], ids=["generic", "codegen"])
+@pytest.mark.parametrize("mix", ["none", "mixed"])
+def test_render_codegen(benchmark, codegen, mix):
+    form_class = make_form_class(
+        "autoattr",
+        50,
+        mix,
+        html5_codegen=codegen,
+        html5_fragment_cache=True,
+    )
+    form = form_class(make_formdata(form_class))
+    benchmark(render_form, form)
+
+
+@pytest.mark.benchmark(group="render-choices")
+@pytest.mark.parametrize("choice_cache", [False, True], ids=["plain", "cached"])
+@pytest.mark.parametrize("n_choices", [100, 1000, 5000])
+def test_render_choices(benchmark, choice_cache, n_choices):
+    class Meta(AutoAttrMeta):
+        html5_choice_cache = choice_cache
+
+    choices = [(f"v{i}", f"Choice <{i}>") for i in range(n_choices)]
+    form_class = type(
+        "ChoiceForm",
+        (Form,),
+        {
+            "Meta": Meta,
+            "select": SelectField(choices=choices, validators=[InputRequired()]),
+            "radio": RadioField(choices=choices[:100]),
+        },
+    )
+    form = form_class(data={"select": "v7", "radio": "v3"})
+    benchmark(render_form, form)
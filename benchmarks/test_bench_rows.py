@@ -0,0 +1,54 @@
+"""
+Benchmarks for rendering many rows of one form class, compared with one form
+per row.
+
+The throughput is saved as `rows_per_second` in the `extra_info` of each
+benchmark (see the JSON written by `make bench`).
+
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from wtforms_html5.render import render_rows
+
+from .conftest import make_form_class
+
+N_FIELDS = 10
+
+N_ROWS = 1000
+
+
+def make_rows(form_class, n_rows):
+    names = list(form_class()._fields)
+    return [
+        SimpleNamespace(**{name: str(i % 50) for name in names}) for i in range(n_rows)
+    ]
+
+
+def render_forms(form_class, rows, prefix):
+    res = []
+    for index, row in enumerate(rows):
+        form = form_class(obj=row, prefix=prefix.format(index=index))
+        res.append({name: field() for name, field in form._fields.items()})
+    return res
+
+
+def render_batch(form_class, rows, prefix):
+    return list(render_rows(form_class, rows, prefix))
+
+
+@pytest.mark.benchmark(group="render-rows")
+@pytest.mark.parametrize("mode", ["forms", "rows"])
+@pytest.mark.parametrize("mix", ["none", "mixed"])
+def test_render_rows(benchmark, mode, mix):
+    form_class = make_form_class("autoattr", N_FIELDS, mix)
+    rows = make_rows(form_class, N_ROWS)
+    func = render_forms if mode == "forms" else render_batch
+    res = benchmark(func, form_class, rows, "row-{index}")
+    assert res == render_forms(form_class, rows, "row-{index}")
+    if benchmark.stats:  # `None` with `--benchmark-disable`
+        benchmark.extra_info["rows_per_second"] = round(
+            N_ROWS / benchmark.stats["mean"]
+        )
@@ -33,11 +33,19 @@ Supported Auto–Attributes
   set (based on which validator is used). This allows for browser based
   validation of the values.
 
+- *pattern*
+
+  If the _Regexp_ validator is used, its regular expression is translated to
+  the `pattern` attribute, so browsers can check the value. Expressions
+  that can't be translated faithfully are skipped.
+
 - *title*
 
   If no _title_ is provided for a field, the _description_ (if one is set) is
   used for the `title` attribute.
 
+More validators can be mapped to attributes with :func:`register_validator`.
+
 
 An Example
 ----------
@@ -95,10 +103,38 @@ False
 
 """
 
+import gc
+import hashlib
+import importlib
+import json
+import marshal
+import re
+import sys
+import threading
+from collections.abc import Mapping
+from contextlib import contextmanager
+from functools import lru_cache
+from time import perf_counter_ns
+from types import ModuleType
+
+from wtforms import Form
+from wtforms.fields import Field
+from wtforms.fields import FieldList
+from wtforms.fields import FormField
 from wtforms.fields.core import UnboundField
+from wtforms.form import BaseForm
 from wtforms.meta import DefaultMeta
 from wtforms.validators import Length
 from wtforms.validators import NumberRange
+from wtforms.validators import Regexp
+
+from wtforms_html5._widgets import _CHOICE_CACHE
+from wtforms_html5._widgets import CHOICE_CACHE_SIZE as CHOICE_CACHE_SIZE
+from wtforms_html5._widgets import DYNAMIC_KEYS as DYNAMIC_KEYS
+from wtforms_html5._widgets import FRAGMENT_CACHE_SIZE as FRAGMENT_CACHE_SIZE
+from wtforms_html5._widgets import render_choices
+from wtforms_html5._widgets import render_input
+from wtforms_html5.pattern import translate_pattern
 
 __version__ = "0.6.1"
 __author__ = "Brutus [DMC] <brutus.dmc@googlemail.com>"
@@ -112,6 +148,26 @@ MINMAX_VALIDATORS = (NumberRange,)
 
 MINMAXLENGTH_VALIDATORS = (Length,)
 
+PATTERN_VALIDATORS = (Regexp,)
+
+VALIDATOR_EXTRACTORS = {}
+
+EXTRACTOR_CACHE_SIZE = 1024
+
+_EMPTY = {}
+
+_KEYSETS = {}
+
+_PLAN_LOCK = threading.RLock()
+
+_synced_tuples = ((), (), ())
+
+_registry_version = 0
+
+_profiler = None
+
+_LIST_INDEX = re.compile(r"-\d+(?=-|$)")
+
 
 def set_required(field, render_kw=None, force=False):
     """
@@ -230,6 +286,519 @@ def set_title(field, render_kw=None):
     return render_kw
 
 
+def minmax_attrs(validator, field):
+    """
+    Returns *min* and *max* for a validator like `NumberRange`.
+
+    """
+    attrs = {}
+    v_min = getattr(validator, "min", -1)
+    if v_min not in (-1, None):
+        attrs["min"] = v_min
+    v_max = getattr(validator, "max", -1)
+    if v_max not in (-1, None):
+        attrs["max"] = v_max
+    return attrs
+
+
+def minmaxlength_attrs(validator, field):
+    """
+    Returns *minlength* and *maxlength* for a validator like `Length`.
+
+    """
+    attrs = {}
+    v_min = getattr(validator, "min", -1)
+    if v_min not in (-1, None):
+        attrs["minlength"] = v_min
+    v_max = getattr(validator, "max", -1)
+    if v_max not in (-1, None):
+        attrs["maxlength"] = v_max
+    return attrs
+
+
+def pattern_attrs(validator, field):
+    """
+    Returns *pattern* for a validator like `Regexp`.
+
+    The `regex` of the validator is translated with
+    :func:`wtforms_html5.pattern.translate_pattern`; no attribute is set if
+    it can't be translated.
+
+    """
+    regex = getattr(validator, "regex", None)
+    if regex is None:
+        return None
+    pattern = translate_pattern(regex.pattern, regex.flags)
+    if pattern is None:
+        return None
+    return {"pattern": pattern}
+
+
+def register_validator(validator_class, extractor=None):
+    """
+    Registers an *extractor* for the attributes of *validator_class*.
+
+    The *extractor* is called with a validator instance and the bound field
+    and returns a dictionary with the attributes for the field (or `None`).
+    It also applies to subclasses of *validator_class*, unless they got an
+    extractor of their own.
+
+    Can be used as decorator, if no *extractor* is given:
+
+    >>> from wtforms.validators import AnyOf
+    >>> @register_validator(AnyOf)
+    ... def anyof_attrs(validator, field):
+    ...     return {"data_values": " ".join(validator.values)}
+    >>> unregister_validator(AnyOf)
+
+    """
+    if extractor is None:
+
+        def decorator(extractor):
+            register_validator(validator_class, extractor)
+            return extractor
+
+        return decorator
+    global _registry_version
+    VALIDATOR_EXTRACTORS[validator_class] = extractor
+    get_extractor.cache_clear()
+    _registry_version += 1
+    return extractor
+
+
+def unregister_validator(validator_class):
+    """
+    Removes the extractor registered for *validator_class*.
+
+    """
+    global _registry_version
+    VALIDATOR_EXTRACTORS.pop(validator_class, None)
+    get_extractor.cache_clear()
+    _registry_version += 1
+
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def get_extractor(validator_class):
+    """
+    Returns the extractor for *validator_class* (or `None`).
+
+    Looks for the exact type first and falls back to the classes in its MRO.
+    The result is cached in a LRU cache, so validator classes created at
+    runtime don't pile up in it.
+
+    """
+    for cls in validator_class.__mro__:
+        extractor = VALIDATOR_EXTRACTORS.get(cls)
+        if extractor is not None:
+            return extractor
+    return None
+
+
+def get_validator_attrs(field):
+    """
+    Returns the attributes of all registered validators of *field*.
+
+    Walks the validators of the field once. If more than one validator sets
+    the same attribute, the first one wins.
+
+    """
+    _sync_validator_tuples()
+    attrs = {}
+    for validator in field.validators:
+        extractor = get_extractor(type(validator))
+        if extractor is None:
+            continue
+        for key, value in (extractor(validator, field) or {}).items():
+            attrs.setdefault(key, value)
+    return attrs
+
+
+def _sync_validator_tuples():
+    """
+    Registers the classes of the `*_VALIDATORS` tuples with their extractors.
+
+    The tuples are checked each time attributes are computed, so replacing
+    one (e.g. `MINMAX_VALIDATORS = (NumberRange, MyRange)`) is the same as
+    registering the added classes (and unregistering the removed ones) with
+    :func:`register_validator`.
+
+    """
+    global _synced_tuples
+    synced = _synced_tuples
+    if (
+        MINMAX_VALIDATORS is synced[0]
+        and MINMAXLENGTH_VALIDATORS is synced[1]
+        and PATTERN_VALIDATORS is synced[2]
+    ):
+        return
+    with _PLAN_LOCK:
+        tuples = (MINMAX_VALIDATORS, MINMAXLENGTH_VALIDATORS, PATTERN_VALIDATORS)
+        extractors = (minmax_attrs, minmaxlength_attrs, pattern_attrs)
+        for classes, previous, extractor in zip(tuples, _synced_tuples, extractors):
+            if classes is previous:
+                continue
+            for cls in previous:
+                if cls not in classes and VALIDATOR_EXTRACTORS.get(cls) is extractor:
+                    unregister_validator(cls)
+            for cls in classes:
+                if cls not in previous:
+                    register_validator(cls, extractor)
+        _synced_tuples = tuples
+
+
+_sync_validator_tuples()
+
+
+class AttrPlan(Mapping):
+    """
+    A compact, read–only mapping of attribute names to values.
+
+    Plans are kept for every field of every form class, so they are stored
+    as two tuples (names and values) in a `__slots__` object, instead of a
+    dictionary. The attribute names are interned and plans with the same
+    names share one tuple of names. Use :meth:`as_dict` to get the widget
+    keywords at render time.
+
+    The *fingerprint* records what the plan was computed from (see
+    :func:`get_field_fingerprint`); it's not part of the mapping.
+
+    >>> plan = AttrPlan({"required": True, "maxlength": 12})
+    >>> plan["maxlength"]
+    12
+    >>> plan.as_dict()
+    {'required': True, 'maxlength': 12}
+
+    """
+
+    __slots__ = ("_keys", "_values", "fingerprint")
+
+    def __init__(self, attrs=None, fingerprint=None):
+        attrs = attrs or {}
+        keys = tuple(sys.intern(key) for key in attrs)
+        object.__setattr__(self, "_keys", _KEYSETS.setdefault(keys, keys))
+        object.__setattr__(self, "_values", tuple(attrs.values()))
+        object.__setattr__(self, "fingerprint", fingerprint)
+
+    def __setattr__(self, name, value):
+        msg = f"'{type(self).__name__}' objects are read-only"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name):
+        msg = f"'{type(self).__name__}' objects are read-only"
+        raise AttributeError(msg)
+
+    def __getitem__(self, key):
+        try:
+            return self._values[self._keys.index(key)]
+        except ValueError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __hash__(self):
+        return hash(frozenset(zip(self._keys, self._values)))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+    def pairs(self):
+        """
+        Returns an iterator over the `(name, value)` pairs of the plan.
+
+        """
+        return zip(self._keys, self._values)
+
+    def as_dict(self):
+        """
+        Returns the plan as new dictionary (e.g. for widget keywords).
+
+        """
+        return dict(zip(self._keys, self._values))
+
+
+def get_field_fingerprint(field):
+    """
+    Returns the fingerprint of what the plan of a bound *field* depends on.
+
+    That's the field's list of validators (and its length), its
+    *description*, its `required` flag and the version of the registered
+    extractors (see :func:`register_validator`). It's checked when a field
+    is bound and on each render (in constant time), so the validators and
+    the description of a field can be replaced or appended to, even on a
+    bound field (e.g. for one request). Changes made to a validator itself
+    (like `validator.max = 5`) aren't detected; use :func:`invalidate` for
+    them.
+
+    """
+    validators = field.validators
+    return (
+        validators,
+        len(validators),
+        field.description,
+        bool(field.flags.required),
+        _registry_version,
+    )
+
+
+def is_plan_current(plan, field):
+    """
+    Returns if *plan* still matches the bound *field*.
+
+    Plans without a fingerprint are always current. The validators and the
+    description are compared by identity, so lazy strings aren't resolved
+    and the validators aren't copied.
+
+    """
+    fingerprint = plan.fingerprint
+    if fingerprint is None:
+        return True
+    validators = field.validators
+    return (
+        fingerprint[0] is validators
+        and fingerprint[1] == len(validators)
+        and fingerprint[2] is field.description
+        and fingerprint[3] == bool(field.flags.required)
+        and fingerprint[4] == _registry_version
+    )
+
+
+def get_html5_plan(field):
+    """
+    Returns the *static* auto–attributes for a bound *field*.
+
+    The plan holds everything that only depends on the field's definition
+    (i.e. *required*, *min* / *max*, *minlength* / *maxlength* and *title*),
+    but nothing that changes between renders, like the *invalid* class.
+
+    :class:`AutoAttrMeta` computes the plan once for each field of a form
+    class and reuses it for every form instance.
+
+    .. note::
+
+        A *description* that isn't a plain string (e.g. a lazy translation)
+        is not added to the plan, so it is still resolved on every render.
+
+    """
+    _sync_validator_tuples()
+    profiler = _profiler
+    if profiler is not None:
+        return profiler.call(field, "get_html5_plan", _profiled_plan, profiler, field)
+    attrs = {}
+    set_required(field, attrs)
+    for key, value in get_validator_attrs(field).items():
+        attrs.setdefault(key, value)
+    if isinstance(field.description, str):
+        set_title(field, attrs)
+    return AttrPlan(attrs, get_field_fingerprint(field))
+
+
+def _profiled_plan(profiler, field):
+    """
+    Returns the plan for *field*, like :func:`get_html5_plan` does, but
+    records the time of each step in *profiler*.
+
+    """
+    attrs = {}
+    profiler.call(field, "set_required", set_required, field, attrs)
+    for validator in field.validators:
+        extractor = get_extractor(type(validator))
+        if extractor is None:
+            continue
+        name = getattr(extractor, "__name__", "extractor")
+        extracted = profiler.call(field, name, extractor, validator, field)
+        for key, value in (extracted or {}).items():
+            attrs.setdefault(key, value)
+    if isinstance(field.description, str):
+        profiler.call(field, "set_title", set_title, field, attrs)
+    return AttrPlan(attrs, get_field_fingerprint(field))
+
+
+def apply_html5_plan(plan, field, render_kw=None, force=False, field_kw=None):
+    """
+    Returns a copy of *render_kw* with the keys from an :class:`AttrPlan`
+    added.
+
+    Keys already in *render_kw* are kept, unless *force* is used. The dynamic
+    parts (i.e. the *invalid* class and a *title* from a non–string
+    *description*) are handled too.
+
+    If given, *field_kw* (the render keywords set on the field) is layered
+    between *plan* and *render_kw*. All layers are merged into one new
+    dictionary, which is the only one created here.
+
+    """
+    kwargs = _merge_html5_plan(plan, render_kw, force, field_kw)
+    set_invalid(field, kwargs)
+    set_title(field, kwargs)
+    return kwargs
+
+
+def _merge_html5_plan(plan, render_kw, force, field_kw):
+    """
+    Returns the merged layers of :func:`apply_html5_plan` (without the
+    dynamic parts).
+
+    """
+    field_kw = field_kw or _EMPTY
+    render_kw = render_kw or _EMPTY
+    if force:
+        kwargs = {**field_kw, **render_kw}
+        kwargs.update(plan.pairs())
+        if "title" in plan:
+            if "title" in render_kw:
+                kwargs["title"] = render_kw["title"]
+            elif "title" in field_kw:
+                kwargs["title"] = field_kw["title"]
+    else:
+        kwargs = plan.as_dict()
+        kwargs.update(field_kw)
+        kwargs.update(render_kw)
+    return kwargs
+
+
+def compile_render_kw(plan, field):
+    """
+    Returns a function computing the final render keywords for *field*.
+
+    The function is generated for *plan* and does the same as
+    :func:`apply_html5_plan` (without *force*), when it's called with the
+    field and the *render_kw* of a render call. But the attributes of the
+    plan are constants in its code and only the checks needed for this
+    field are left: fields with an empty plan only get the *invalid* class
+    (if they have errors) and the *title* is only set dynamically if the
+    *description* of *field* isn't a plain string.
+
+    The fingerprint of the plan is checked by identity, too (only the
+    version of the extractors is left to the check on bind). If a field
+    doesn't match it anymore (see :func:`get_field_fingerprint`), the
+    function falls back to computing the keywords from the field.
+
+    >>> from wtforms import Form, StringField
+    >>> from wtforms.validators import Length
+    >>> class MyForm(Form):
+    ...   name = StringField(validators=[Length(max=12)])
+    >>> name = MyForm().name
+    >>> func = compile_render_kw(get_html5_plan(name), name)
+    >>> func(name, {"class_": "x"})
+    {'maxlength': 12, 'class_': 'x'}
+
+    """
+    namespace = {
+        "fallback": _render_kw_fallback,
+        "set_invalid": set_invalid,
+        "set_title": set_title,
+    }
+    lines = ["def render_kw(field, render_kw):"]
+    if plan.fingerprint is not None:
+        (
+            namespace["validators"],
+            length,
+            namespace["description"],
+            required,
+            _version,
+        ) = plan.fingerprint
+        lines += [
+            "    if (",
+            "        field.validators is not validators",
+            f"        or len(validators) != {length}",
+            "        or field.description is not description",
+            f"        or {'not ' if required else ''}field.flags.required",
+            "    ):",
+            "        return fallback(field, render_kw)",
+        ]
+    items = []
+    for i, (key, value) in enumerate(plan.pairs()):
+        namespace[f"value_{i}"] = value
+        items.append(f"{key!r}: value_{i}")
+    lines += [
+        f"    kwargs = {{{', '.join(items)}}}",
+        "    field_kw = getattr(field, 'render_kw', None)",
+        "    if field_kw:",
+        "        kwargs.update(field_kw)",
+        "    if render_kw:",
+        "        kwargs.update(render_kw)",
+        "    if field.errors:",
+        "        set_invalid(field, kwargs)",
+    ]
+    if not isinstance(field.description, str):
+        lines.append("    set_title(field, kwargs)")
+    lines.append("    return kwargs")
+    code = compile("\n".join(lines), f"<html5 render_kw: {field.name}>", "exec")
+    # the code only holds the reprs of the plan's keys, all values are
+    # passed in `namespace`
+    exec(code, namespace)  # noqa: S102
+    return namespace["render_kw"]
+
+
+def _render_kw_fallback(field, render_kw):
+    """
+    Returns the final render keywords for *field* (without generated code).
+
+    """
+    field_kw = getattr(field, "render_kw", None)
+    plan = getattr(field, "_html5_plan", None)
+    if plan is None or not is_plan_current(plan, field):
+        if field_kw:
+            render_kw = {**field_kw, **render_kw} if render_kw else field_kw
+        return _get_field_kwargs(field, render_kw)
+    return apply_html5_plan(plan, field, render_kw, field_kw=field_kw)
+
+
+def _get_field_kwargs(field, render_kw=None, force=False):
+    """
+    Returns the final render keywords for a *field* without a cached plan.
+
+    Computes the attributes straight into a copy of *render_kw*, without
+    creating a plan that would be thrown away after the call. If more than
+    one validator sets the same attribute, the first one wins, unless
+    *force* is used: then the last one does (like the `set_*` functions).
+
+    """
+    _sync_validator_tuples()
+    kwargs = dict(render_kw) if render_kw else {}
+    set_required(field, kwargs, force)
+    if field.errors:
+        set_invalid(field, kwargs)
+    for validator in field.validators:
+        # exact types are looked up first, like `get_extractor` does
+        cls = type(validator)
+        extractor = VALIDATOR_EXTRACTORS.get(cls) or get_extractor(cls)
+        if extractor is None:
+            continue
+        attrs = extractor(validator, field)
+        if not attrs:
+            continue
+        if force:
+            kwargs.update(attrs)
+        else:
+            for key, value in attrs.items():
+                if key not in kwargs:
+                    kwargs[key] = value
+    set_title(field, kwargs)
+    return kwargs
+
+
+def get_current_plan(field):
+    """
+    Returns the plan cached for the bound *field* or computes a new one.
+
+    A new plan is computed (but not cached) if the field has no plan or
+    doesn't match its cached one anymore (see :func:`is_plan_current`).
+
+    """
+    plan = getattr(field, "_html5_plan", None)
+    if plan is None or not is_plan_current(plan, field):
+        plan = get_html5_plan(field)
+    return plan
+
+
 def get_html5_kwargs(field, render_kw=None, force=False):
     """
     Returns a copy of *render_kw*  with keys added for a bound *field*.
@@ -243,6 +812,9 @@ def get_html5_kwargs(field, render_kw=None, force=False):
         This might add new keys but won't changes any values if a key is
         already in *render_kw*,  unless *force* is used.
 
+    If more than one validator sets the same key, the first one wins, or
+    the last one if *force* is used.
+
     Raises:
 
         ValueError: if *field* is an :cls:`UnboundField`.
@@ -271,13 +843,694 @@ def get_html5_kwargs(field, render_kw=None, force=False):
     if isinstance(field, UnboundField):
         msg = f"This function needs a bound field, not: '{field}'"
         raise ValueError(msg)
-    kwargs = render_kw.copy() if render_kw else {}
-    kwargs = set_required(field, kwargs, force)
-    kwargs = set_invalid(field, kwargs)
-    kwargs = set_minmax(field, kwargs, force)
-    kwargs = set_minmaxlength(field, kwargs, force)
-    kwargs = set_title(field, kwargs)
-    return kwargs
+    plan = getattr(field, "_html5_plan", None)
+    if plan is None or force or not is_plan_current(plan, field):
+        return _get_field_kwargs(field, render_kw, force)
+    return apply_html5_plan(plan, field, render_kw)
+
+
+def get_form_html5_kwargs(form, render_kw=None, force=False):
+    """
+    Returns a dictionary with the render keywords for each field of *form*.
+
+    This is the same as calling :func:`get_html5_kwargs` for each field, but
+    done in one pass. *render_kw* is an optional mapping of field names to
+    the render keywords of that field.
+
+    For forms using :class:`AutoAttrMeta` the plans computed for the form
+    class are shared, so only the dynamic keys are computed here.
+
+    """
+    render_kw = render_kw or {}
+    return {
+        name: get_html5_kwargs(field, render_kw.get(name), force)
+        for name, field in form._fields.items()
+    }
+
+
+class RenderStats:
+    """
+    Collects counters and timings for fields rendered by :cls:`AutoAttrMeta`.
+
+    Set an instance as `html5_stats` option on your `Meta` class to use it:
+
+    >>> from wtforms import Form, StringField
+    >>> stats = RenderStats()
+    >>> class StatsForm(Form):
+    ...   class Meta(AutoAttrMeta):
+    ...     html5_stats = stats
+    ...   name = StringField()
+    >>> html = StatsForm().name()
+    >>> stats.snapshot()["forms"]["StatsForm"]["name"]["renders"]
+    1
+
+    For each form class and field it counts the renders and sums up the time
+    (in nanoseconds) spent on computing the attributes (`attrs_ns`) and on
+    the widget (`widget_ns`). The entries of a `FieldList` are counted
+    together (i.e. `items-0` and `items-1` as `items-*`). It also counts
+    hits and misses of the plan and fragment caches.
+
+    Subclass it and extend :meth:`record_render` or :meth:`record_plan` to
+    feed other metric systems.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Removes all collected data.
+
+        """
+        with self._lock:
+            self.forms = {}
+            self.caches = {
+                "plan": {"hits": 0, "misses": 0},
+                "fragment": {"hits": 0, "misses": 0},
+            }
+
+    def record_plan(self, hit):
+        """
+        Counts a lookup of the plan cache.
+
+        """
+        with self._lock:
+            self.caches["plan"]["hits" if hit else "misses"] += 1
+
+    def record_render(self, form_name, field_name, attrs_ns, widget_ns, fragment):
+        """
+        Counts a render of *field_name* in *form_name*.
+
+        *fragment* is `None` if the fragment cache wasn't used, else `True`
+        on a cache hit and `False` on a miss.
+
+        """
+        field_name = _LIST_INDEX.sub("-*", field_name)
+        with self._lock:
+            fields = self.forms.setdefault(form_name, {})
+            counter = fields.get(field_name)
+            if counter is None:
+                counter = fields[field_name] = {
+                    "renders": 0,
+                    "attrs_ns": 0,
+                    "widget_ns": 0,
+                }
+            counter["renders"] += 1
+            counter["attrs_ns"] += attrs_ns
+            counter["widget_ns"] += widget_ns
+            if fragment is not None:
+                self.caches["fragment"]["hits" if fragment else "misses"] += 1
+
+    def snapshot(self):
+        """
+        Returns a copy of the collected data.
+
+        """
+        with self._lock:
+            return {
+                "forms": {
+                    form: {field: dict(counter) for field, counter in fields.items()}
+                    for form, fields in self.forms.items()
+                },
+                "caches": {name: dict(cache) for name, cache in self.caches.items()},
+            }
+
+
+class RenderProfile:
+    """
+    Collects the time spent in each stage of rendering fields.
+
+    Use it with :func:`profile`. Each call of a stage is recorded with its
+    call stack, as a frame of *form class*, *field* and *stage*. The stages
+    are:
+
+    - `render_field`: the whole :meth:`AutoAttrMeta.render_field` call,
+    - `get_plan`: looking up (and checking) the plan of the field,
+    - `get_html5_plan`: computing a missing plan (usually when a form class is
+      used for the first time), with the steps `set_required`, one for each
+      validator extractor (e.g. `minmax_attrs` and `minmaxlength_attrs`, the
+      counterparts of `set_minmax` and `set_minmaxlength`) and `set_title`,
+    - `merge`: merging the plan with the render keywords (or
+      `get_render_kw`, if a `Meta` class overrides it),
+    - `set_invalid` and `set_title`: the dynamic attributes,
+    - `widget`: calling the field's widget.
+
+    Fields rendered inside of a widget (e.g. the fields of a `FormField`)
+    are recorded below its `widget` frame. The entries of a `FieldList` are
+    counted together (i.e. `items-0` and `items-1` as `items-*`). All times
+    are in nanoseconds.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        """
+        Removes all collected data.
+
+        """
+        with self._lock:
+            self.records = {}
+
+    def call(self, field, stage, func, *args):
+        """
+        Returns `func(*args)` and records its time as *stage* of *field*.
+
+        """
+        stack = self._local.__dict__.setdefault("stack", [])
+        form_name = getattr(field.meta, "html5_form_name", None) or "<form>"
+        frame = (form_name, _LIST_INDEX.sub("-*", field.name), stage)
+        path = (*stack[-1], frame) if stack else (frame,)
+        stack.append(path)
+        start = perf_counter_ns()
+        try:
+            return func(*args)
+        finally:
+            elapsed = perf_counter_ns() - start
+            stack.pop()
+            with self._lock:
+                record = self.records.get(path)
+                if record is None:
+                    record = self.records[path] = [0, 0]
+                record[0] += 1
+                record[1] += elapsed
+
+    def _iter_records(self):
+        """
+        Yields the `(path, calls, total_ns, own_ns)` of all recorded frames.
+
+        """
+        with self._lock:
+            records = {path: tuple(record) for path, record in self.records.items()}
+        children = {}
+        for path, (_calls, total) in records.items():
+            if len(path) > 1:
+                children[path[:-1]] = children.get(path[:-1], 0) + total
+        for path, (calls, total) in records.items():
+            yield path, calls, total, max(total - children.get(path, 0), 0)
+
+    def snapshot(self):
+        """
+        Returns the collected data per form class, field and stage.
+
+        Each stage has the number of `calls`, the time spent in the stage
+        itself (`ns`) and including the stages it called (`total_ns`).
+
+        """
+        forms = {}
+        for path, calls, total, own in self._iter_records():
+            form_name, field_name, stage = path[-1]
+            fields = forms.setdefault(form_name, {})
+            counter = fields.setdefault(field_name, {}).get(stage)
+            if counter is None:
+                counter = fields[field_name][stage] = {
+                    "calls": 0,
+                    "ns": 0,
+                    "total_ns": 0,
+                }
+            counter["calls"] += calls
+            counter["ns"] += own
+            counter["total_ns"] += total
+        return forms
+
+    def create_stats(self):
+        """
+        Sets `stats` to the collected data in the format of :mod:`pstats`.
+
+        Like :class:`cProfile.Profile`, so `pstats.Stats(profile)` works. The
+        stages are the functions, named `Form.field:0(stage)`. Times are in
+        seconds.
+
+        """
+        stats = {}
+        for path, calls, total, own in self._iter_records():
+            own, total = own / 1e9, total / 1e9
+            func = _pstats_key(path[-1])
+            cc, nc, tt, ct, callers = stats.get(func) or (0, 0, 0.0, 0.0, {})
+            stats[func] = (cc + calls, nc + calls, tt + own, ct + total, callers)
+            if len(path) > 1:
+                caller = _pstats_key(path[-2])
+                nc, cc, tt, ct = callers.get(caller) or (0, 0, 0.0, 0.0)
+                callers[caller] = (nc + calls, cc + calls, tt + own, ct + total)
+        self.stats = stats
+
+    def dump_stats(self, filename):
+        """
+        Writes the :mod:`pstats` data to *filename* (like
+        :meth:`cProfile.Profile.dump_stats`).
+
+        """
+        self.create_stats()
+        with open(filename, "wb") as fh:
+            marshal.dump(self.stats, fh)
+
+    def collapsed(self):
+        """
+        Returns the collected data as collapsed stacks (for flame graphs).
+
+        Each line is a stack of `;` separated frames (form class, field and
+        stages), followed by the time spent in its last stage itself, e.g.
+        `MyForm;name;render_field;widget 1200`.
+
+        """
+        lines = []
+        for path, _calls, _total, own in sorted(self._iter_records()):
+            if own <= 0:
+                continue
+            names = []
+            owner = None
+            for form_name, field_name, stage in path:
+                if (form_name, field_name) != owner:
+                    owner = (form_name, field_name)
+                    names.extend(owner)
+                names.append(stage)
+            lines.append(f"{';'.join(names)} {own}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _pstats_key(frame):
+    """
+    Returns the :mod:`pstats` function key for a profile *frame*.
+
+    """
+    form_name, field_name, stage = frame
+    return (f"{form_name}.{field_name}", 0, stage)
+
+
+@contextmanager
+def profile(profiler=None):
+    """
+    Records the time spent in each render stage inside of the `with` block.
+
+    Yields the :class:`RenderProfile` (a new one, if no *profiler* is given)
+    collecting the data of all fields rendered with
+    :meth:`AutoAttrMeta.render_field` (in any thread), until the block is
+    left:
+
+    >>> from wtforms import Form, StringField
+    >>> class ProfiledForm(Form):
+    ...   class Meta(AutoAttrMeta):
+    ...     pass
+    ...   name = StringField(description="Name")
+    >>> with profile() as prof:
+    ...   html = ProfiledForm().name()
+    >>> prof.snapshot()["ProfiledForm"]["name"]["widget"]["calls"]
+    1
+
+    Blocks can be nested; the inner one collects the data until it's left.
+    When no block is active, the only cost is checking a global variable.
+
+    """
+    global _profiler
+    if profiler is None:
+        profiler = RenderProfile()
+    previous = _profiler
+    _profiler = profiler
+    try:
+        yield profiler
+    finally:
+        _profiler = previous
+
+
+class PlannedUnboundField(UnboundField):
+    """
+    An :cls:`UnboundField` that attaches a shared plan to the fields it binds.
+
+    :class:`AutoAttrMeta` replaces the `unbound_field` of each bound
+    `FieldList` with one of these, so all entries of the list share the plan
+    cached for the *template* (i.e. the unbound field the list was declared
+    with), instead of computing it for each entry.
+
+    """
+
+    def __init__(self, template):
+        # no call to `super().__init__`, it would change the creation counter
+        self.__dict__.update(vars(template))
+        self.template = template
+
+    def bind(self, *args, **kwargs):
+        field = super().bind(*args, **kwargs)
+        return attach_html5_plan(self.template, field)
+
+
+def attach_html5_plan(unbound_field, field):
+    """
+    Returns *field* with the plan cached for *unbound_field* attached.
+
+    The plan is computed from *field* if none is cached yet, or if the
+    cached one doesn't match *field* anymore (e.g. because the validators of
+    *unbound_field* were changed). If *field* is a `FieldList`, its entries
+    will share the plan of the list's template.
+
+    """
+    _sync_validator_tuples()
+    plan = getattr(unbound_field, "_html5_plan", None)
+    if plan is not None and not is_plan_current(plan, field):
+        plan = None
+    stats = getattr(field.meta, "html5_stats", None)
+    if stats is not None:
+        stats.record_plan(hit=plan is not None)
+    if plan is None:
+        with _PLAN_LOCK:
+            plan = getattr(unbound_field, "_html5_plan", None)
+            if plan is None or not is_plan_current(plan, field):
+                plan = unbound_field._html5_plan = get_html5_plan(field)
+    field._html5_plan = plan
+    if getattr(field.meta, "html5_codegen", False):
+        entry = getattr(unbound_field, "_html5_codegen", None)
+        if entry is None or entry[0] is not plan:
+            with _PLAN_LOCK:
+                entry = getattr(unbound_field, "_html5_codegen", None)
+                if entry is None or entry[0] is not plan:
+                    entry = (plan, compile_render_kw(plan, field))
+                    unbound_field._html5_codegen = entry
+        field._html5_codegen = entry
+    if isinstance(field, FieldList):
+        template = field.unbound_field
+        planned = getattr(template, "_html5_planned", None)
+        if planned is None:
+            with _PLAN_LOCK:
+                planned = getattr(template, "_html5_planned", None)
+                if planned is None:
+                    planned = PlannedUnboundField(template)
+                    template._html5_planned = planned
+        field.unbound_field = planned
+    return field
+
+
+def iter_unbound_fields(form_class):
+    """
+    Returns the `(name, unbound_field)` pairs of *form_class*.
+
+    Same as the `_unbound_fields` `FormMeta` creates on the first
+    instantiation of a form class, but without creating an instance. The
+    list is stored the same way, so `FormMeta` resets it when a field is
+    added to or removed from the class (which the caches of
+    :func:`get_form_schema` and :func:`~wtforms_html5.precheck.precheck` use
+    to detect those changes).
+
+    """
+    fields = getattr(form_class, "_unbound_fields", None)
+    if fields is None:
+        fields = []
+        for name in dir(form_class):
+            if not name.startswith("_"):
+                unbound_field = getattr(form_class, name)
+                if isinstance(unbound_field, UnboundField):
+                    fields.append((name, unbound_field))
+        fields.sort(key=lambda x: (x[1].creation_counter, x[0]))
+        if "_unbound_fields" in form_class.__dict__:
+            form_class._unbound_fields = fields
+    return fields
+
+
+def get_meta_class(form_class):
+    """
+    Returns the combined `Meta` class of *form_class* (like `FormMeta`).
+
+    """
+    meta_class = getattr(form_class, "_wtforms_meta", None)
+    if meta_class is None:
+        bases = [
+            mro_class.Meta
+            for mro_class in form_class.__mro__
+            if "Meta" in mro_class.__dict__
+        ]
+        meta_class = type("Meta", tuple(bases), {})
+    return meta_class
+
+
+def _warmup_field(unbound_field, name, meta, seen):
+    """
+    Computes the plans for *unbound_field* and the fields nested in it.
+
+    """
+    field = unbound_field.bind(form=None, name=name, _meta=meta)
+    attach_html5_plan(unbound_field, field)
+    if isinstance(field, FieldList):
+        _warmup_field(field.unbound_field.template, f"{name}-0", meta, seen)
+    form_class = getattr(field, "form_class", None)
+    if isinstance(form_class, type):
+        _warmup_form(form_class, seen)
+
+
+def _warmup_form(form_class, seen):
+    """
+    Computes the plans for all fields of *form_class*, if it uses
+    :class:`AutoAttrMeta`.
+
+    """
+    if form_class in seen:
+        return
+    seen.add(form_class)
+    meta_class = get_meta_class(form_class)
+    if not issubclass(meta_class, AutoAttrMeta):
+        return
+    meta = meta_class()
+    for name, unbound_field in iter_unbound_fields(form_class):
+        _warmup_field(unbound_field, name, meta, seen)
+
+
+def warmup(targets, freeze=False):
+    """
+    Precomputes the attribute plans for forms and returns the form classes.
+
+    *targets* is an iterable of form classes and / or modules (or importable
+    module names). All `Form` subclasses found in the modules are used. The
+    plans are computed for all fields of form classes whose `Meta` inherits
+    from :class:`AutoAttrMeta`, including the entries of `FieldList` and the
+    form classes of `FormField` fields.
+
+    Call it in the master process of a pre–forking server (e.g. when
+    gunicorn preloads your app), so the workers don't pay for it on their
+    first renders. If *freeze* is set, :func:`gc.freeze` is called after the
+    plans are computed: the garbage collector then leaves all existing
+    objects alone (for the rest of the process), so the workers share their
+    memory copy–on–write. Only set it if this is the last thing done before
+    forking, or call :func:`gc.freeze` yourself right before that.
+
+    """
+    if isinstance(targets, (str, ModuleType, type)):
+        targets = [targets]
+    form_classes = []
+    for target in targets:
+        if isinstance(target, str):
+            target = importlib.import_module(target)
+        if isinstance(target, ModuleType):
+            form_classes.extend(
+                obj
+                for obj in vars(target).values()
+                if isinstance(obj, type) and issubclass(obj, Form)
+            )
+        else:
+            form_classes.append(target)
+    seen = set()
+    for form_class in form_classes:
+        _warmup_form(form_class, seen)
+    if freeze:
+        gc.freeze()
+    return [
+        form_class
+        for form_class in dict.fromkeys(form_classes)
+        if issubclass(get_meta_class(form_class), AutoAttrMeta)
+    ]
+
+
+def _schema_value(value):
+    """
+    Returns *value* as a JSON value (numbers, strings and booleans are kept).
+
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def _build_field_schema(unbound_field, name, meta):
+    """
+    Returns the schema of a single field (see :func:`get_form_schema`).
+
+    """
+    field = unbound_field.bind(form=None, name=name, _meta=meta)
+    plan = getattr(unbound_field, "_html5_plan", None)
+    if plan is None or not is_plan_current(plan, field):
+        plan = get_html5_plan(field)
+    schema = {key: _schema_value(value) for key, value in plan.pairs()}
+    if isinstance(field, FieldList):
+        schema["min_entries"] = field.min_entries
+        schema["max_entries"] = field.max_entries
+        schema["entry"] = _build_field_schema(field.unbound_field, f"{name}-0", meta)
+    form_class = getattr(field, "form_class", None)
+    if isinstance(form_class, type):
+        schema["fields"] = _build_form_schema(form_class)
+    return schema
+
+
+def _build_form_schema(form_class):
+    """
+    Returns the field schemas of *form_class* (see :func:`get_form_schema`).
+
+    """
+    meta = get_meta_class(form_class)()
+    return {
+        name: _build_field_schema(unbound_field, name, meta)
+        for name, unbound_field in iter_unbound_fields(form_class)
+    }
+
+
+def _get_schema_entry(form_class):
+    """
+    Returns the cached `(schema, json, etag)` of *form_class*.
+
+    The entry is rebuilt if the fields of the class changed since.
+
+    """
+    if not isinstance(form_class, type):
+        form_class = type(form_class)
+    fields = iter_unbound_fields(form_class)
+    entry = form_class.__dict__.get("_html5_schema")
+    if entry is None or entry[3] is not fields:
+        with _PLAN_LOCK:
+            entry = form_class.__dict__.get("_html5_schema")
+            if entry is None or entry[3] is not fields:
+                schema = {"fields": _build_form_schema(form_class)}
+                text = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+                digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+                entry = (schema, text, f'"{digest[:32]}"', fields)
+                form_class._html5_schema = entry
+    return entry
+
+
+def get_form_schema(form_class):
+    """
+    Returns the HTML5 constraints of *form_class* as a JSON–serializable dict.
+
+    The schema maps each field name (below `"fields"`) to the static
+    auto–attributes of the field (i.e. `required`, `min` / `max`,
+    `minlength` / `maxlength`, `title` and the keys of registered
+    validators). A `FieldList` also has `min_entries`, `max_entries` and the
+    schema of its `entry`; a `FormField` has the `fields` of its form class.
+    Titles from lazy (non–`str`) descriptions are not included.
+
+    The schema is computed once per form class and cached; don't change it.
+    It's rebuilt if fields are added to or removed from the class; call
+    :func:`invalidate` with the class after changing its fields otherwise.
+
+    >>> from wtforms import Form, StringField
+    >>> from wtforms.validators import InputRequired, Length
+    >>> class MyForm(Form):
+    ...   name = StringField(validators=[InputRequired(), Length(max=12)])
+    >>> get_form_schema(MyForm)
+    {'fields': {'name': {'required': True, 'maxlength': 12}}}
+
+    """
+    return _get_schema_entry(form_class)[0]
+
+
+def get_form_schema_json(form_class):
+    """
+    Returns the schema of *form_class* as canonical (sorted, compact) JSON.
+
+    """
+    return _get_schema_entry(form_class)[1]
+
+
+def get_form_schema_etag(form_class):
+    """
+    Returns a strong HTTP `ETag` for the schema of *form_class*.
+
+    The tag is a hash of :func:`get_form_schema_json`, so it's the same in
+    all processes and only changes if the constraints change.
+
+    """
+    return _get_schema_entry(form_class)[2]
+
+
+def _invalidate_unbound_field(unbound_field):
+    """
+    Drops the plans cached for *unbound_field* (and a `FieldList` template).
+
+    """
+    unbound_field.__dict__.pop("_html5_plan", None)
+    unbound_field.__dict__.pop("_html5_planned", None)
+    unbound_field.__dict__.pop("_html5_codegen", None)
+    if issubclass(unbound_field.field_class, FieldList):
+        args, kwargs = unbound_field.args, unbound_field.kwargs
+        template = args[0] if args else kwargs.get("unbound_field")
+        if isinstance(template, UnboundField):
+            _invalidate_unbound_field(template)
+
+
+def _invalidate_field(field):
+    """
+    Recomputes the plan of a bound *field* (and of the fields nested in it).
+
+    """
+    if "_html5_plan" in vars(field):
+        field._html5_plan = get_html5_plan(field)
+    vars(field).pop("_html5_codegen", None)
+    if isinstance(field, FieldList):
+        for entry in field.entries:
+            _invalidate_field(entry)
+    elif isinstance(field, FormField) and getattr(field, "form", None) is not None:
+        for subfield in field.form:
+            _invalidate_field(subfield)
+
+
+def invalidate(target):
+    """
+    Drops the cached attribute data of *target* after it was changed.
+
+    *target* can be:
+
+    - a bound field or a form instance: the plans of the field (or of all
+      fields of the form) are recomputed, including `FieldList` entries
+      and the fields of `FormField` subforms. Other instances aren't
+      affected.
+    - an unbound field (i.e. a field of a form class): its cached plan is
+      dropped, so it's recomputed for the next form instance.
+    - a form class: the plans of all its fields are dropped, as are its
+      cached schema (see :func:`get_form_schema`) and precheck plan (see
+      :func:`wtforms_html5.precheck.precheck`). Form classes used by its
+      `FormField` fields are not invalidated.
+
+    Only needed for changes that aren't detected automatically: replacing
+    or appending to the validators, or changing the *description* or the
+    `required` flag of a field is (see :func:`get_field_fingerprint`), as
+    is adding or removing fields of a form class. The options cached by
+    :func:`render_choices` are dropped for all targets.
+
+    Raises:
+
+        TypeError: if *target* is none of the above.
+
+    """
+    if isinstance(target, Field):
+        _invalidate_field(target)
+    elif isinstance(target, BaseForm):
+        for field in target:
+            _invalidate_field(field)
+    elif isinstance(target, UnboundField):
+        with _PLAN_LOCK:
+            _invalidate_unbound_field(target)
+    elif isinstance(target, type):
+        with _PLAN_LOCK:
+            for _name, unbound_field in iter_unbound_fields(target):
+                _invalidate_unbound_field(unbound_field)
+            for key in ("_html5_schema", "_html5_precheck"):
+                if key in target.__dict__:
+                    delattr(target, key)
+            if "_unbound_fields" in target.__dict__:
+                target._unbound_fields = None
+    else:
+        msg = f"Can't invalidate: '{target}'"
+        raise TypeError(msg)
+    _CHOICE_CACHE.clear()
 
 
 class AutoAttrMeta(DefaultMeta):
@@ -287,8 +1540,65 @@ class AutoAttrMeta(DefaultMeta):
     It uses :func:`get_html5_kwargs` to automatically add some render
     keywords for each field's widget when it gets rendered.
 
+    The static part of those keywords (see :func:`get_html5_plan`) is
+    computed once for each field of a form class, when the field is bound
+    for the first time, and shared by all instances of the form. All entries
+    of a `FieldList` share the plan of the list's template field. The fields
+    of a `FormField` share the plans of their own form class (if it uses
+    `AutoAttrMeta` too).
+
+    It's safe to render forms from many threads: plans are read without
+    locks and are immutable once published (see :class:`AttrPlan`). Only
+    computing a missing plan takes a lock, so each plan is computed once.
+
+    Each plan keeps a fingerprint of its field (see
+    :func:`get_field_fingerprint`), which is checked on each render (in
+    constant time), so changing the validators, *description* or `required`
+    flag of a field (e.g. for one request) is followed. Use
+    :func:`invalidate` for other changes.
+    Plans are stored on the fields of the form class, so they are freed
+    with it; the caches shared by all forms (extractors, fragments and
+    choices) are bounded.
+
+    Options (set them on your `Meta` class):
+
+    :html5_fragment_cache:
+        If `True`, INPUT fields are rendered with :func:`render_input`, which
+        caches the escaped static attributes. Defaults to `False`.
+
+    :html5_choice_cache:
+        If `True`, the options of `SelectField` and `RadioField` fields
+        (and their subclasses) are rendered with :func:`render_choices`,
+        which caches them by the content of the choices. Defaults to
+        `False`.
+
+    :html5_codegen:
+        If `True`, the render keywords of each field are computed by a
+        function generated for its plan (see :func:`compile_render_kw`),
+        once per field of the form class. Defaults to `False`.
+
+    :html5_stats:
+        A :class:`RenderStats` instance collecting counters and timings for
+        each render. Defaults to `None` (no instrumentation).
+
     """
 
+    html5_fragment_cache = False
+    html5_choice_cache = False
+    html5_codegen = False
+    html5_stats = None
+    html5_form_name = None
+
+    def bind_field(self, form, unbound_field, options):
+        """
+        Returns the bound field with its (cached) attribute plan attached.
+
+        """
+        if self.html5_form_name is None:
+            self.html5_form_name = type(form).__qualname__
+        field = super().bind_field(form, unbound_field, options)
+        return attach_html5_plan(unbound_field, field)
+
     def render_field(self, field, render_kw):
         """
         Returns the rendered field after adding auto–attributes.
@@ -297,12 +1607,103 @@ class AutoAttrMeta(DefaultMeta):
 
         1. the *render_kw* set on the field are used as based
         2. and are updated with the *render_kw* arguments from the render call
-        3. this is used as an argument for a call to `get_html5_kwargs`
-        4. the return value of the call is used as final *render_kw*
+        3. the field's cached attribute plan is added (see
+           :func:`apply_html5_plan`)
+        4. the result is used as final *render_kw*
+
+        """
+        profiler = _profiler
+        if profiler is not None:
+            return profiler.call(
+                field,
+                "render_field",
+                self._render_field_profiled,
+                profiler,
+                field,
+                render_kw,
+            )
+        if self.html5_stats is not None:
+            return self._render_field_stats(field, render_kw)
+        return self.render_widget(field, self.get_render_kw(field, render_kw))
+
+    def get_render_kw(self, field, render_kw):
+        """
+        Returns the final render keywords for *field* (see
+        :meth:`render_field`).
+
+        """
+        if self.html5_codegen:
+            entry = getattr(field, "_html5_codegen", None)
+            if entry is not None:
+                return entry[1](field, render_kw)
+        return _render_kw_fallback(field, render_kw)
+
+    def render_widget(self, field, render_kw, report=None):
+        """
+        Returns the field's widget rendered with the final *render_kw*.
+
+        The *report* is passed to :func:`render_input`.
 
         """
-        field_kw = getattr(field, "render_kw", None)
-        if field_kw is not None:
-            render_kw = dict(field_kw, **render_kw)
-        render_kw = get_html5_kwargs(field, render_kw)
+        if self.html5_fragment_cache:
+            html = render_input(field.widget, field, render_kw, report)
+            if html is not None:
+                return html
+        if self.html5_choice_cache:
+            html = render_choices(field.widget, field, render_kw)
+            if html is not None:
+                return html
         return field.widget(field, **render_kw)
+
+    def _render_field_profiled(self, profiler, field, render_kw):
+        """
+        Returns the rendered field, like :meth:`render_field` does, but
+        records the time of each stage in *profiler* (see :func:`profile`).
+
+        """
+        if (
+            type(self).get_render_kw is AutoAttrMeta.get_render_kw
+            and not self.html5_codegen
+        ):
+            plan = profiler.call(field, "get_plan", get_current_plan, field)
+            field_kw = getattr(field, "render_kw", None)
+            render_kw = profiler.call(
+                field,
+                "merge",
+                _merge_html5_plan,
+                plan,
+                render_kw,
+                False,
+                field_kw,
+            )
+            profiler.call(field, "set_invalid", set_invalid, field, render_kw)
+            profiler.call(field, "set_title", set_title, field, render_kw)
+        else:
+            render_kw = profiler.call(
+                field, "get_render_kw", self.get_render_kw, field, render_kw
+            )
+        return profiler.call(field, "widget", self.render_widget, field, render_kw)
+
+    def _render_field_stats(self, field, render_kw):
+        """
+        Returns the rendered field, like :meth:`render_field` does, but
+        records counters and timings in `html5_stats`.
+
+        """
+        reports = []
+        start = perf_counter_ns()
+        render_kw = self.get_render_kw(field, render_kw)
+        middle = perf_counter_ns()
+        if type(self).render_widget is AutoAttrMeta.render_widget:
+            html = self.render_widget(field, render_kw, reports.append)
+        else:
+            html = self.render_widget(field, render_kw)
+        end = perf_counter_ns()
+        self.html5_stats.record_render(
+            self.html5_form_name or "",
+            field.name,
+            middle - start,
+            end - middle,
+            reports[0] if reports else None,
+        )
+        return html
@@ -0,0 +1,421 @@
+"""
+Renders the widgets of fields from cached markup.
+
+:func:`render_input` renders INPUT widgets from cached static attributes and
+:func:`render_choices` renders the options of `Select` and radio `ListWidget`
+widgets from cached options; both produce the same HTML as calling the
+widget. They are used by :class:`wtforms_html5.AutoAttrMeta` (if its
+`html5_fragment_cache` and `html5_choice_cache` options are set) and by the
+helpers of :mod:`wtforms_html5.render`, and are exported by
+:mod:`wtforms_html5`.
+
+"""
+
+import threading
+from bisect import bisect
+from functools import lru_cache
+
+from markupsafe import Markup
+from wtforms.fields import SelectField
+from wtforms.fields import SelectMultipleField
+from wtforms.widgets import CheckboxInput
+from wtforms.widgets import Input
+from wtforms.widgets import ListWidget
+from wtforms.widgets import NumberInput
+from wtforms.widgets import RadioInput
+from wtforms.widgets import RangeInput
+from wtforms.widgets import Select
+from wtforms.widgets import html_params
+
+FRAGMENT_CACHE_SIZE = 4096
+
+CHOICE_CACHE_SIZE = 256
+
+DYNAMIC_KEYS = ("value", "checked", "class", "class_")
+
+_EMPTY = {}
+
+_CHOICE_CACHE = {}
+
+_WIDGET_DEFAULTS = {
+    call: keys
+    for call, keys in (
+        (NumberInput.__call__, ("step", "min", "max")),
+        (RangeInput.__call__, ("step",)),
+    )
+    if call is not Input.__call__
+}
+
+_CHOICE_GENERATORS = {
+    generator: multiple
+    for generator, multiple in (
+        (getattr(SelectField, "_choices_generator", None), False),
+        (getattr(SelectMultipleField, "_choices_generator", None), True),
+    )
+    if generator is not None
+}
+
+_fragment_local = threading.local()
+
+
+def _build_fragment(items):
+    """
+    Returns the sorted keys and escaped `key="value"` parts for *items*.
+
+    """
+    keys = []
+    parts = []
+    for key, value in sorted(items):
+        if value is False:
+            continue
+        keys.append(key)
+        parts.append(html_params(**{key: value}))
+    return tuple(keys), tuple(parts)
+
+
+def _build_missing_fragment(items):
+    """
+    Returns :func:`_build_fragment` for a miss of the fragment cache, after
+    counting the miss for the current thread.
+
+    The *items* are `(key, type, value)` tuples: equal values of different
+    types (like `1`, `1.0` and `True`) are rendered differently, so their
+    types are part of the key of the cache.
+
+    """
+    _fragment_local.misses = getattr(_fragment_local, "misses", 0) + 1
+    return _build_fragment((key, value) for key, _type, value in items)
+
+
+_cached_fragment = lru_cache(maxsize=FRAGMENT_CACHE_SIZE)(_build_missing_fragment)
+
+
+def _prepare_input(widget, field, render_kw):
+    """
+    Returns the dynamic keys for an INPUT *widget* (or `None`).
+
+    The `DYNAMIC_KEYS` are popped from *render_kw*, which is completed with
+    the static keys the widget adds (`id`, `type`, the `step`, `min` and
+    `max` of number widgets, the validation flags and `name`). Returns
+    `None` if the widget isn't supported by :func:`render_input`.
+
+    """
+    call = type(widget).__call__
+    defaults = _WIDGET_DEFAULTS.get(call, ())
+    if not defaults and call not in (
+        Input.__call__,
+        CheckboxInput.__call__,
+        RadioInput.__call__,
+    ):
+        return None
+    validation_attrs = getattr(widget, "validation_attrs", None)
+    if (
+        validation_attrs is None
+        or widget.html_params is not html_params
+        or "name" in render_kw
+    ):
+        return None
+    for key in defaults:
+        value = getattr(widget, key, None)
+        if value is not None:
+            render_kw.setdefault(key, value)
+    dynamic = {key: render_kw.pop(key) for key in DYNAMIC_KEYS if key in render_kw}
+    render_kw.setdefault("id", field.id)
+    render_kw.setdefault("type", widget.input_type)
+    flags = vars(field.flags)
+    for key in validation_attrs:
+        if key in flags and key not in render_kw and key not in dynamic:
+            render_kw[key] = flags[key]
+    render_kw["name"] = field.name
+    return dynamic
+
+
+def _is_checked(widget, field):
+    """
+    Returns if the INPUT *widget* of *field* is rendered `checked`.
+
+    """
+    call = type(widget).__call__
+    if call is CheckboxInput.__call__:
+        return getattr(field, "checked", field.data)
+    if call is RadioInput.__call__:
+        return field.checked
+    return False
+
+
+def _join_input(keys, parts, dynamic):
+    """
+    Returns the INPUT tag with the escaped static *parts* (sorted by their
+    *keys*) and the *dynamic* keys inserted in order.
+
+    """
+    parts = list(parts)
+    for key in sorted(dynamic, reverse=True):
+        value = dynamic[key]
+        if value is not False:
+            parts.insert(bisect(keys, key), html_params(**{key: value}))
+    return Markup(f"<input {' '.join(parts)}>")
+
+
+def render_input(widget, field, render_kw, report=None):
+    """
+    Returns the HTML of an INPUT *widget* using cached static attributes.
+
+    Produces the same output as `widget(field, **render_kw)`, but the escaped
+    and sorted attributes that don't change between renders (everything but
+    the `DYNAMIC_KEYS`) are taken from a LRU cache. Only the dynamic
+    attributes are escaped on each call.
+
+    Returns `None` if the *widget* isn't a plain `Input`, `CheckboxInput`,
+    `RadioInput`, `NumberInput` or `RangeInput` (or a subclass not
+    overwriting their `__call__`).
+
+    If given, *report* is called with `True` for a hit of the cache and with
+    `False` for a miss (misses are counted per thread, so this is exact when
+    rendering from many threads).
+
+    ..note::
+
+        This changes *render_kw*.
+
+    """
+    dynamic = _prepare_input(widget, field, render_kw)
+    if dynamic is None:
+        return None
+    if _is_checked(widget, field):
+        dynamic["checked"] = True
+    if "value" not in dynamic:
+        dynamic["value"] = field._value()
+    items = tuple((key, type(value), value) for key, value in render_kw.items())
+    misses = getattr(_fragment_local, "misses", 0) if report is not None else 0
+    try:
+        keys, parts = _cached_fragment(items)
+    except TypeError:  # unhashable values
+        keys, parts = _build_fragment(render_kw.items())
+    else:
+        if report is not None:
+            report(getattr(_fragment_local, "misses", 0) == misses)
+    return _join_input(keys, parts, dynamic)
+
+
+def _choice_key(field, *extra):
+    """
+    Returns the key of the rendered choices of *field* (or `None`).
+
+    The key holds the content of the choices, so changing them (in place
+    or not) changes the key. It holds the types of their items too, as
+    equal values of other types (like `1` and `1.0`) are rendered
+    differently. Returns `None` if the field doesn't use the
+    stock choice methods of `SelectField` (or `SelectMultipleField`), or
+    if its choices (or *extra*) aren't hashable.
+
+    """
+    field_class = type(field)
+    multiple = _CHOICE_GENERATORS.get(getattr(field_class, "_choices_generator", None))
+    if (
+        multiple is None
+        or field_class.iter_choices is not SelectField.iter_choices
+        or field_class.has_groups is not SelectField.has_groups
+        or field_class.iter_groups is not SelectField.iter_groups
+    ):
+        return None
+    choices = field.choices
+    if isinstance(choices, dict):
+        choices = (
+            True,
+            tuple(
+                (type(label), label, _typed_choices(group))
+                for label, group in choices.items()
+            ),
+        )
+    else:
+        choices = (False, _typed_choices(choices) if choices else ())
+    key = (field_class, field.coerce, choices, *extra)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _typed_choices(choices):
+    """
+    Returns a tuple of *choices*, with the type of each item next to it.
+
+    """
+    return tuple(
+        tuple((type(item), item) for item in choice)
+        if isinstance(choice, tuple)
+        else (type(choice), choice)
+        for choice in choices
+    )
+
+
+def _get_choice_entry(key, build, *args):
+    """
+    Returns the cached entry for *key* or builds it with `build(*args)`.
+
+    The entries are `(parts, selected, index)`: the HTML *parts* with all
+    options unselected, the *selected* variant of each option part and the
+    *index* of the part positions by their coerced value. Returns `None`
+    if the coerced values aren't hashable (which is cached too). The cache
+    is cleared when it's full.
+
+    """
+    entry = _CHOICE_CACHE.get(key)
+    if entry is None:
+        parts, selected, values = build(*args)
+        field = args[-1]
+        index = {}
+        try:
+            for value, position in values:
+                index.setdefault(field.coerce(value), []).append(position)
+        except TypeError:  # unhashable values
+            entry = False
+        else:
+            index = {value: tuple(pos) for value, pos in index.items()}
+            entry = (tuple(parts), tuple(selected), index)
+        if len(_CHOICE_CACHE) >= CHOICE_CACHE_SIZE:
+            _CHOICE_CACHE.clear()
+        _CHOICE_CACHE[key] = entry
+    return entry or None
+
+
+def _mark_selected(entry, field, multiple):
+    """
+    Returns the option parts of *entry* with the options of *field*'s data
+    selected (or `None` if the data isn't hashable).
+
+    """
+    parts, selected, index = entry
+    data = field.data
+    if multiple:
+        data = () if data is None else data
+    else:
+        data = (data,)
+    parts = list(parts)
+    try:
+        for value in data:
+            for position in index.get(value, ()):
+                parts[position] = selected[position]
+    except TypeError:  # unhashable data
+        return None
+    return parts
+
+
+def _build_select_options(widget, field):
+    """
+    Returns the option parts, their selected variants and `(value,
+    position)` pairs for the `Select` *widget* of *field*.
+
+    """
+    parts = []
+    selected = []
+    values = []
+    if field.has_groups():
+        groups = [
+            (html_params(label=label), choices)
+            for label, choices in field.iter_groups()
+        ]
+    else:
+        groups = [(None, field.iter_choices())]
+    for group, choices in groups:
+        if group is not None:
+            parts.append(f"<optgroup {group}>")
+            selected.append(None)
+        for value, label, _selected, render_kw in choices:
+            values.append((value, len(parts)))
+            parts.append(widget.render_option(value, label, False, **render_kw))
+            selected.append(widget.render_option(value, label, True, **render_kw))
+        if group is not None:
+            parts.append("</optgroup>")
+            selected.append(None)
+    return parts, selected, values
+
+
+def _build_list_options(widget, field):
+    """
+    Returns the item parts, their checked variants and `(value, position)`
+    pairs for the `ListWidget` *widget* of *field*.
+
+    """
+    parts = []
+    selected = []
+    for option in field:
+        for checked, target in ((False, parts), (True, selected)):
+            option.checked = checked
+            if widget.prefix_label:
+                target.append(f"<li>{option.label} {option()}</li>")
+            else:
+                target.append(f"<li>{option()} {option.label}</li>")
+    values = [(choice[0], i) for i, choice in enumerate(field.iter_choices())]
+    return parts, selected, values
+
+
+def render_choices(widget, field, render_kw):
+    """
+    Returns the HTML of a `Select` or radio `ListWidget` *widget* using
+    cached options.
+
+    Produces the same output as `widget(field, **render_kw)`, but the
+    options (or list items) are rendered once for each distinct content of
+    the field's choices and taken from a cache after that. Only the
+    options matching the field's data are replaced by their selected
+    variant, and the outer tag is rendered from *render_kw* on each call
+    (so it gets the `required` and `invalid` keys as usual).
+
+    Radio items also depend on the id, name, render keywords, validators
+    and option widget of the field, which are part of their cache key.
+
+    Returns `None` if the *widget* or the field's choice methods aren't the
+    stock ones (or the choices or data aren't hashable).
+
+    ..note::
+
+        This changes *render_kw*.
+
+    """
+    call = type(widget).__call__
+    if call is Select.__call__:
+        key = _choice_key(field, type(widget))
+        build = _build_select_options
+    elif call is ListWidget.__call__:
+        if getattr(type(field), "__iter__", None) is not SelectField.__iter__:
+            return None
+        field_kw = getattr(field, "render_kw", None) or _EMPTY
+        key = _choice_key(
+            field,
+            type(widget),
+            widget.prefix_label,
+            field.option_widget,
+            type(field.meta),
+            field.id,
+            field.name,
+            tuple(sorted((key, type(value), value) for key, value in field_kw.items())),
+            tuple(field.validators),
+        )
+        build = _build_list_options
+    else:
+        return None
+    if key is None:
+        return None
+    entry = _get_choice_entry(key, build, widget, field)
+    if entry is None:
+        return None
+    parts = _mark_selected(
+        entry, field, _CHOICE_GENERATORS[type(field)._choices_generator]
+    )
+    if parts is None:
+        return None
+    render_kw.setdefault("id", field.id)
+    if call is ListWidget.__call__:
+        tag = widget.html_tag
+        return Markup(f"<{tag} {html_params(**render_kw)}>{''.join(parts)}</{tag}>")
+    if widget.multiple:
+        render_kw["multiple"] = True
+    flags = getattr(field, "flags", {})
+    for key in dir(flags):
+        if key in widget.validation_attrs and key not in render_kw:
+            render_kw[key] = getattr(flags, key)
+    params = html_params(name=field.name, **render_kw)
+    return Markup(f"<select {params}>{''.join(parts)}</select>")
@@ -0,0 +1,270 @@
+"""
+Column–wise constraint checks for large batches of records.
+
+:func:`check_records` checks many records (e.g. the rows of a CSV or JSONL
+import) at once against the constraints of a form class, instead of creating
+and validating one form per record. It uses the checks compiled by
+:mod:`wtforms_html5.precheck` and runs them column by column, with `NumPy`_
+if it is installed and in pure Python otherwise:
+
+>>> from wtforms import Form, IntegerField, StringField
+>>> from wtforms.validators import InputRequired, Length, NumberRange
+
+>>> class MyForm(Form):
+...   name = StringField(validators=[InputRequired(), Length(max=5)])
+...   age = IntegerField(validators=[NumberRange(min=0)])
+
+>>> res = check_records(MyForm, [
+...   {"name": "Joe", "age": "30"},
+...   {"name": "Joseph", "age": "30"},
+...   {"age": 30},
+...   {"name": "Joe", "age": "x"},
+... ], use_numpy=False)
+>>> res.fields
+{'name': [False, True, True, False], 'age': [False, False, False, True]}
+>>> res.invalid
+[False, True, True, True]
+
+The records are mappings of field names to their values, which are used
+like submitted form values: `None` (or a missing key) means no value was
+submitted and other values are converted with `str`.
+
+Like :func:`wtforms_html5.precheck.precheck`, the checks are conservative:
+a record flagged for a field would fail `form.validate()`, but records that
+aren't flagged aren't necessarily valid. Fields that can't be checked are
+not included in the result.
+
+.. _NumPy: https://numpy.org/
+
+"""
+
+from itertools import islice
+from itertools import repeat
+from operator import is_not
+from operator import methodcaller
+from operator import not_
+
+from wtforms_html5.precheck import UNKNOWN
+from wtforms_html5.precheck import check_field
+from wtforms_html5.precheck import get_precheck_plan
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+BATCH_SIZE = 10000
+
+
+class BulkResult:
+    """
+    The result of checking a batch of records.
+
+    The `fields` map the name of each checked field to a mask with an item
+    per record, which is true if the record fails the field's constraints.
+    The `invalid` mask combines them. The masks are NumPy arrays if NumPy
+    was used and lists otherwise. `start` is the index of the first record
+    of the batch.
+
+    """
+
+    def __init__(self, fields, invalid, start=0):
+        self.fields = fields
+        self.invalid = invalid
+        self.start = start
+
+    def __len__(self):
+        return len(self.invalid)
+
+    def invalid_rows(self):
+        """
+        Returns the indexes of the invalid records.
+
+        """
+        return [self.start + i for i, invalid in enumerate(self.invalid) if invalid]
+
+
+def check_column_python(entry, values):
+    """
+    Returns the error mask of a column of *values* (in pure Python).
+
+    *entry* is the compiled precheck for the field.
+
+    """
+    _name, parse, default, steps = entry
+    mask = []
+    for value in values:
+        raw = () if value is None else (str(value),)
+        try:
+            errors = check_field(parse, default, steps, raw)
+        except (TypeError, ValueError, ArithmeticError):
+            errors = None
+        mask.append(bool(errors))
+    return mask
+
+
+def _default_data(parse, default):
+    """
+    Returns `(known, data, errors)` for records without a value.
+
+    """
+    if default is UNKNOWN:
+        return False, None, False
+    data, errors = default
+    if parse is None and data is not None and not isinstance(data, str):
+        return False, None, False
+    return True, data, bool(errors)
+
+
+def _parse_column(parse, texts, chunk_size=256):
+    """
+    Returns the *texts* converted with *parse* and a mask of failed ones.
+
+    Failed texts are converted to `0`. Chunks without failures are converted
+    with a single `map`.
+
+    """
+    numbers = []
+    bad = numpy.zeros(len(texts), bool)
+    for start in range(0, len(texts), chunk_size):
+        chunk = texts[start : start + chunk_size]
+        try:
+            numbers.extend(list(map(parse, chunk)))
+        except (ValueError, ArithmeticError):
+            for i, text in enumerate(chunk, start):
+                try:
+                    numbers.append(parse(text))
+                except (ValueError, ArithmeticError):
+                    numbers.append(0)
+                    bad[i] = True
+    return numbers, bad
+
+
+def check_column_numpy(entry, values):
+    """
+    Returns the error mask of a column of *values* (with NumPy).
+
+    *entry* is the compiled precheck for the field.
+
+    """
+    np = numpy
+    _name, parse, default, steps = entry
+    size = len(values)
+    present = np.fromiter(map(is_not, values, repeat(None)), bool, size)
+    texts = list(map(str, values))
+    blank = "" if parse is None else "0"
+    for i in np.flatnonzero(~present):
+        texts[i] = blank
+    raw_truthy = present & np.fromiter(map(bool, texts), bool, size)
+
+    known, default_data, default_errors = _default_data(parse, default)
+    data_unknown = ~present if not known else np.zeros(size, bool)
+    fail = ~present & default_errors
+    unknown = data_unknown.copy()
+
+    if parse is None:
+        lengths = np.fromiter(map(len, texts), np.intp, size)
+        falsy = np.fromiter(map(not_, map(str.strip, texts)), bool, size)
+        if known and not present.all():
+            default_text = default_data or ""
+            lengths[~present] = len(default_text)
+            falsy[~present] = not default_text.strip()
+    else:
+        numbers, bad = _parse_column(parse, texts)
+        if known and not present.all():
+            fill = 0 if default_data is None else default_data
+            for i in np.flatnonzero(~present):
+                numbers[i] = fill
+        vals = np.array(numbers, dtype=np.float64)
+        none = present & bad
+        if known and default_data is None:
+            none |= ~present
+        fail |= present & bad
+        isnan = ~none & np.isnan(vals)
+        falsy = none | (vals == 0)
+
+    done = np.zeros(size, bool)
+    for kind, arg1, arg2 in steps:
+        if kind == "input_required":
+            hit = ~done & ~raw_truthy
+            fail = np.where(hit, arg1, fail)
+            unknown &= ~hit
+            done |= hit
+        elif kind == "optional":
+            check = np.fromiter(map(not_, map(arg1, texts)), bool, size)
+            hit = ~done & (~present | check)
+            fail &= ~hit
+            unknown &= ~hit
+            done |= hit
+        else:
+            done |= data_unknown
+            if kind == "data_required":
+                hit = ~done & falsy
+                fail = np.where(hit, arg1, fail)
+                done |= hit
+            elif kind == "length":
+                viol = lengths < arg1
+                if arg2 != -1:
+                    viol |= lengths > arg2
+                fail |= ~done & viol
+            else:
+                viol = none | isnan
+                if arg1 is not None:
+                    viol |= vals < float(arg1)
+                if arg2 is not None:
+                    viol |= vals > float(arg2)
+                fail |= ~done & viol
+    return fail & ~unknown
+
+
+def check_records(form_class, records, use_numpy=None, start=0):
+    """
+    Checks the *records* against the constraints of *form_class*.
+
+    Returns a :class:`BulkResult`. NumPy is used if it is installed, unless
+    *use_numpy* is false. *start* is the index of the first record (used by
+    :meth:`BulkResult.invalid_rows`).
+
+    """
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    records = records if isinstance(records, list) else list(records)
+    fields = {}
+    for entry in get_precheck_plan(form_class):
+        name = entry[0]
+        values = list(map(methodcaller("get", name), records))
+        mask = None
+        if use_numpy:
+            try:
+                mask = check_column_numpy(entry, values)
+            except (TypeError, ValueError, ArithmeticError):
+                mask = None
+        if mask is None:
+            mask = check_column_python(entry, values)
+            if use_numpy:
+                mask = numpy.array(mask, dtype=bool)
+        fields[name] = mask
+    if use_numpy:
+        invalid = numpy.zeros(len(records), bool)
+        for mask in fields.values():
+            invalid |= mask
+    else:
+        invalid = [any(masks) for masks in zip(*fields.values())]
+        if not fields:
+            invalid = [False] * len(records)
+    return BulkResult(fields, invalid, start)
+
+
+def iter_check_records(form_class, records, batch_size=BATCH_SIZE, use_numpy=None):
+    """
+    Yields a :class:`BulkResult` for each batch of *batch_size* records.
+
+    *records* can be any iterable (e.g. a `csv.DictReader`), so large
+    imports can be checked without loading them into memory at once.
+
+    """
+    records = iter(records)
+    start = 0
+    while batch := list(islice(records, batch_size)):
+        yield check_records(form_class, batch, use_numpy, start)
+        start += len(batch)
@@ -0,0 +1,109 @@
+"""
+`Jinja2`_ integration for :mod:`wtforms_html5`.
+
+Add the :class:`HTML5Extension` to your environment, to get the `html5` and
+`html5_kwargs` filters:
+
+>>> from jinja2 import Environment
+>>> from wtforms import Form, StringField
+>>> from wtforms.validators import Length
+>>> from wtforms_html5 import AutoAttrMeta
+
+>>> class MyForm(Form):
+...   class Meta(AutoAttrMeta):
+...     pass
+...   name = StringField(validators=[Length(max=12)])
+
+>>> env = Environment(extensions=[HTML5Extension])
+>>> template = env.from_string('{{ form.name|html5(class_="x") }}')
+>>> print(template.render(form=MyForm()))
+<input class="x" id="name" maxlength="12" name="name" type="text" value="">
+
+For forms using :class:`AutoAttrMeta`, the `html5` filter renders the same
+HTML as `form.name(...)` (including the options and overrides of the `Meta`
+class). Unless the `Meta` class overrides how fields are rendered, or
+`html5_stats` or :func:`wtforms_html5.profile` are used, it takes the
+attributes from the plan of the field (computed once per form class) and
+renders INPUT widgets from cached static attributes (see
+:func:`wtforms_html5.render_input`), so only the value and the error state
+are computed on each render. For other forms the auto–attributes are
+computed on each render (see :func:`wtforms_html5.get_html5_kwargs`).
+
+.. _Jinja2: https://jinja.palletsprojects.com/
+
+"""
+
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+import wtforms_html5
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import get_html5_kwargs
+from wtforms_html5 import render_input
+
+
+def _renders_from_plan(meta):
+    """
+    Returns if fields of a form using *meta* (an :class:`AutoAttrMeta`)
+    can be rendered from their plan, without calling `meta.render_field`.
+
+    """
+    meta_class = type(meta)
+    return (
+        meta_class.render_field is AutoAttrMeta.render_field
+        and meta_class.get_render_kw is AutoAttrMeta.get_render_kw
+        and meta_class.render_widget is AutoAttrMeta.render_widget
+        and meta.html5_stats is None
+        and wtforms_html5._profiler is None
+    )
+
+
+def html5_kwargs(field, **render_kw):
+    """
+    Returns the final render keywords for *field* (a Jinja2 filter).
+
+    The keywords set on the field and the *render_kw* are layered like
+    :class:`wtforms_html5.AutoAttrMeta` does it (its `get_render_kw` is used
+    for forms using it).
+
+    """
+    meta = field.meta
+    if isinstance(meta, AutoAttrMeta):
+        return meta.get_render_kw(field, render_kw)
+    field_kw = getattr(field, "render_kw", None)
+    if field_kw:
+        render_kw = {**field_kw, **render_kw}
+    return get_html5_kwargs(field, render_kw)
+
+
+def html5(field, **render_kw):
+    """
+    Returns the rendered *field* with its auto–attributes (a Jinja2 filter).
+
+    """
+    meta = field.meta
+    if isinstance(meta, AutoAttrMeta):
+        if not _renders_from_plan(meta):
+            return Markup(meta.render_field(field, render_kw))
+        render_kw = meta.get_render_kw(field, render_kw)
+        html = render_input(field.widget, field, render_kw)
+        if html is None:
+            html = Markup(meta.render_widget(field, render_kw))
+        return html
+    render_kw = html5_kwargs(field, **render_kw)
+    html = render_input(field.widget, field, render_kw)
+    if html is None:
+        html = Markup(field.widget(field, **render_kw))
+    return html
+
+
+class HTML5Extension(Extension):
+    """
+    Jinja2 extension adding the `html5` and `html5_kwargs` filters.
+
+    """
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.filters["html5"] = html5
+        environment.filters["html5_kwargs"] = html5_kwargs
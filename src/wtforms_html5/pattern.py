@@ -0,0 +1,274 @@
+"""
+Translates Python regular expressions to HTML5 `pattern` attributes.
+
+Browsers match the `pattern` of an INPUT against its whole value, as an
+ECMAScript regular expression (with the `v` or `u` flag). `Regexp` matches
+from the start of the value only and uses Python's syntax. So the expression
+is parsed with Python's own parser and written back in a syntax both agree
+on (and that is valid with `u` and `v`). Expressions that can't be
+translated faithfully return `None`:
+
+>>> print(translate_pattern(r"^[a-z_-]+\\d{2,}"))
+^[a-z_\\-]+\\p{Nd}{2,}[\\s\\S]*
+>>> print(translate_pattern(r"(?P<year>\\d{4})-\\d\\d$", re.ASCII))
+(?<year>\\d{4})-\\d\\d$
+>>> translate_pattern(r"abc", re.IGNORECASE) is None
+True
+
+These expressions (and flags) are not supported:
+
+- the `IGNORECASE`, `MULTILINE`, `VERBOSE` and `LOCALE` flags (also as
+  inline or scoped flags), and `bytes` patterns,
+- atomic groups, possessive quantifiers and conditional groups,
+- word boundaries (unless the `ASCII` flag is set),
+- negated classes (like `\\W` or `\\S`) inside other sets.
+
+The Unicode character classes `\\d`, `\\w` and `\\s` are mapped to the
+Unicode properties they match in Python (e.g. `\\p{Nd}` for `\\d`).
+
+"""
+
+import re
+from functools import lru_cache
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+PATTERN_CACHE_SIZE = 1024
+
+SUPPORTED_FLAGS = re.ASCII | re.UNICODE | re.DOTALL
+
+SYNTAX_CHARS = frozenset("^$\\.*+?()[]{}|/")
+
+CLASS_SYNTAX_CHARS = frozenset("^\\()[]{}/-|")
+
+DOUBLE_PUNCTUATORS = re.compile(r"([&!#$%*+,.:;<=>?@^`~])\1")
+
+CATEGORIES = {
+    sre_parse.CATEGORY_DIGIT: ("\\p{Nd}", "0-9"),
+    sre_parse.CATEGORY_WORD: ("\\p{L}\\p{N}_", "\\w"),
+    sre_parse.CATEGORY_SPACE: ("\\p{White_Space}\\x1c-\\x1f", "\\t\\n\\v\\f\\r "),
+}
+
+CLASS_NOT_CATEGORIES = {
+    sre_parse.CATEGORY_NOT_DIGIT: ("\\P{Nd}", "\\D"),
+    sre_parse.CATEGORY_NOT_WORD: (None, "\\W"),
+}
+
+NOT_CATEGORIES = {
+    sre_parse.CATEGORY_NOT_DIGIT: sre_parse.CATEGORY_DIGIT,
+    sre_parse.CATEGORY_NOT_WORD: sre_parse.CATEGORY_WORD,
+    sre_parse.CATEGORY_NOT_SPACE: sre_parse.CATEGORY_SPACE,
+}
+
+UNSUPPORTED = frozenset(
+    op
+    for op in (
+        sre_parse.GROUPREF_EXISTS,
+        getattr(sre_parse, "ATOMIC_GROUP", None),
+        getattr(sre_parse, "POSSESSIVE_REPEAT", None),
+    )
+    if op is not None
+)
+
+
+class UntranslatableError(Exception):
+    """
+    Raised for expressions that can't be translated.
+
+    """
+
+
+def _char(code, in_class=False):
+    """
+    Returns the literal character *code*, escaped if needed.
+
+    """
+    char = chr(code)
+    if char in (CLASS_SYNTAX_CHARS if in_class else SYNTAX_CHARS):
+        return f"\\{char}"
+    if char == " " or char.isprintable() and not char.isspace():
+        return char
+    if code < 0x100:
+        return f"\\x{code:02x}"
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    return f"\\u{{{code:x}}}"
+
+
+class _Translator:
+    """
+    Writes a parsed Python expression as ECMAScript.
+
+    """
+
+    def __init__(self, flags, groupnames):
+        self.ascii = bool(flags & re.ASCII)
+        self.dotall = bool(flags & re.DOTALL)
+        self.groupnames = groupnames
+
+    def category(self, category):
+        return CATEGORIES[category][1 if self.ascii else 0]
+
+    def charset(self, items):
+        negate = bool(items) and items[0][0] is sre_parse.NEGATE
+        if negate:
+            items = items[1:]
+        if len(items) == 1 and items[0][0] is sre_parse.CATEGORY:
+            category = items[0][1]
+            if category in NOT_CATEGORIES:
+                category, negate = NOT_CATEGORIES[category], not negate
+            if category is sre_parse.CATEGORY_DIGIT:
+                if self.ascii:
+                    return "\\D" if negate else "\\d"
+                return "\\P{Nd}" if negate else "\\p{Nd}"
+            if self.ascii and category is sre_parse.CATEGORY_WORD:
+                return "\\W" if negate else "\\w"
+            return f"[{'^' if negate else ''}{self.category(category)}]"
+        parts = []
+        for op, av in items:
+            if op is sre_parse.LITERAL:
+                part = _char(av, in_class=True)
+            elif op is sre_parse.RANGE:
+                part = f"{_char(av[0], True)}-{_char(av[1], True)}"
+            elif op is sre_parse.CATEGORY and av in CATEGORIES:
+                part = self.category(av)
+            elif op is sre_parse.CATEGORY and av in CLASS_NOT_CATEGORIES:
+                part = CLASS_NOT_CATEGORIES[av][1 if self.ascii else 0]
+            else:
+                part = None
+            if part is None:
+                raise UntranslatableError(op)
+            if part not in parts:
+                parts.append(part)
+        body = "".join(parts)
+        if DOUBLE_PUNCTUATORS.search(body):
+            raise UntranslatableError(op)
+        return f"[{'^' if negate else ''}{body}]"
+
+    def group(self, subpattern):
+        if len(subpattern) == 1 and subpattern[0][0] is not sre_parse.BRANCH:
+            return self.sequence(subpattern)
+        return f"(?:{self.sequence(subpattern)})"
+
+    def repeat(self, op, av):
+        v_min, v_max, item = av
+        if len(item) == 1 and item[0][0] in (
+            sre_parse.LITERAL,
+            sre_parse.NOT_LITERAL,
+            sre_parse.ANY,
+            sre_parse.IN,
+            sre_parse.SUBPATTERN,
+            sre_parse.GROUPREF,
+        ):
+            atom = self.sequence(item)
+        else:
+            atom = f"(?:{self.sequence(item)})"
+        if v_max == sre_parse.MAXREPEAT:
+            quantifier = {0: "*", 1: "+"}.get(v_min, f"{{{v_min},}}")
+        elif (v_min, v_max) == (0, 1):
+            quantifier = "?"
+        elif v_min == v_max:
+            quantifier = f"{{{v_min}}}"
+        else:
+            quantifier = f"{{{v_min},{v_max}}}"
+        lazy = "?" if op is sre_parse.MIN_REPEAT else ""
+        return f"{atom}{quantifier}{lazy}"
+
+    def at(self, where):
+        if where in (sre_parse.AT_BEGINNING, sre_parse.AT_BEGINNING_STRING):
+            return "^"
+        if where in (sre_parse.AT_END, sre_parse.AT_END_STRING):
+            return "$"
+        if self.ascii and where is sre_parse.AT_BOUNDARY:
+            return "\\b"
+        if self.ascii and where is sre_parse.AT_NON_BOUNDARY:
+            return "\\B"
+        raise UntranslatableError(where)
+
+    def item(self, op, av):
+        if op in UNSUPPORTED:
+            raise UntranslatableError(op)
+        if op is sre_parse.LITERAL:
+            return _char(av)
+        if op is sre_parse.NOT_LITERAL:
+            return f"[^{_char(av, in_class=True)}]"
+        if op is sre_parse.ANY:
+            return "[\\s\\S]" if self.dotall else "[^\\n]"
+        if op is sre_parse.IN:
+            return self.charset(av)
+        if op is sre_parse.BRANCH:
+            return "(?:{})".format("|".join(self.sequence(alt) for alt in av[1]))
+        if op is sre_parse.SUBPATTERN:
+            group, add_flags, del_flags, subpattern = av
+            if add_flags or del_flags:
+                raise UntranslatableError(op)
+            if group is None:
+                return self.group(subpattern)
+            if group in self.groupnames:
+                return f"(?<{self.groupnames[group]}>{self.sequence(subpattern)})"
+            return f"({self.sequence(subpattern)})"
+        if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            return self.repeat(op, av)
+        if op is sre_parse.AT:
+            return self.at(av)
+        if op is sre_parse.GROUPREF:
+            if av in self.groupnames:
+                return f"\\k<{self.groupnames[av]}>"
+            return f"(?:\\{av})"
+        if op in (sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            direction, subpattern = av
+            kind = "=" if op is sre_parse.ASSERT else "!"
+            behind = "<" if direction < 0 else ""
+            return f"(?{behind}{kind}{self.sequence(subpattern)})"
+        raise UntranslatableError(op)
+
+    def sequence(self, subpattern):
+        if len(subpattern) == 1 and subpattern[0][0] is sre_parse.BRANCH:
+            return "|".join(self.sequence(alt) for alt in subpattern[0][1][1])
+        return "".join(self.item(op, av) for op, av in subpattern)
+
+
+def _end_anchored(parsed):
+    """
+    Returns if the *parsed* expression ends with `$` (or `\\Z`).
+
+    """
+    return bool(parsed) and parsed[-1] in (
+        (sre_parse.AT, sre_parse.AT_END),
+        (sre_parse.AT, sre_parse.AT_END_STRING),
+    )
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def translate_pattern(pattern, flags=0):
+    """
+    Returns the HTML5 `pattern` for the Python *pattern* (or `None`).
+
+    The result matches the same values as `re.match(pattern, value, flags)`
+    does (i.e. with an implicit `^`, but not `$`). It is cached by
+    *pattern* and *flags* in a LRU cache.
+
+    """
+    if not isinstance(pattern, str):
+        return None
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except re.error:
+        return None
+    flags = parsed.state.flags
+    if flags & ~SUPPORTED_FLAGS:
+        return None
+    groupnames = {gid: name for name, gid in parsed.state.groupdict.items()}
+    translator = _Translator(flags, groupnames)
+    try:
+        translated = translator.sequence(parsed)
+    except UntranslatableError:
+        return None
+    if len(parsed) == 1 and parsed[0][0] is sre_parse.BRANCH:
+        translated = f"(?:{translated})"
+    if not _end_anchored(parsed):
+        translated += "[\\s\\S]*"
+    return translated
@@ -0,0 +1,245 @@
+"""
+Fast constraint checks of raw form data, without processing a form.
+
+:func:`precheck` checks the raw *formdata* (a multidict) of a request against
+the required, `Length` and `NumberRange` constraints of a form class. It
+returns the fields that are certain to fail the validation, so bad
+submissions can be rejected without creating and validating a form:
+
+>>> from werkzeug.datastructures import MultiDict
+>>> from wtforms import Form, IntegerField, StringField
+>>> from wtforms.validators import InputRequired, Length, NumberRange
+
+>>> class MyForm(Form):
+...   name = StringField(validators=[InputRequired(), Length(max=5)])
+...   age = IntegerField(validators=[NumberRange(min=0)])
+
+>>> precheck(MyForm, MultiDict({"name": "too long", "age": "-1"}))
+{'name': ['maxlength'], 'age': ['min']}
+>>> precheck(MyForm, MultiDict({"age": "x"}))
+{'name': ['required'], 'age': ['invalid']}
+>>> precheck(MyForm, MultiDict({"name": "ok", "age": "1"}))
+{}
+
+The checks are conservative: an empty result doesn't mean the form is valid
+(you still need to validate it), but each field in the result will have
+errors after `form.validate()`. Fields are only checked if their whole
+validation is known, i.e.:
+
+- the field is a `StringField`, `IntegerField`, `FloatField` or
+  `DecimalField` (or a subclass not changing how the data is processed and
+  validated) without filters,
+- all its validators are `InputRequired`, `DataRequired`, `Optional`,
+  `Length` (for strings) or `NumberRange` (for numbers),
+- the form has no inline `validate_<name>` or `filter_<name>` for it.
+
+The fields of `FormField` subforms are checked too; `FieldList` entries are
+not. The checks assume the form is created from *formdata* only (i.e. with
+no *obj* or *data*).
+
+"""
+
+import math
+from decimal import Decimal
+
+from wtforms.fields import DecimalField
+from wtforms.fields import Field
+from wtforms.fields import FloatField
+from wtforms.fields import FormField
+from wtforms.fields import IntegerField
+from wtforms.fields import StringField
+from wtforms.validators import DataRequired
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+from wtforms.validators import Optional
+
+from wtforms_html5 import _PLAN_LOCK
+from wtforms_html5 import get_meta_class
+from wtforms_html5 import iter_unbound_fields
+
+PARSERS = {
+    StringField.process_formdata: None,
+    IntegerField.process_formdata: int,
+    FloatField.process_formdata: float,
+    DecimalField.process_formdata: Decimal,
+}
+
+UNKNOWN = object()
+
+
+def _compile_steps(field, parse):
+    """
+    Returns the checks for the validators of *field* (or `None`).
+
+    """
+    steps = []
+    for validator in field.validators:
+        call = type(validator).__call__
+        if call is InputRequired.__call__:
+            steps.append(("input_required", validator.message != "", None))
+        elif call is DataRequired.__call__:
+            steps.append(("data_required", validator.message != "", None))
+        elif call is Optional.__call__:
+            steps.append(("optional", validator.string_check, None))
+        elif call is Length.__call__ and parse is None:
+            steps.append(("length", validator.min, validator.max))
+        elif call is NumberRange.__call__ and parse is not None:
+            steps.append(("range", validator.min, validator.max))
+        else:
+            return None
+    return tuple(steps)
+
+
+def _compile_default(field):
+    """
+    Returns the `(data, errors)` of *field* if no data is submitted for it.
+
+    """
+    if callable(field.default):
+        return UNKNOWN
+    field.process(None)
+    return field.data, ["invalid"] if field.process_errors else []
+
+
+def _compile_field(form_class, name, unbound_field, meta, prefix):
+    """
+    Yields the checks for the field *name* of *form_class*.
+
+    """
+    if hasattr(form_class, f"validate_{name}"):
+        return
+    if hasattr(form_class, f"filter_{name}"):
+        return
+    field = unbound_field.bind(form=None, name=name, prefix=prefix, _meta=meta)
+    field_class = type(field)
+    if isinstance(field, FormField):
+        if (
+            field_class.process is FormField.process
+            and field_class.validate is FormField.validate
+        ):
+            yield from _compile_form(field.form_class, field.name + field.separator)
+        return
+    if (
+        field.filters
+        or field_class.process is not Field.process
+        or field_class.validate is not Field.validate
+        or field_class.pre_validate is not Field.pre_validate
+        or field_class.post_validate is not Field.post_validate
+        or field_class.process_formdata not in PARSERS
+        or getattr(field, "use_locale", False)
+    ):
+        return
+    parse = PARSERS[field_class.process_formdata]
+    steps = _compile_steps(field, parse)
+    if steps:
+        yield (field.name, parse, _compile_default(field), steps)
+
+
+def _compile_form(form_class, prefix=""):
+    """
+    Yields the checks for all fields of *form_class*.
+
+    """
+    if prefix and prefix[-1] not in "-_;:/.":
+        prefix += "-"
+    meta = get_meta_class(form_class)()
+    for name, unbound_field in iter_unbound_fields(form_class):
+        yield from _compile_field(form_class, name, unbound_field, meta, prefix)
+
+
+def get_precheck_plan(form_class):
+    """
+    Returns the compiled checks of *form_class*.
+
+    The plan is a tuple with a `(name, parse, default, steps)` entry for each
+    field that can be checked. It's compiled once per form class and cached,
+    and recompiled if fields are added to or removed from the class (use
+    :func:`wtforms_html5.invalidate` after other changes).
+
+    """
+    fields = iter_unbound_fields(form_class)
+    entry = form_class.__dict__.get("_html5_precheck")
+    if entry is None or entry[0] is not fields:
+        with _PLAN_LOCK:
+            entry = form_class.__dict__.get("_html5_precheck")
+            if entry is None or entry[0] is not fields:
+                entry = (fields, tuple(_compile_form(form_class)))
+                form_class._html5_precheck = entry
+    return entry[1]
+
+
+def check_field(parse, default, steps, raw):
+    """
+    Returns the failed constraints for the *raw* values of a field.
+
+    Returns `None` if the result of the validation isn't known.
+
+    """
+    if raw:
+        if parse is None:
+            data, errors = raw[0], []
+        else:
+            try:
+                data, errors = parse(raw[0]), []
+            except (ValueError, ArithmeticError):
+                data, errors = None, ["invalid"]
+    elif default is UNKNOWN:
+        data = errors = UNKNOWN
+    else:
+        data, errors = default[0], list(default[1])
+    for kind, arg1, arg2 in steps:
+        if kind == "input_required":
+            if not (raw and raw[0]):
+                return ["required"] if arg1 else []
+        elif kind == "optional":
+            if not raw or isinstance(raw[0], str) and not arg1(raw[0]):
+                return []
+        elif data is UNKNOWN:
+            return None
+        elif kind == "data_required":
+            if not data or isinstance(data, str) and not data.strip():
+                return ["required"] if arg1 else []
+        elif kind == "length":
+            length = data and len(data) or 0
+            if length < arg1:
+                errors.append("minlength")
+            elif arg2 != -1 and length > arg2:
+                errors.append("maxlength")
+        elif data is None:
+            if not errors:
+                errors.append("required")
+        elif math.isnan(data):
+            errors.append("invalid")
+        elif arg1 is not None and data < arg1:
+            errors.append("min")
+        elif arg2 is not None and data > arg2:
+            errors.append("max")
+    if errors is UNKNOWN:
+        return None
+    return errors
+
+
+def precheck(form_class, formdata, prefix=""):
+    """
+    Returns the fields of *form_class* that fail for *formdata*.
+
+    The result maps the names of the failing fields (as used in *formdata*)
+    to the failed constraints: `required`, `minlength`, `maxlength`, `min`,
+    `max` or `invalid` (if the value can't be converted). Use the *prefix*
+    of your form, if it has one.
+
+    """
+    if prefix and prefix[-1] not in "-_;:/.":
+        prefix += "-"
+    result = {}
+    for name, parse, default, steps in get_precheck_plan(form_class):
+        name = prefix + name
+        raw = formdata.getlist(name) if name in formdata else ()
+        try:
+            errors = check_field(parse, default, steps, raw)
+        except (TypeError, ValueError, ArithmeticError):
+            continue
+        if errors:
+            result[name] = errors
+    return result
@@ -0,0 +1,520 @@
+"""
+Render helpers for forms using :class:`wtforms_html5.AutoAttrMeta`.
+
+:func:`iter_render` renders a form field by field as a generator, so the HTML
+of very large forms can be streamed without building it in memory first:
+
+>>> from wtforms import FieldList, Form, StringField
+>>> from wtforms.validators import Length
+>>> from wtforms_html5 import AutoAttrMeta
+
+>>> class ListForm(Form):
+...   class Meta(AutoAttrMeta):
+...     pass
+...   items = FieldList(StringField(validators=[Length(max=5)]), min_entries=2)
+
+>>> for chunk in iter_render(ListForm()):
+...   print(chunk)
+<input id="items-0" maxlength="5" name="items-0" type="text" value="">
+<input id="items-1" maxlength="5" name="items-1" type="text" value="">
+
+:func:`aiter_render` does the same for `asyncio` code, in chunks of fields
+and giving control back to the event loop between them.
+
+:func:`render_changed` renders only the fields whose output changed since a
+previous render (e.g. for partial updates after validating a form), based
+on a fingerprint of everything the HTML of each field depends on:
+
+>>> first = render_changed(ListForm())
+>>> list(first.html)
+['items-0', 'items-1']
+>>> form = ListForm(data={"items": ["abc", ""]})
+>>> res = render_changed(form, first.fingerprints)
+>>> for html in res.html.values():
+...   print(html)
+<input id="items-0" maxlength="5" name="items-0" type="text" value="abc">
+
+:func:`form_etag` returns an HTTP `ETag` for the rendered fields of a form,
+without rendering them (e.g. to answer conditional requests with `304 Not
+Modified`):
+
+>>> form_etag(ListForm()) == form_etag(ListForm())
+True
+>>> form_etag(ListForm()) == form_etag(form)
+False
+
+:func:`render_rows` renders a form class for many rows of data (e.g. the
+rows of an editable table), computing the static markup of the fields
+once:
+
+>>> class RowForm(Form):
+...   class Meta(AutoAttrMeta):
+...     pass
+...   sku = StringField(validators=[Length(max=8)])
+
+>>> for row in render_rows(RowForm, [{"sku": "A1"}, {"sku": "B2"}], "row{index}"):
+...   print(row["sku"])
+<input id="row0-sku" maxlength="8" name="row0-sku" type="text" value="A1">
+<input id="row1-sku" maxlength="8" name="row1-sku" type="text" value="B2">
+
+"""
+
+import asyncio
+import hashlib
+from collections.abc import Mapping
+from time import perf_counter
+
+from markupsafe import Markup
+from markupsafe import escape
+from wtforms.fields import FieldList
+from wtforms.fields import FormField
+
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import get_current_plan
+from wtforms_html5 import set_invalid
+from wtforms_html5._widgets import _build_fragment
+from wtforms_html5._widgets import _is_checked
+from wtforms_html5._widgets import _join_input
+from wtforms_html5._widgets import _prepare_input
+
+FINGERPRINT_SIZE = 8
+
+ETAG_SIZE = 16
+
+PLAN_TOKEN_CACHE_SIZE = 4096
+
+CHUNK_TIME_BUDGET = 0.005
+
+_PLAN_TOKENS = {}
+
+
+def iter_fields(form):
+    """
+    Yields all fields of *form* that render a single widget.
+
+    The entries of a `FieldList` and the fields of a `FormField` are yielded
+    instead of the enclosing field (recursively).
+
+    """
+    for field in form:
+        if isinstance(field, (FieldList, FormField)):
+            yield from iter_fields(field)
+        else:
+            yield field
+
+
+def render_errors(field, css_class="errors"):
+    """
+    Returns the errors of *field* as HTML list (or an empty string).
+
+    """
+    if not field.errors:
+        return Markup("")
+    items = "".join(f"<li>{escape(error)}</li>" for error in field.errors)
+    return Markup(f'<ul class="{escape(css_class)}">{items}</ul>')
+
+
+def iter_render(form, labels=False, errors=False, render_kw=None):
+    """
+    Yields the rendered HTML for each field of *form*.
+
+    Fields are rendered one at a time with their `Meta.render_field`, so the
+    time to the first chunk and the memory needed don't grow with the size
+    of the form. Nested fields are flattened like in :func:`iter_fields`.
+
+    :labels: prefix each field with its label (except hidden fields)
+    :errors: append the field errors as list (see :func:`render_errors`)
+    :render_kw: optional mapping of field names to render keywords
+
+    To use it with a streaming WSGI response, encode the chunks:
+
+    .. code-block:: python
+
+        return Response(chunk.encode() for chunk in iter_render(form))
+
+    """
+    render_kw = render_kw or {}
+    for field in iter_fields(form):
+        html = field(**render_kw.get(field.name, {}))
+        yield _decorate(field, html, labels, errors)
+
+
+def _render_chunk(chunks, chunk_size, time_budget):
+    """
+    Returns the next parts from the *chunks* of :func:`iter_render`, up to
+    *chunk_size* parts or until *time_budget* seconds are used.
+
+    """
+    parts = []
+    deadline = None if time_budget is None else perf_counter() + time_budget
+    for html in chunks:
+        parts.append(html)
+        if chunk_size is not None and len(parts) >= chunk_size:
+            break
+        if deadline is not None and perf_counter() >= deadline:
+            break
+    return parts
+
+
+async def aiter_render(
+    form,
+    labels=False,
+    errors=False,
+    render_kw=None,
+    chunk_size=None,
+    time_budget=CHUNK_TIME_BUDGET,
+    executor=None,
+):
+    """
+    Yields the rendered HTML of *form* in chunks, for `asyncio` code.
+
+    The fields are rendered like with :func:`iter_render` (with the same
+    *labels*, *errors* and *render_kw* options), but a chunk of fields is
+    rendered at a time and control is given back to the event loop between
+    the chunks, so rendering a large form doesn't block other tasks (e.g.
+    other requests of an ASGI worker) for the whole render.
+
+    :chunk_size: the maximal number of fields of a chunk
+    :time_budget: the seconds a chunk may take (it ends after the field
+                  exceeding it); defaults to `CHUNK_TIME_BUDGET`
+    :executor: a `concurrent.futures.Executor` (e.g. a thread pool) to
+               render the chunks in, instead of in the event loop
+
+    If neither *chunk_size* nor *time_budget* is set, the whole form is
+    rendered as a single chunk. Each chunk is a `Markup` string, so it can
+    be streamed as it is (e.g. with Starlette):
+
+    .. code-block:: python
+
+        return StreamingResponse(aiter_render(form), media_type="text/html")
+
+    """
+    chunks = iter_render(form, labels, errors, render_kw)
+    loop = asyncio.get_running_loop()
+    while True:
+        if executor is None:
+            parts = _render_chunk(chunks, chunk_size, time_budget)
+        else:
+            parts = await loop.run_in_executor(
+                executor, _render_chunk, chunks, chunk_size, time_budget
+            )
+        if not parts:
+            return
+        yield Markup("").join(parts)
+        await asyncio.sleep(0)
+
+
+def _decorate(field, html, labels, errors):
+    """
+    Returns the *html* of *field* with its label and / or errors added.
+
+    """
+    if labels and not field.flags.hidden:
+        html = field.label() + html
+    if errors:
+        html += render_errors(field)
+    return html
+
+
+def _final_kwargs(field, render_kw):
+    """
+    Returns the keywords the widget of *field* is rendered with.
+
+    """
+    meta = field.meta
+    if isinstance(meta, AutoAttrMeta):
+        return meta.get_render_kw(field, render_kw)
+    return {**(getattr(field, "render_kw", None) or {}), **render_kw}
+
+
+def _fingerprint(field, kwargs, labels, errors):
+    """
+    Returns the fingerprint of *field* rendered with the final *kwargs*.
+
+    """
+    if hasattr(field, "_value"):
+        value = field._value()
+    else:
+        value = repr(field.data)
+    choices = None
+    if hasattr(field, "iter_choices"):
+        choices = tuple(field.iter_choices())
+    # the widget adds these flags of the field as attributes (e.g. disabled)
+    flags = getattr(field, "flags", None)
+    flag_values = tuple(
+        (name, str(getattr(flags, name, None)))
+        for name in getattr(field.widget, "validation_attrs", ())
+        if name not in kwargs
+    )
+    inputs = (
+        type(field.widget).__qualname__,
+        field.id,
+        field.name,
+        tuple(
+            (key, item if isinstance(item, (bool, int, float)) else str(item))
+            for key, item in sorted(kwargs.items())
+        ),
+        flag_values,
+        value,
+        bool(_is_checked(field.widget, field)),
+        choices,
+        tuple(map(str, field.errors)) if errors else None,
+        str(field.label.text) if labels and not field.flags.hidden else None,
+    )
+    digest = hashlib.blake2b(repr(inputs).encode(), digest_size=FINGERPRINT_SIZE)
+    return digest.hexdigest()
+
+
+def field_fingerprint(field, render_kw=None, labels=False, errors=False):
+    """
+    Returns the render fingerprint of *field* (a short hex string).
+
+    The fingerprint covers everything the output of :func:`render_changed`
+    for the field depends on: the widget, the id and name, the final render
+    keywords (including the auto–attributes and the *invalid* class), the
+    flags the widget renders as attributes (like `disabled`), the value (or
+    data), the checked state and choices and, if *labels* / *errors* are
+    used, the label and the errors. It's stable between processes, so it
+    can be sent to the client and back. Values without a stable text (e.g. objects using the
+    default `repr`) make the fingerprint change on each render.
+
+    """
+    kwargs = _final_kwargs(field, render_kw or {})
+    return _fingerprint(field, kwargs, labels, errors)
+
+
+class RenderDiff:
+    """
+    The result of :func:`render_changed`.
+
+    `html` maps the names of the changed fields to their HTML (in the order
+    of the form), `fingerprints` maps the names of all fields to their
+    current fingerprint and `removed` lists the names of fields that were
+    rendered before, but aren't part of the form anymore (e.g. removed
+    `FieldList` entries).
+
+    """
+
+    def __init__(self, html, fingerprints, removed):
+        self.html = html
+        self.fingerprints = fingerprints
+        self.removed = removed
+
+
+def render_changed(form, previous=None, labels=False, errors=False, render_kw=None):
+    """
+    Returns the :class:`RenderDiff` of *form* against *previous*.
+
+    *previous* are the `fingerprints` of an earlier result (if it's
+    missing, all fields are rendered). Only fields whose fingerprint changed
+    are rendered; the final render keywords are computed once for both. The
+    fields are flattened like in :func:`iter_fields` and rendered like with
+    :func:`iter_render`, with the same *labels*, *errors* and *render_kw*
+    options (use the same options for all renders you compare).
+
+    """
+    previous = previous or {}
+    render_kw = render_kw or {}
+    html = {}
+    fingerprints = {}
+    for field in iter_fields(form):
+        kwargs = _final_kwargs(field, render_kw.get(field.name, {}))
+        fingerprint = _fingerprint(field, kwargs, labels, errors)
+        fingerprints[field.name] = fingerprint
+        if previous.get(field.name) != fingerprint:
+            if isinstance(field.meta, AutoAttrMeta):
+                field_html = field.meta.render_widget(field, kwargs)
+            else:
+                field_html = field.widget(field, **kwargs)
+            html[field.name] = _decorate(field, Markup(field_html), labels, errors)
+    removed = [name for name in previous if name not in fingerprints]
+    return RenderDiff(html, fingerprints, removed)
+
+
+def _plan_token(plan):
+    """
+    Returns the text of *plan* for :func:`form_etag`.
+
+    The texts are cached by the identity of the plans (which are shared by
+    all instances of a form class). The entries keep their plans alive, so
+    the identities aren't reused; the cache is cleared when it's full.
+
+    """
+    entry = _PLAN_TOKENS.get(id(plan))
+    if entry is None or entry[0] is not plan:
+        if len(_PLAN_TOKENS) >= PLAN_TOKEN_CACHE_SIZE:
+            _PLAN_TOKENS.clear()
+        entry = _PLAN_TOKENS[id(plan)] = (plan, repr(tuple(plan.pairs())))
+    return entry[1]
+
+
+def form_etag(form, render_kw=None):
+    """
+    Returns a strong HTTP `ETag` for the fields of *form* (as rendered by
+    :func:`iter_render`).
+
+    The tag is a hash of what `Meta.render_field` uses for each field, but
+    no field is rendered: the static attributes from its plan (whose text
+    is cached per plan), its id and name, its render keywords and the
+    *render_kw* for it, its raw data and data, choices, a lazy description
+    and the errors. It's the same in all processes, so it can be compared
+    with the `If-None-Match` header of a request.
+
+    Values without a stable text (e.g. objects using the default `repr`)
+    make the tag change on each call, so such forms are always rendered.
+    The widgets and flags of the fields are expected to follow their
+    definitions in the form class (like their plans do). Labels, and
+    anything else your templates add, aren't covered.
+
+    """
+    render_kw = render_kw or {}
+    cls = type(form)
+    parts = [cls.__module__, cls.__qualname__]
+    add = parts.extend
+    for field in iter_fields(form):
+        description = field.description
+        add(
+            (
+                field.name,
+                field.id,
+                _plan_token(get_current_plan(field)),
+                getattr(field, "render_kw", None),
+                render_kw.get(field.name),
+                field.raw_data,
+                field.data,
+                getattr(field, "choices", None),
+                None if isinstance(description, str) else str(description),
+                field.errors,
+            )
+        )
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=ETAG_SIZE)
+    return f'"{digest.hexdigest()}"'
+
+
+def _row_template(field, render_kw):
+    """
+    Returns the static part of the INPUT of *field* for :func:`render_rows`
+    (or `None` if the field can't use one).
+
+    The template is `(dynamic, own_id, keys, parts)`: the dynamic keys from
+    the render keywords, if the `id` is static, and the sorted keys and
+    escaped parts of the static attributes.
+
+    """
+    meta = field.meta
+    if (
+        not isinstance(meta, AutoAttrMeta)
+        or type(meta).get_render_kw is not AutoAttrMeta.get_render_kw
+        or field.errors
+    ):
+        return None
+    own_id = "id" in render_kw or "id" in (getattr(field, "render_kw", None) or {})
+    kwargs = meta.get_render_kw(field, dict(render_kw))
+    dynamic = _prepare_input(field.widget, field, kwargs)
+    if dynamic is None:
+        return None
+    del kwargs["name"]
+    if not own_id:
+        del kwargs["id"]
+    keys, parts = _build_fragment(kwargs.items())
+    return dynamic, own_id, keys, parts
+
+
+def _fill_row_template(template, field):
+    """
+    Returns the INPUT of *field* rendered from its row *template*.
+
+    """
+    dynamic, own_id, keys, parts = template
+    dynamic = dict(dynamic)
+    if field.errors:
+        set_invalid(field, dynamic)
+    if _is_checked(field.widget, field):
+        dynamic["checked"] = True
+    if "value" not in dynamic:
+        dynamic["value"] = field._value()
+    if not own_id:
+        dynamic["id"] = field.id
+    dynamic["name"] = field.name
+    return _join_input(keys, parts, dynamic)
+
+
+def _row_prefix(prefix, index):
+    """
+    Returns the form prefix of row *index* (like `BaseForm` completes it).
+
+    """
+    prefix = prefix.format(index=index)
+    if prefix and prefix[-1] not in "-_;:/.":
+        prefix += "-"
+    return prefix
+
+
+def render_rows(
+    form_class,
+    rows,
+    prefix=None,
+    validate=False,
+    errors=False,
+    render_kw=None,
+):
+    """
+    Yields the rendered fields of *form_class* for each of the *rows*.
+
+    Each row is a mapping (used as `data`) or an object (used as `obj`) for
+    a form, and each result maps the names of the form's fields to their
+    HTML, like `{name: form[name]() for name in form._fields}` for a new
+    form per row would.
+
+    :prefix: a format string for the form prefix of each row, with the
+             `index` of the row (e.g. `"row-{index}"`), so the rows get
+             distinct names and ids
+    :validate: validate the data of each row (so it gets its errors and
+               the *invalid* class)
+    :errors: append the field errors as list (see :func:`render_errors`)
+    :render_kw: optional mapping of field names to render keywords
+
+    The final render keywords and the escaped static attributes of each
+    INPUT field are computed once, so only the value, *checked* state, id,
+    name and *invalid* class are filled in per row (the `render_field` of
+    the form's Meta isn't called for them). Forms without `FieldList` or
+    `FormField` fields (and CSRF) are processed into a single instance,
+    instead of creating one per row. Other fields are rendered as usual.
+
+    """
+    render_kw = render_kw or {}
+    form = form_class()
+    reuse = not form.meta.csrf and not any(
+        isinstance(field, (FieldList, FormField)) for field in form
+    )
+    templates = {
+        name: _row_template(field, render_kw.get(name, {}))
+        for name, field in form._fields.items()
+    }
+    own_ids = {name for name, field in form._fields.items() if field.id != field.name}
+    for index, row in enumerate(rows):
+        data = {"data": row} if isinstance(row, Mapping) else {"obj": row}
+        if not reuse:
+            row_prefix = "" if prefix is None else _row_prefix(prefix, index)
+            form = form_class(prefix=row_prefix, **data)
+        else:
+            form.process(**data)
+            form.form_errors = []
+            row_prefix = None if prefix is None else _row_prefix(prefix, index)
+            for name, field in form._fields.items():
+                vars(field).pop("errors", None)
+                if row_prefix is not None:
+                    field.name = row_prefix + field.short_name
+                    if name not in own_ids:
+                        field.id = field.name
+        if validate:
+            form.validate()
+        html = {}
+        for name, field in form._fields.items():
+            template = templates[name]
+            if template is None:
+                field_html = field(**render_kw.get(name, {}))
+            else:
+                field_html = _fill_row_template(template, field)
+            html[name] = _decorate(field, field_html, False, errors)
+        yield html
@@ -0,0 +1,161 @@
+# pylama:ignore=C0111
+"""
+Tests for the :mod:`wtforms_html5.bulk` module.
+
+"""
+
+import random
+from decimal import Decimal
+
+import pytest
+from wtforms import DecimalField
+from wtforms import FloatField
+from wtforms import Form
+from wtforms import IntegerField
+from wtforms import StringField
+from wtforms.validators import DataRequired
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+from wtforms.validators import Optional
+
+from wtforms_html5.bulk import check_column_numpy
+from wtforms_html5.bulk import check_records
+from wtforms_html5.bulk import iter_check_records
+from wtforms_html5.precheck import get_precheck_plan
+from wtforms_html5.precheck import precheck
+
+from . import MultiDict
+
+
+class BulkForm(Form):
+    name = StringField(validators=[InputRequired(), Length(min=2, max=8)])
+    nick = StringField(validators=[DataRequired(), Length(max=4)])
+    bio = StringField(validators=[Optional(), Length(min=3)])
+    raw = StringField(validators=[Optional(strip_whitespace=False), Length(max=2)])
+    age = IntegerField(validators=[InputRequired(), NumberRange(min=0, max=130)])
+    size = FloatField(validators=[Optional(), NumberRange(min=0.5)])
+    price = DecimalField(validators=[NumberRange(max=Decimal("9.5"))])
+    count = IntegerField(default=3, validators=[DataRequired()])
+    title = StringField(default="abc", validators=[DataRequired(), Length(max=2)])
+
+
+VALUES = [
+    None,
+    "",
+    " ",
+    "  a ",
+    "x",
+    "Joe",
+    "a" * 20,
+    "0",
+    "-1",
+    "30",
+    "200",
+    "1.5",
+    "0.1",
+    "9.6",
+    "nan",
+    "NaN",
+    "inf",
+    "1e3",
+    "9" * 30,
+    7,
+    0.2,
+]
+
+
+VALID = {
+    "name": "Joe",
+    "nick": "jo",
+    "bio": "abcd",
+    "raw": "ab",
+    "age": "30",
+    "size": 1.5,
+    "price": "1",
+    "count": "3",
+    "title": "ab",
+}
+
+
+def make_records(n, seed=42):
+    rng = random.Random(seed)
+    records = []
+    for _ in range(n):
+        record = dict(VALID)
+        for name in rng.sample(list(VALID), rng.randrange(3)):
+            record[name] = rng.choice(VALUES)
+            if record[name] is None and rng.random() < 0.5:
+                del record[name]
+        records.append(record)
+    return records
+
+
+def to_formdata(record):
+    return MultiDict(
+        {
+            name: value if isinstance(value, str) else str(value)
+            for name, value in record.items()
+            if value is not None
+        }
+    )
+
+
+RECORDS = make_records(500)
+
+
+@pytest.mark.skipif(MultiDict is None, reason="needs Werkzeug")
+def test_python_matches_precheck():
+    res = check_records(BulkForm, RECORDS, use_numpy=False)
+    assert list(res.fields) == list(BulkForm()._fields)
+    for i, record in enumerate(RECORDS):
+        exp = precheck(BulkForm, to_formdata(record))
+        failed = {name for name, mask in res.fields.items() if mask[i]}
+        assert failed == set(exp), record
+    assert 0 < sum(res.invalid) < len(RECORDS)
+
+
+def test_numpy_matches_python():
+    pytest.importorskip("numpy")
+    exp = check_records(BulkForm, RECORDS, use_numpy=False)
+    res = check_records(BulkForm, RECORDS, use_numpy=True)
+    assert list(res.fields) == list(exp.fields)
+    for name, mask in res.fields.items():
+        assert mask.tolist() == exp.fields[name], name
+    assert res.invalid.tolist() == exp.invalid
+    # no column fell back to the pure Python checks
+    for entry in get_precheck_plan(BulkForm):
+        values = [record.get(entry[0]) for record in RECORDS]
+        assert check_column_numpy(entry, values).tolist() == exp.fields[entry[0]]
+
+
+@pytest.mark.skipif(MultiDict is None, reason="needs Werkzeug")
+@pytest.mark.parametrize("use_numpy", [False, True], ids=["python", "numpy"])
+def test_flagged_rows_fail_validation(use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    res = check_records(BulkForm, RECORDS[:200], use_numpy=use_numpy)
+    for i in res.invalid_rows():
+        assert BulkForm(to_formdata(RECORDS[i])).validate() is False
+
+
+def test_iter_check_records():
+    batches = list(iter_check_records(BulkForm, iter(RECORDS), batch_size=200))
+    assert [(batch.start, len(batch)) for batch in batches] == [
+        (0, 200),
+        (200, 200),
+        (400, 100),
+    ]
+    res = check_records(BulkForm, RECORDS)
+    exp = [i for batch in batches for i in batch.invalid_rows()]
+    assert exp == res.invalid_rows()
+
+
+def test_no_checked_fields():
+    class OtherForm(Form):
+        name = StringField()
+
+    res = check_records(OtherForm, [{"name": "x"}, {}], use_numpy=False)
+    assert res.fields == {}
+    assert res.invalid == [False, False]
+    assert res.invalid_rows() == []
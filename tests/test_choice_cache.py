@@ -0,0 +1,187 @@
+# pylama:ignore=C0111
+"""
+Tests for the `html5_choice_cache` option of :cls:`wtforms_html5.AutoAttrMeta`
+and :func:`wtforms_html5.render_choices`.
+
+"""
+
+import pytest
+from wtforms import Form
+from wtforms import RadioField
+from wtforms import SelectField
+from wtforms import SelectMultipleField
+from wtforms import StringField
+from wtforms.validators import InputRequired
+from wtforms.widgets import ListWidget
+from wtforms.widgets import Select
+
+import wtforms_html5
+from wtforms_html5 import CHOICE_CACHE_SIZE
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import invalidate
+from wtforms_html5 import render_choices
+
+from . import MultiDict
+
+COUNTRIES = [(f"c{i}", f"Country <{i}>") for i in range(50)]
+
+
+def make_form_class(choice_cache):
+    class ChoiceForm(Form):
+        class Meta(AutoAttrMeta):
+            html5_choice_cache = choice_cache
+
+        country = SelectField(
+            choices=COUNTRIES,
+            validators=[InputRequired()],
+            description="Where?",
+        )
+        grouped = SelectField(
+            choices={"A & B": [("a", "A"), ("b", "B")], "C": [("c", "C"), ("d", "D")]},
+        )
+        number = SelectField(choices=[(1, "One"), (2, "Two")], coerce=int)
+        tags = SelectMultipleField(choices=["x", "y", "z"])
+        size = RadioField(
+            choices=[("s", "Small"), ("m", "Medium"), ("l", "<Large>")],
+            validators=[InputRequired()],
+            render_kw={"class": "size"},
+        )
+        styled = SelectField(choices=[("a", "A", {"class": "first"}), ("b", "B")])
+        name = StringField()
+
+    return ChoiceForm
+
+
+CachedForm = make_form_class(True)
+PlainForm = make_form_class(False)
+
+FORM_DATA = [
+    None,
+    {"country": "c7", "grouped": "d", "number": "2", "tags": ["x", "z"]},
+    {"country": "nope", "size": "l", "styled": "a"},
+]
+
+RENDER_KW = [{}, {"class_": "extra"}, {"required": False, "data_x": "1"}]
+
+
+@pytest.mark.parametrize("form_data", FORM_DATA)
+@pytest.mark.parametrize("render_kw", RENDER_KW)
+def test_output_identical(form_data, render_kw):
+    if form_data is not None and MultiDict is None:
+        pytest.skip("This test requires `MultiDict` from `Werkzeug`.")
+    formdata = MultiDict(form_data) if form_data is not None else None
+    cached = CachedForm(formdata)
+    plain = PlainForm(formdata)
+    if formdata is not None:
+        cached.validate()
+        plain.validate()
+    for _ in range(2):  # cold and warm cache
+        for field in cached:
+            assert field(**render_kw) == plain[field.name](**render_kw)
+
+
+def test_outer_tag_keeps_html5_keys():
+    form = CachedForm(MultiDict({"country": "nope"}) if MultiDict else None)
+    form.validate()
+    html = form.country()
+    assert html.startswith('<select class="invalid" id="country" name="country"')
+    assert "required" in html.split(">", 1)[0]
+    assert 'title="Where?"' in html
+
+
+def test_only_selected_changes():
+    form = CachedForm(data={"country": "c3"})
+    form.country()
+    entries = len(wtforms_html5._CHOICE_CACHE)
+    form.country.data = "c4"
+    html = form.country()
+    assert len(wtforms_html5._CHOICE_CACHE) == entries
+    assert '<option selected value="c4">' in html
+    assert html.count("selected") == 1
+
+
+def test_changed_choices():
+    form = CachedForm()
+    form.country.choices = list(COUNTRIES)
+    form.country.choices.append(("new", "New"))
+    assert '<option value="new">New</option>' in form.country()
+    form.country.choices.pop()
+    assert "new" not in form.country()
+
+
+def test_equal_values_of_other_types():
+    def render(choices, coerce):
+        class NumberForm(Form):
+            class Meta(AutoAttrMeta):
+                html5_choice_cache = True
+
+            number = SelectField(choices=choices, coerce=coerce)
+
+        return NumberForm().number()
+
+    assert 'value="1.0"' in render([(1.0, "One")], str)
+    html = render([(1, "One")], str)
+    assert 'value="1"' in html
+    assert "1.0" not in html
+    assert 'value="True"' in render([(True, "One")], str)
+
+
+def test_radio_key_includes_field():
+    form = CachedForm(data={"size": "m"})
+    form.size()
+    form.size.render_kw = {"class": "other"}
+    form.size.id = "size2"
+    assert form.size() == (
+        '<ul class="other" id="size2" required>'
+        '<li><input class="other" id="size2-0" name="size" required type="radio" '
+        'value="s"> <label for="size2-0">Small</label></li>'
+        '<li><input checked class="other" id="size2-1" name="size" required '
+        'type="radio" value="m"> <label for="size2-1">Medium</label></li>'
+        '<li><input class="other" id="size2-2" name="size" required type="radio" '
+        'value="l"> <label for="size2-2">&lt;Large&gt;</label></li></ul>'
+    )
+
+
+def test_unhashable_choices():
+    form = CachedForm(data={"styled": "b"})
+    assert render_choices(form.styled.widget, form.styled, {}) is None
+    assert form.styled() == PlainForm(data={"styled": "b"}).styled()
+
+
+def test_unhashable_data():
+    form = CachedForm()
+    form.country.data = ["c1"]
+    assert render_choices(form.country.widget, form.country, {}) is None
+
+
+def test_unsupported():
+    class CustomSelect(Select):
+        def __call__(self, field, **kwargs):
+            return "custom"
+
+    class CustomField(SelectField):
+        def iter_choices(self):
+            return super().iter_choices()
+
+    class CustomForm(CachedForm):
+        custom = CustomField(choices=["a"])
+
+    form = CustomForm()
+    assert render_choices(CustomSelect(), form.country, {}) is None
+    assert render_choices(ListWidget(), form.name, {}) is None
+    assert render_choices(form.custom.widget, form.custom, {}) is None
+
+
+def test_cache_is_bounded():
+    form = CachedForm()
+    for i in range(CHOICE_CACHE_SIZE + 10):
+        form.number.choices = [(1, str(i))]
+        form.number()
+    assert len(wtforms_html5._CHOICE_CACHE) <= CHOICE_CACHE_SIZE
+
+
+def test_invalidate_clears_cache():
+    form = CachedForm()
+    form.country()
+    invalidate(form)
+    assert wtforms_html5._CHOICE_CACHE == {}
@@ -0,0 +1,160 @@
+# pylama:ignore=C0111
+"""
+Tests for the `html5_codegen` option of :cls:`wtforms_html5.AutoAttrMeta` and
+:func:`wtforms_html5.compile_render_kw`.
+
+"""
+
+import pytest
+from wtforms import FieldList
+from wtforms import Form
+from wtforms import IntegerField
+from wtforms import StringField
+from wtforms.validators import DataRequired
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+from wtforms.validators import Optional
+from wtforms.validators import Regexp
+
+import wtforms_html5
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import get_html5_kwargs
+from wtforms_html5 import invalidate
+
+
+class LazyString:
+    def __init__(self, text):
+        self.text = text
+
+    def __str__(self):
+        return self.text
+
+    def __bool__(self):
+        return bool(self.text)
+
+
+VALIDATORS = {
+    "none": list,
+    "required": lambda: [InputRequired()],
+    "length": lambda: [Length(min=2, max=5)],
+    "range": lambda: [NumberRange(min=1, max=9)],
+    "mixed": lambda: [DataRequired(), Length(max=3)],
+    "regexp": lambda: [Optional(), Regexp(r"\d+")],
+}
+
+DESCRIPTIONS = {
+    "empty": lambda: "",
+    "str": lambda: "Some help",
+    "lazy": lambda: LazyString("Lazy help"),
+}
+
+RENDER_KW = [
+    {},
+    {"class_": "x"},
+    {"class": "y", "title": "T", "maxlength": 1},
+]
+
+FIELD_KW = [None, {"placeholder": "p", "class": "f"}]
+
+
+def make_form_class(codegen, validators=(), **kwargs):
+    class Meta(AutoAttrMeta):
+        html5_codegen = codegen
+
+    return type(
+        "CodegenForm",
+        (Form,),
+        {"Meta": Meta, "name": StringField(validators=list(validators), **kwargs)},
+    )
+
+
+def expected_kwargs(field, render_kw):
+    """
+    Returns the render keywords of the `get_html5_kwargs` path, with the
+    keywords of the field layered below the ones of the call.
+
+    """
+    return get_html5_kwargs(field, {**(field.render_kw or {}), **render_kw})
+
+
+@pytest.mark.parametrize("errors", [False, True])
+@pytest.mark.parametrize("field_kw", FIELD_KW)
+@pytest.mark.parametrize("render_kw", RENDER_KW)
+@pytest.mark.parametrize("description", list(DESCRIPTIONS))
+@pytest.mark.parametrize("validators", list(VALIDATORS))
+def test_equivalence(validators, description, render_kw, field_kw, errors):
+    form_class = make_form_class(
+        True,
+        VALIDATORS[validators](),
+        description=DESCRIPTIONS[description](),
+        render_kw=field_kw,
+    )
+    form = form_class()
+    if errors:
+        form.name.errors = ["bad"]
+    field = form.name
+    res = field.meta.get_render_kw(field, dict(render_kw))
+    assert res == expected_kwargs(field, render_kw)
+    plain_form = make_form_class(False)()
+    plain_field = plain_form.name
+    for name in ("validators", "description", "render_kw", "flags", "errors"):
+        setattr(plain_field, name, getattr(field, name))
+    assert field(**render_kw) == plain_field(**render_kw)
+
+
+def test_compiled_once_per_class(monkeypatch):
+    calls = []
+    orig = wtforms_html5.compile_render_kw
+
+    def counting(plan, field):
+        calls.append(field.name)
+        return orig(plan, field)
+
+    monkeypatch.setattr(wtforms_html5, "compile_render_kw", counting)
+
+    class ListForm(Form):
+        class Meta(AutoAttrMeta):
+            html5_codegen = True
+
+        name = StringField(validators=[Length(max=5)])
+        items = FieldList(IntegerField(validators=[NumberRange(max=9)]), min_entries=3)
+
+    form1 = ListForm()
+    form2 = ListForm()
+    assert calls == ["name", "items", "items-0"]
+    assert form1.name._html5_codegen is form2.name._html5_codegen
+    assert form2.items[2]() == (
+        '<input id="items-2" max="9" name="items-2" type="number" value="">'
+    )
+
+
+def test_not_compiled_by_default():
+    form = make_form_class(False, [Length(max=5)])()
+    assert not hasattr(form.name, "_html5_codegen")
+
+
+def test_changed_validators_fall_back():
+    form = make_form_class(True, [Length(max=5)])()
+    form.name.validators = [Length(max=3)]
+    assert 'maxlength="3"' in form.name()
+    form.name.validators.append(InputRequired())
+    form.name.flags.required = True
+    assert form.name.meta.get_render_kw(form.name, {}) == {
+        "maxlength": 3,
+        "required": True,
+    }
+
+
+def test_changed_description_falls_back():
+    form = make_form_class(True, description="Old")()
+    form.name.description = "New"
+    assert 'title="New"' in form.name()
+
+
+def test_invalidate():
+    form = make_form_class(True, [Length(max=5)])()
+    form.name.validators[0].max = 2
+    invalidate(form.name)
+    assert 'maxlength="2"' in form.name()
+    assert not hasattr(form.name, "_html5_codegen")
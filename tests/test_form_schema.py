@@ -0,0 +1,109 @@
+# pylama:ignore=C0111
+"""
+Tests for the :func:`wtforms_html5.get_form_schema` function and friends.
+
+"""
+
+import json
+from decimal import Decimal
+
+from wtforms import DecimalField
+from wtforms import FieldList
+from wtforms import Form
+from wtforms import FormField
+from wtforms import IntegerField
+from wtforms import StringField
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+
+import wtforms_html5
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import get_form_schema
+from wtforms_html5 import get_form_schema_etag
+from wtforms_html5 import get_form_schema_json
+
+
+class RowForm(Form):
+    sku = StringField(validators=[InputRequired(), Length(min=2, max=8)])
+
+
+class SchemaForm(Form):
+    class Meta(AutoAttrMeta):
+        pass
+
+    name = StringField(validators=[Length(max=12)], description="Your name")
+    age = IntegerField(validators=[NumberRange(min=0, max=130)])
+    price = DecimalField(validators=[NumberRange(min=Decimal("0.5"))])
+    tags = FieldList(StringField(validators=[Length(max=4)]), max_entries=3)
+    rows = FieldList(FormField(RowForm), min_entries=1)
+
+
+def make_form_class(max_length):
+    class OtherForm(Form):
+        name = StringField(validators=[Length(max=max_length)])
+
+    return OtherForm
+
+
+def test_schema():
+    res = get_form_schema(SchemaForm)
+    exp = {
+        "fields": {
+            "name": {"maxlength": 12, "title": "Your name"},
+            "age": {"min": 0, "max": 130},
+            "price": {"min": "0.5"},
+            "tags": {
+                "min_entries": 0,
+                "max_entries": 3,
+                "entry": {"maxlength": 4},
+            },
+            "rows": {
+                "min_entries": 1,
+                "max_entries": None,
+                "entry": {
+                    "fields": {
+                        "sku": {"required": True, "minlength": 2, "maxlength": 8},
+                    },
+                },
+            },
+        },
+    }
+    assert res == exp
+    assert json.loads(get_form_schema_json(SchemaForm)) == exp
+
+
+def test_schema_matches_render():
+    form = SchemaForm()
+    assert 'maxlength="12"' in form.name()
+    assert 'max="130"' in form.age()
+    assert 'min="0.5"' in form.price()
+
+
+def test_schema_cached(monkeypatch):
+    schema = get_form_schema(SchemaForm)
+    form = SchemaForm()
+
+    def fail(field):
+        raise AssertionError("schema computed again")
+
+    monkeypatch.setattr(wtforms_html5, "get_html5_plan", fail)
+    assert get_form_schema(SchemaForm) is schema
+    assert get_form_schema(form) is schema
+
+
+def test_schema_not_inherited():
+    class SubForm(SchemaForm):
+        extra = StringField(validators=[InputRequired()])
+
+    get_form_schema(SchemaForm)
+    res = get_form_schema(SubForm)
+    assert "extra" in res["fields"]
+    assert "extra" not in get_form_schema(SchemaForm)["fields"]
+
+
+def test_etag_stable():
+    etag = get_form_schema_etag(make_form_class(5))
+    assert etag == get_form_schema_etag(make_form_class(5))
+    assert etag != get_form_schema_etag(make_form_class(6))
+    assert etag.startswith('"') and etag.endswith('"')
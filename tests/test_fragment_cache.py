@@ -0,0 +1,147 @@
+# pylama:ignore=C0111
+"""
+Tests for the opt-in fragment cache of :cls:`wtforms_html5.AutoAttrMeta`.
+
+"""
+
+import pytest
+from wtforms import BooleanField
+from wtforms import EmailField
+from wtforms import Form
+from wtforms import HiddenField
+from wtforms import IntegerField
+from wtforms import IntegerRangeField
+from wtforms import PasswordField
+from wtforms import RadioField
+from wtforms import StringField
+from wtforms import TextAreaField
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+from wtforms.widgets import NumberInput
+from wtforms.widgets import TextInput
+
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import render_input
+from wtforms_html5._widgets import _cached_fragment
+
+from . import MultiDict
+
+
+def make_form_class(fragment_cache):
+    class TestForm(Form):
+        class Meta(AutoAttrMeta):
+            html5_fragment_cache = fragment_cache
+
+        name = StringField(
+            validators=[InputRequired(), Length(min=2, max=8)],
+            description='Say "hi" & <bye>',
+            render_kw={"class": "name", "data_foo": "bar"},
+        )
+        age = IntegerField(validators=[NumberRange(min=0, max=150)])
+        agree = BooleanField(validators=[InputRequired()])
+        email = EmailField()
+        hidden = HiddenField(default="<secret>")
+        secret = PasswordField(validators=[Length(max=3)])
+        text = TextAreaField(validators=[Length(max=30)])
+        step = IntegerField(widget=NumberInput(step=5, min=0))
+        rating = IntegerRangeField(validators=[NumberRange(min=1, max=5)])
+        choice = RadioField(choices=[("a", "A"), ("b", "B & C")])
+
+    return TestForm
+
+
+CachedForm = make_form_class(True)
+PlainForm = make_form_class(False)
+
+FORM_DATA = [
+    None,
+    {"name": "x", "age": "200", "email": "a@b", "choice": "b"},
+    {"name": "good", "age": "20", "agree": "y", "text": '"quoted"'},
+]
+
+RENDER_KW = [
+    {},
+    {"class_": "extra"},
+    {"class": "extra", "value": "fixed"},
+    {"required": False, "title": "Own title", "data_list": "1"},
+    {"checked": True, "readonly": True},
+]
+
+
+def render_all(form, render_kw):
+    html = [field(**render_kw) for field in form]
+    html.extend(opt(**render_kw) for opt in form.choice)
+    return html
+
+
+@pytest.mark.parametrize("form_data", FORM_DATA)
+@pytest.mark.parametrize("render_kw", RENDER_KW)
+def test_output_identical(form_data, render_kw):
+    if form_data is not None and MultiDict is None:
+        pytest.skip("This test requires `MultiDict` from `Werkzeug`.")
+    formdata = MultiDict(form_data) if form_data is not None else None
+    cached = CachedForm(formdata)
+    plain = PlainForm(formdata)
+    if formdata is not None:
+        cached.validate()
+        plain.validate()
+    for _ in range(2):  # cold and warm cache
+        assert render_all(cached, render_kw) == render_all(plain, render_kw)
+
+
+def test_cache_is_used():
+    form = CachedForm()
+    form.name()
+    before = _cached_fragment.cache_info()
+    form.name()
+    after = _cached_fragment.cache_info()
+    assert after.hits == before.hits + 1
+    assert after.misses == before.misses
+
+
+def test_report():
+    form = CachedForm()
+    reports = []
+    for _ in range(2):
+        render_kw = {"data_x": "report"}
+        render_input(form.name.widget, form.name, render_kw, reports.append)
+    render_input(form.name.widget, form.name, {"data_x": ["a"]}, reports.append)
+    assert reports == [False, True]
+
+
+def test_cache_is_bounded():
+    assert _cached_fragment.cache_info().maxsize is not None
+
+
+def test_unhashable_value():
+    form = CachedForm()
+    exp = PlainForm().name(data_list=["a"])
+    assert form.name(data_list=["a"]) == exp
+
+
+def test_equal_values_of_other_types():
+    def render(minimum, **render_kw):
+        class NumberForm(Form):
+            class Meta(AutoAttrMeta):
+                html5_fragment_cache = True
+
+            number = IntegerField(validators=[NumberRange(min=minimum)])
+
+        return NumberForm().number(**render_kw)
+
+    assert 'min="1.0"' in render(1.0)
+    assert 'min="1"' in render(1)
+    assert "data-on " in render(1, data_on=True)
+    assert 'data-on="1"' in render(1, data_on=1)
+
+
+def test_unsupported_widget():
+    form = CachedForm()
+    assert render_input(form.secret.widget, form.secret, {}) is None
+    assert render_input(form.text.widget, form.text, {}) is None
+
+
+def test_name_keyword_not_supported():
+    form = CachedForm()
+    assert render_input(TextInput(), form.name, {"name": "x"}) is None
@@ -0,0 +1,61 @@
+# pylama:ignore=C0111
+"""
+Tests for the :func:`wtforms_html5.get_form_html5_kwargs` function.
+
+"""
+
+import pytest
+from wtforms import Form
+from wtforms import IntegerField
+from wtforms import StringField
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import get_form_html5_kwargs
+from wtforms_html5 import get_html5_kwargs
+
+
+class PlainForm(Form):
+    name = StringField(validators=[InputRequired(), Length(max=8)])
+    age = IntegerField(validators=[NumberRange(min=0)], description="Age")
+    note = StringField()
+
+
+class MetaForm(PlainForm):
+    class Meta(AutoAttrMeta):
+        pass
+
+
+@pytest.fixture(params=[PlainForm, MetaForm])
+def form(request):
+    return request.param()
+
+
+def test_all_fields(form):
+    res = get_form_html5_kwargs(form)
+    exp = {
+        "name": {"required": True, "maxlength": 8},
+        "age": {"min": 0, "title": "Age"},
+        "note": {},
+    }
+    assert res == exp
+
+
+def test_same_as_single_field(form):
+    form.validate()
+    render_kw = {"name": {"class": "x", "maxlength": 3}, "age": {"min": 5}}
+    for force in (False, True):
+        res = get_form_html5_kwargs(form, render_kw, force)
+        for name, field in form._fields.items():
+            exp = get_html5_kwargs(field, render_kw.get(name), force)
+            assert res[name] == exp
+
+
+def test_render_kw_not_changed(form):
+    render_kw = {"name": {"class": "x"}}
+    form.validate()
+    res = get_form_html5_kwargs(form, render_kw)
+    assert res["name"]["class"] == "invalid x"
+    assert render_kw == {"name": {"class": "x"}}
@@ -9,6 +9,7 @@ from wtforms import StringField
 from wtforms.validators import DataRequired
 from wtforms.validators import InputRequired
 from wtforms.validators import Length
+from wtforms.validators import Optional
 
 from wtforms_html5 import get_html5_kwargs
 
@@ -258,3 +259,47 @@ def test_minmaxlength_validator(minmaxlength_validator, kwargs, exp):
     form = get_form(validators=[minmaxlength_validator(**kwargs)])
     res = get_html5_kwargs(form.test_field, render_kw)
     assert res == exp_render_kw
+
+
+# PRECEDENCE
+
+
+@pytest.mark.parametrize("use_meta", [False, True], ids=["plain", "meta"])
+def test_first_validator_wins(use_meta):
+    form = get_form(
+        use_meta=use_meta,
+        validators=[Length(min=1, max=5), Length(min=2, max=9)],
+    )
+    res = get_html5_kwargs(form.test_field)
+    assert res == {"minlength": 1, "maxlength": 5}
+
+
+@pytest.mark.parametrize("use_meta", [False, True], ids=["plain", "meta"])
+def test_force_last_validator_wins(use_meta):
+    form = get_form(
+        use_meta=use_meta,
+        validators=[Length(min=1, max=5), Length(min=2, max=9)],
+    )
+    res = get_html5_kwargs(form.test_field, {"maxlength": 3}, force=True)
+    assert res == {"minlength": 2, "maxlength": 9}
+
+
+# CHANGED FIELDS
+
+
+def test_changed_bound_field():
+    form = get_form(
+        use_meta=True,
+        description="old",
+        validators=[DataRequired(), Length(max=5)],
+    )
+    field = form.test_field
+    field.validators = [Optional(), Length(max=3)]
+    field.flags.required = False
+    field.description = "new"
+    exp = {"maxlength": 3, "title": "new"}
+    assert get_html5_kwargs(field) == exp
+    html = field()
+    assert 'maxlength="3"' in html
+    assert 'title="new"' in html
+    assert "required" not in html
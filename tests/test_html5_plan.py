@@ -0,0 +1,286 @@
+# pylama:ignore=C0111
+"""
+Tests for the :func:`wtforms_html5.get_html5_plan` function and the plan
+caching done by :cls:`wtforms_html5.AutoAttrMeta`.
+
+"""
+
+import tracemalloc
+
+import pytest
+from wtforms import FieldList
+from wtforms import Form
+from wtforms import FormField
+from wtforms import IntegerField
+from wtforms import StringField
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+
+import wtforms_html5
+from wtforms_html5 import AttrPlan
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import apply_html5_plan
+from wtforms_html5 import get_current_plan
+from wtforms_html5 import get_html5_kwargs
+from wtforms_html5 import get_html5_plan
+
+from . import get_form
+
+
+class LazyString:
+    def __init__(self, text):
+        self.text = text
+
+    def __str__(self):
+        return self.text
+
+    def __bool__(self):
+        return bool(self.text)
+
+
+# PLAN
+
+
+def test_plan_empty():
+    form = get_form()
+    assert get_html5_plan(form.test_field) == {}
+
+
+def test_plan_static_keys():
+    form = get_form(
+        validators=[
+            InputRequired(),
+            Length(min=2, max=8),
+            NumberRange(min=1),
+        ],
+        description="Some help text",
+    )
+    res = get_html5_plan(form.test_field)
+    exp = {
+        "required": True,
+        "minlength": 2,
+        "maxlength": 8,
+        "min": 1,
+        "title": "Some help text",
+    }
+    assert res == exp
+
+
+def test_plan_ignores_errors():
+    form = get_form(validators=[InputRequired()])
+    assert form.validate() is False
+    res = get_html5_plan(form.test_field)
+    assert "class" not in res
+
+
+def test_plan_skips_lazy_description():
+    form = get_form(description=LazyString("lazy"))
+    assert get_html5_plan(form.test_field) == {}
+    res = get_html5_kwargs(form.test_field)
+    assert res == {"title": "lazy"}
+
+
+def test_kwargs_without_plan(monkeypatch):
+    form = get_form(validators=[InputRequired(), Length(max=8)], description="d")
+
+    def fail(field):
+        raise AssertionError("plan computed for a plain field")
+
+    monkeypatch.setattr(wtforms_html5, "get_html5_plan", fail)
+    res = get_html5_kwargs(form.test_field, {"title": "x"})
+    assert res == {"required": True, "maxlength": 8, "title": "x"}
+
+
+# APPLY
+
+
+def test_apply_no_overwrite():
+    form = get_form()
+    plan = AttrPlan({"min": 1, "title": "plan"})
+    res = apply_html5_plan(plan, form.test_field, {"min": 5})
+    assert res == {"min": 5, "title": "plan"}
+
+
+def test_apply_force():
+    form = get_form()
+    plan = AttrPlan({"min": 1, "title": "plan"})
+    res = apply_html5_plan(plan, form.test_field, {"min": 5, "title": "x"}, True)
+    assert res == {"min": 1, "title": "x"}
+
+
+def test_apply_does_not_change_plan():
+    form = get_form(validators=[InputRequired()])
+    assert form.validate() is False
+    plan = AttrPlan({"required": True})
+    apply_html5_plan(plan, form.test_field, {"class": "foo"})
+    assert plan == {"required": True}
+
+
+# CACHING
+
+
+class PlanForm(Form):
+    class Meta(AutoAttrMeta):
+        pass
+
+    name = StringField(validators=[Length(max=12)], description="Name")
+
+
+def test_plan_shared_between_instances():
+    form1 = PlanForm()
+    form2 = PlanForm()
+    assert form1.name._html5_plan is form2.name._html5_plan
+    assert form1.name._html5_plan == {"maxlength": 12, "title": "Name"}
+
+
+def test_current_plan():
+    form = PlanForm()
+    plan = form.name._html5_plan
+    assert get_current_plan(form.name) is plan
+    form.name.validators = [Length(max=3)]
+    assert get_current_plan(form.name) == {"maxlength": 3, "title": "Name"}
+    assert form.name._html5_plan is plan
+    assert get_current_plan(get_form().test_field) == {}
+
+
+def test_cached_render_matches_uncached():
+    form = PlanForm()
+    exp = form.name.widget(
+        form.name,
+        **get_html5_kwargs(form.name, {"class": "x"}),
+    )
+    assert form.name(class_="x") == exp
+    assert form.name(**{"class": "x"}) == exp
+
+
+class RowForm(Form):
+    class Meta(AutoAttrMeta):
+        pass
+
+    sku = StringField(validators=[Length(max=8)])
+
+
+class ListForm(Form):
+    class Meta(AutoAttrMeta):
+        pass
+
+    tags = FieldList(StringField(validators=[Length(max=64)]), min_entries=3)
+    rows = FieldList(FormField(RowForm), min_entries=3)
+    matrix = FieldList(
+        FieldList(IntegerField(validators=[NumberRange(max=9)]), min_entries=2),
+        min_entries=2,
+    )
+
+
+def test_fieldlist_entries_share_plan():
+    form1 = ListForm()
+    form2 = ListForm()
+    form2.tags.append_entry()
+    plans = {id(entry._html5_plan) for entry in [*form1.tags, *form2.tags]}
+    assert len(plans) == 1
+    assert form1.tags[0]._html5_plan == {"maxlength": 64}
+    assert form2.tags[3]() == (
+        '<input id="tags-3" maxlength="64" name="tags-3" type="text" value="">'
+    )
+
+
+def test_fieldlist_plan_computed_once(monkeypatch):
+    calls = []
+    orig = wtforms_html5.get_html5_plan
+
+    def counting(field):
+        calls.append(field.name)
+        return orig(field)
+
+    monkeypatch.setattr(wtforms_html5, "get_html5_plan", counting)
+
+    class CountForm(Form):
+        class Meta(AutoAttrMeta):
+            pass
+
+        tags = FieldList(StringField(validators=[Length(max=2)]), min_entries=5)
+
+    CountForm()
+    CountForm()
+    assert calls == ["tags", "tags-0"]
+
+
+def test_nested_fieldlist_entries_share_plan():
+    form = ListForm()
+    plans = {id(cell._html5_plan) for row in form.matrix for cell in row}
+    assert len(plans) == 1
+    assert form.matrix[1][1]._html5_plan == {"max": 9}
+
+
+def test_formfield_entries_share_plan():
+    form = ListForm()
+    plans = {id(row.sku._html5_plan) for row in form.rows}
+    assert len(plans) == 1
+    assert plans == {id(RowForm().sku._html5_plan)}
+
+
+# ATTR PLAN
+
+
+def test_attr_plan_mapping():
+    plan = AttrPlan({"required": True, "maxlength": 5})
+    assert plan == {"required": True, "maxlength": 5}
+    assert plan["maxlength"] == 5
+    assert "required" in plan
+    assert "min" not in plan
+    assert list(plan) == ["required", "maxlength"]
+    assert len(plan) == 2
+    with pytest.raises(KeyError):
+        plan["min"]
+
+
+def test_attr_plan_as_dict():
+    plan = AttrPlan({"min": 1})
+    res = plan.as_dict()
+    res["min"] = 2
+    assert plan["min"] == 1
+
+
+def test_attr_plan_shares_keys():
+    # the key is joined at runtime, so it isn't interned by the compiler
+    key = "".join(["m", "in"])  # noqa: FLY002
+    plan1 = AttrPlan({"min": 1, "max": 3})
+    plan2 = AttrPlan({key: 2, "max": 4})
+    assert plan1._keys is plan2._keys
+
+
+def test_attr_plan_hash_ignores_order():
+    plan1 = AttrPlan({"min": 1, "max": 2})
+    plan2 = AttrPlan({"max": 2, "min": 1})
+    assert plan1 == plan2
+    assert hash(plan1) == hash(plan2)
+    assert len({plan1, plan2}) == 1
+
+
+def test_attr_plan_no_dict():
+    plan = AttrPlan()
+    assert not hasattr(plan, "__dict__")
+    assert plan == {}
+
+
+def test_attr_plan_smaller_than_dict():
+    attrs = [
+        {"required": True, "minlength": i, "maxlength": i + 8, "title": f"T{i}"}
+        for i in range(1000)
+    ]
+
+    def measure(factory):
+        tracemalloc.start()
+        try:
+            base = tracemalloc.get_traced_memory()[0]
+            res = [factory(a) for a in attrs]
+            used = tracemalloc.get_traced_memory()[0] - base
+        finally:
+            tracemalloc.stop()
+        assert len(res) == len(attrs)
+        return used
+
+    dict_size = measure(dict)
+    plan_size = measure(AttrPlan)
+    assert plan_size < 0.75 * dict_size
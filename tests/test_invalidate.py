@@ -0,0 +1,217 @@
+# pylama:ignore=C0111
+"""
+Tests for the plan fingerprints and :func:`wtforms_html5.invalidate`.
+
+"""
+
+import gc
+import weakref
+
+import pytest
+from werkzeug.datastructures import MultiDict
+from wtforms import FieldList
+from wtforms import Form
+from wtforms import FormField
+from wtforms import IntegerField
+from wtforms import StringField
+from wtforms.validators import DataRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+from wtforms.validators import Optional
+
+import wtforms_html5
+from wtforms_html5 import EXTRACTOR_CACHE_SIZE
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import get_extractor
+from wtforms_html5 import get_form_schema
+from wtforms_html5 import invalidate
+from wtforms_html5 import is_plan_current
+from wtforms_html5.precheck import precheck
+
+
+def make_form_class():
+    class RowForm(Form):
+        class Meta(AutoAttrMeta):
+            pass
+
+        sku = StringField(validators=[Length(max=8)])
+
+    class TenantForm(Form):
+        class Meta(AutoAttrMeta):
+            pass
+
+        name = StringField(validators=[Length(max=12)], description="Name")
+        age = IntegerField(validators=[NumberRange(max=99)])
+        tags = FieldList(StringField(validators=[Length(max=4)]), min_entries=2)
+        row = FormField(RowForm)
+
+    return TenantForm
+
+
+# FINGERPRINTS
+
+
+def test_validators_replaced():
+    form = make_form_class()()
+    form.name.validators = [Length(max=5)]
+    assert 'maxlength="5"' in form.name()
+
+
+def test_validators_appended():
+    form = make_form_class()()
+    form.name.validators = list(form.name.validators)
+    form.name.validators.append(NumberRange(min=1))
+    assert 'min="1"' in form.name()
+    form.name.validators.pop()
+    assert "min=" not in form.name()
+
+
+def test_description_changed():
+    form = make_form_class()()
+    form.name.description = "Full name"
+    assert 'title="Full name"' in form.name()
+
+
+def test_required_flag_changed():
+    form = make_form_class()()
+    form.name.flags.required = True
+    assert "required" in form.name()
+
+
+def test_changes_stay_on_instance():
+    form_class = make_form_class()
+    form1 = form_class()
+    form1.name.validators = [Length(max=5)]
+    assert 'maxlength="5"' in form1.name()
+    form2 = form_class()
+    assert 'maxlength="12"' in form2.name()
+    assert is_plan_current(form2.name._html5_plan, form2.name)
+
+
+def test_stale_plan_falls_back(monkeypatch):
+    form = make_form_class()()
+    plan = form.name._html5_plan
+    form.name.validators = [Length(max=5)]
+    assert not is_plan_current(plan, form.name)
+    calls = []
+    monkeypatch.setattr(wtforms_html5, "get_html5_plan", calls.append)
+    assert 'maxlength="5"' in form.name()
+    assert calls == []
+    assert form.name._html5_plan is plan
+
+
+def test_bound_field_changed():
+    form = make_form_class()()
+    form.name.validators = [Optional(), Length(max=3)]
+    form.name.flags.required = False
+    form.name.description = "new"
+    html = form.name()
+    assert 'maxlength="3"' in html
+    assert 'title="new"' in html
+    assert "required" not in html
+
+
+def test_validator_changed_in_place():
+    form = make_form_class()()
+    form.name.validators[0].max = 5
+    assert 'maxlength="12"' in form.name()
+    invalidate(form.name)
+    assert 'maxlength="5"' in form.name()
+
+
+def test_class_validators_changed():
+    form_class = make_form_class()
+    form_class()
+    form_class.name.kwargs["validators"].append(NumberRange(max=3))
+    form = form_class()
+    assert form.name._html5_plan == {"maxlength": 12, "max": 3, "title": "Name"}
+
+
+def test_class_validators_replaced():
+    form_class = make_form_class()
+    form_class()
+    form_class.name.kwargs["validators"] = [Length(max=3)]
+    form = form_class()
+    assert form.name._html5_plan == {"maxlength": 3, "title": "Name"}
+
+
+def test_class_description_replaced():
+    form_class = make_form_class()
+    form_class()
+    form_class.name.kwargs["description"] = "Full name"
+    form = form_class()
+    assert form.name._html5_plan == {"maxlength": 12, "title": "Full name"}
+
+
+# INVALIDATE
+
+
+def test_invalidate_field():
+    form = make_form_class()()
+    form.name.validators[0].max = 6
+    assert 'maxlength="12"' in form.name()
+    invalidate(form.name)
+    assert 'maxlength="6"' in form.name()
+
+
+def test_invalidate_form():
+    form = make_form_class()()
+    form.tags.entries[1].validators[0].max = 3
+    form.row.sku.validators[0].max = 2
+    invalidate(form)
+    assert form.tags[1]._html5_plan == {"maxlength": 3}
+    assert form.row.sku._html5_plan == {"maxlength": 2}
+
+
+def test_invalidate_unbound_field():
+    form_class = make_form_class()
+    form_class()
+    form_class.tags.args[0].kwargs["validators"][0].max = 2
+    assert form_class().tags[0]._html5_plan == {"maxlength": 4}
+    invalidate(form_class.tags)
+    assert form_class().tags[0]._html5_plan == {"maxlength": 2}
+
+
+def test_invalidate_form_class():
+    form_class = make_form_class()
+    assert get_form_schema(form_class)["fields"]["age"] == {"max": 99}
+    assert precheck(form_class, MultiDict({"age": "50"})) == {}
+    form_class.age.kwargs["validators"][0].max = 10
+    invalidate(form_class)
+    assert form_class().age._html5_plan == {"max": 10}
+    assert get_form_schema(form_class)["fields"]["age"] == {"max": 10}
+    assert precheck(form_class, MultiDict({"age": "50"})) == {"age": ["max"]}
+
+
+def test_class_fields_changed():
+    form_class = make_form_class()
+    assert "email" not in get_form_schema(form_class)["fields"]
+    assert "email" not in precheck(form_class, MultiDict())
+    form_class.email = StringField(validators=[DataRequired()])
+    assert get_form_schema(form_class)["fields"]["email"] == {"required": True}
+    assert precheck(form_class, MultiDict())["email"] == ["required"]
+
+
+def test_invalidate_type_error():
+    with pytest.raises(TypeError):
+        invalidate(object())
+
+
+# MEMORY
+
+
+def test_extractor_cache_bounded():
+    for i in range(EXTRACTOR_CACHE_SIZE + 10):
+        get_extractor(type(f"Validator{i}", (Length,), {}))
+    assert get_extractor.cache_info().currsize <= EXTRACTOR_CACHE_SIZE
+
+
+def test_dynamic_form_class_freed():
+    form_class = make_form_class()
+    form_class().name()
+    get_form_schema(form_class)
+    precheck(form_class, MultiDict())
+    ref = weakref.ref(form_class)
+    del form_class
+    gc.collect()
+    assert ref() is None
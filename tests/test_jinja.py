@@ -0,0 +1,125 @@
+# pylama:ignore=C0111
+"""
+Tests for the :mod:`wtforms_html5.jinja` module.
+
+"""
+
+import pytest
+from markupsafe import Markup
+from wtforms import BooleanField
+from wtforms import Form
+from wtforms import IntegerField
+from wtforms import SelectField
+from wtforms import StringField
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import RenderStats
+from wtforms_html5 import profile
+from wtforms_html5._widgets import _cached_fragment
+
+jinja2 = pytest.importorskip("jinja2")
+
+from wtforms_html5.jinja import HTML5Extension
+
+
+class PlainForm(Form):
+    name = StringField(
+        validators=[InputRequired(), Length(max=12)],
+        description="Your name",
+        render_kw={"class": "name"},
+    )
+    age = IntegerField(validators=[NumberRange(min=0)])
+    agree = BooleanField(default=True)
+    color = SelectField(choices=["red", "green"], validators=[InputRequired()])
+
+
+class MetaForm(PlainForm):
+    class Meta(AutoAttrMeta):
+        pass
+
+
+@pytest.fixture
+def env():
+    return jinja2.Environment(extensions=[HTML5Extension], autoescape=True)
+
+
+def test_filters_registered(env):
+    assert "html5" in env.filters
+    assert "html5_kwargs" in env.filters
+
+
+@pytest.mark.parametrize("validate", [False, True])
+def test_same_as_meta(env, validate):
+    template = env.from_string(
+        '{% for field in form %}{{ field|html5(data_x="<y>") }}\n{% endfor %}'
+    )
+    form = MetaForm()
+    if validate:
+        form.validate()
+    exp = "".join(f"{field(data_x='<y>')}\n" for field in form)
+    assert template.render(form=form) == exp
+    assert template.render(form=form) == exp
+
+
+def test_plain_form(env):
+    template = env.from_string("{{ form.name|html5 }}")
+    form = PlainForm()
+    exp = (
+        '<input class="name" id="name" maxlength="12" name="name" required '
+        'title="Your name" type="text" value="">'
+    )
+    assert template.render(form=form) == exp
+
+
+def test_html5_kwargs(env):
+    template = env.from_string(
+        "{% set kw = form.age|html5_kwargs(max=9) %}{{ kw.min }}-{{ kw.max }}"
+    )
+    assert template.render(form=PlainForm()) == "0-9"
+
+
+def test_meta_options_used(env):
+    stats = RenderStats()
+
+    class StatsForm(PlainForm):
+        class Meta(AutoAttrMeta):
+            html5_stats = stats
+
+            def render_field(self, field, render_kw):
+                return Markup(f"<div>{super().render_field(field, render_kw)}</div>")
+
+    template = env.from_string("{{ form.name|html5 }}")
+    form = StatsForm()
+    assert template.render(form=form) == form.name()
+    assert template.render(form=form).startswith("<div><input ")
+    res = stats.snapshot()["forms"][StatsForm.__qualname__]["name"]
+    assert res["renders"] == 3
+
+
+def test_meta_form_rendered_from_plan(env):
+    template = env.from_string("{{ form.age|html5 }}")
+    form = MetaForm()
+    before = _cached_fragment.cache_info()
+    for _ in range(2):
+        assert template.render(form=form) == form.age()
+    after = _cached_fragment.cache_info()
+    assert after.hits + after.misses == before.hits + before.misses + 2
+
+
+def test_meta_form_profiled(env):
+    template = env.from_string("{{ form.name|html5 }}")
+    form = MetaForm()
+    with profile() as prof:
+        assert template.render(form=form) == form.name()
+    res = prof.snapshot()[MetaForm.__qualname__]["name"]
+    assert res["render_field"]["calls"] == 2
+
+
+def test_plain_form_unchanged(env):
+    template = env.from_string("{{ form.name|html5 }}{{ form.name|html5_kwargs }}")
+    form = PlainForm()
+    template.render(form=form)
+    assert not hasattr(form.name, "_html5_plan")
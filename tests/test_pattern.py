@@ -0,0 +1,152 @@
+# pylama:ignore=C0111
+"""
+Tests for the :func:`wtforms_html5.pattern.translate_pattern` function and
+the `pattern` attribute.
+
+"""
+
+import random
+import re
+
+import pytest
+from wtforms.validators import URL
+from wtforms.validators import Length
+from wtforms.validators import MacAddress
+from wtforms.validators import Regexp
+
+from wtforms_html5 import get_html5_kwargs
+from wtforms_html5 import get_html5_plan
+from wtforms_html5.pattern import translate_pattern
+
+from . import get_form
+
+# ECMAScript syntax (produced by the translation) -> Python syntax
+TO_PYTHON = [
+    (r"\p{L}\p{N}_", r"\w"),
+    (r"\p{White_Space}\x1c-\x1f", r"\s"),
+    (r"\p{Nd}", r"\d"),
+    (r"\P{Nd}", r"\D"),
+    (r"\k<", r"(?P="),
+]
+
+
+def to_python(pattern):
+    for js, py in TO_PYTHON:
+        pattern = pattern.replace(js, py)
+    pattern = re.sub(r"\(\?<(?![=!])", "(?P<", pattern)
+    pattern = re.sub(r"\(\?P=(\w+)>", r"(?P=\1)", pattern)
+    return re.sub(r"\\u\{([0-9a-f]+)\}", lambda m: chr(int(m[1], 16)), pattern)
+
+
+@pytest.mark.parametrize(
+    ("pattern", "flags", "exp"),
+    [
+        (r"^[a-z]+$", 0, r"^[a-z]+$"),
+        (r"[a-z_-]+", 0, r"[a-z_\-]+[\s\S]*"),
+        (r"\d{4}-\d\d$", re.ASCII, r"\d{4}-\d\d$"),
+        (r"\d+\Z", 0, r"\p{Nd}+$"),
+        (
+            r"\w\s\S$",
+            0,
+            (
+                r"[\p{L}\p{N}_][\p{White_Space}\x1c-\x1f]"
+                r"[^\p{White_Space}\x1c-\x1f]$"
+            ),
+        ),
+        (r"(?P<a>x)(?P=a)$", 0, r"(?<a>x)\k<a>$"),
+        (r"a|bc", 0, r"(?:a|bc)[\s\S]*"),
+        (r"x{,3}$", 0, r"x{0,3}$"),
+        (r"x{$", 0, r"x\{$"),
+        (r"[]^/]$", 0, r"[\]\^\/]$"),
+        (r".$", 0, r"[^\n]$"),
+        (r".$", re.DOTALL, r"[\s\S]$"),
+        ("\U0001f600\t$", 0, r"😀\x09$"),
+        (r"\bx$", re.ASCII, r"\bx$"),
+    ],
+)
+def test_translate(pattern, flags, exp):
+    assert translate_pattern(pattern, flags) == exp
+
+
+@pytest.mark.parametrize(
+    ("pattern", "flags"),
+    [
+        (r"abc", re.IGNORECASE),
+        (r"abc", re.MULTILINE),
+        (r"abc", re.VERBOSE),
+        (r"(?i)abc", 0),
+        (r"a(?i:b)c", 0),
+        (r"(?>ab)", 0),
+        (r"a++", 0),
+        (r"(a)?(?(1)b|c)", 0),
+        (r"\bx", 0),
+        (r"[\W\d]", 0),
+        (r"[!-&\&]x", 0),
+        (b"abc", 0),
+        (r"(unbalanced", 0),
+    ],
+)
+def test_translate_unsupported(pattern, flags):
+    assert translate_pattern(pattern, flags) is None
+
+
+PATTERNS = [
+    r"^[a-z_-]+\d{2,}",
+    r"(a)\1$",
+    r"(?=a)(?<!b)a*?$",
+    r"[\w.+-]+@[\w-]+\.[\w.]+$",
+    r"[^\d]+$",
+    r"\D\W",
+    r"(?:x{2}){1,2}$",
+    r"\.\*\+\?\(\)\[\]\{\}\|\^\$\\/",
+    r"[#%@!~`'\"<>=;,:]+$",
+    r"ab|ac$",
+    r"\S+\s",
+]
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_translate_matches_same(pattern):
+    translated = translate_pattern(pattern)
+    compiled = re.compile(to_python(f"^(?:{translated})$"))
+    rng = random.Random(pattern)
+    alphabet = "abcx019-_.@+ \t\u00e9\u0660\ufeff\x1c\\/()[]{}|^$#%!~`'\"<>=;,:*?"
+    values = ["".join(rng.choices(alphabet, k=rng.randrange(6))) for _ in range(500)]
+    values += ["ab12", "aa", "a.b@c-d.e", ".*+?()[]{}|^$\\/", "xxxx", "ac"]
+    for value in values:
+        exp = bool(re.match(pattern, value))
+        assert bool(compiled.match(value)) is exp, value
+
+
+def test_translate_cached():
+    translate_pattern.cache_clear()
+    translate_pattern(r"[a-z]+$")
+    translate_pattern(r"[a-z]+$")
+    translate_pattern(r"[a-z]+$", re.ASCII)
+    info = translate_pattern.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+# ATTRIBUTE
+
+
+def test_pattern_attr():
+    form = get_form(validators=[Regexp(r"^[a-z]+$"), Length(max=5)])
+    res = get_html5_kwargs(form.test_field)
+    assert res == {"pattern": "^[a-z]+$", "maxlength": 5}
+
+
+def test_pattern_attr_skipped():
+    form = get_form(validators=[Regexp(r"^[a-z]+$", re.IGNORECASE)])
+    assert get_html5_kwargs(form.test_field) == {}
+
+
+def test_pattern_attr_subclasses():
+    form = get_form(validators=[MacAddress(), URL()])
+    plan = get_html5_plan(form.test_field)
+    assert plan["pattern"] == r"^(?:[0-9a-fA-F]{2}:){5}[0-9a-fA-F]{2}$"
+
+
+def test_pattern_rendered():
+    form = get_form(validators=[Regexp(r"\d+$")], use_meta=True)
+    assert 'pattern="\\p{Nd}+$"' in form.test_field()
@@ -0,0 +1,188 @@
+# pylama:ignore=C0111
+"""
+Tests for the :func:`wtforms_html5.precheck.precheck` function.
+
+"""
+
+import itertools
+
+import pytest
+from wtforms import DecimalField
+from wtforms import FieldList
+from wtforms import FloatField
+from wtforms import Form
+from wtforms import FormField
+from wtforms import IntegerField
+from wtforms import StringField
+from wtforms.validators import DataRequired
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+from wtforms.validators import Optional
+from wtforms.validators import Regexp
+
+import wtforms_html5.precheck
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5.precheck import get_precheck_plan
+from wtforms_html5.precheck import precheck
+
+from . import MultiDict
+
+pytestmark = pytest.mark.skipif(MultiDict is None, reason="needs Werkzeug")
+
+
+class AddressForm(Form):
+    zip = StringField(validators=[InputRequired(), Length(min=5, max=5)])
+
+
+class PrecheckForm(Form):
+    class Meta(AutoAttrMeta):
+        pass
+
+    name = StringField(validators=[InputRequired(), Length(min=2, max=8)])
+    nick = StringField(validators=[DataRequired(), Length(max=4)])
+    bio = StringField(validators=[Optional(), Length(min=3)])
+    age = IntegerField(validators=[InputRequired(), NumberRange(min=0, max=130)])
+    size = FloatField(validators=[Optional(), NumberRange(min=0.5)])
+    price = DecimalField(validators=[NumberRange(max=10)])
+    code = StringField(validators=[Regexp("^[a-z]+$"), Length(max=3)])
+    fallback = StringField(default="abc", validators=[DataRequired()])
+    address = FormField(AddressForm)
+    tags = FieldList(StringField(validators=[InputRequired()]), min_entries=1)
+
+
+VALUES = {
+    "name": [None, "", "x", "Joe", "a" * 20],
+    "nick": [None, "", "  ", "jo", "joseph"],
+    "bio": [None, "", "  ", "ab", "abcd"],
+    "age": [None, "", "x", "-1", "30", "200"],
+    "size": [None, "", "0.1", "1.5", "nan"],
+    "price": [None, "1", "11", "x", "NaN"],
+    "code": [None, "abcd", "1"],
+    "fallback": [None, "", "x"],
+    "address-zip": [None, "", "1234", "12345"],
+    "tags-0": [None, ""],
+}
+
+
+def iter_payloads():
+    names = list(VALUES)
+    for i, values in enumerate(itertools.product(*VALUES.values())):
+        if i % 997:  # a deterministic sample of all combinations
+            continue
+        yield MultiDict(
+            {name: value for name, value in zip(names, values) if value is not None}
+        )
+
+
+def test_precheck_never_wrong():
+    checked = failed = 0
+    for formdata in iter_payloads():
+        res = precheck(PrecheckForm, formdata)
+        form = PrecheckForm(formdata)
+        form.validate()
+        errors = {}
+        for field in form:
+            if isinstance(field, FormField):
+                errors.update((subfield.name, subfield.errors) for subfield in field)
+            else:
+                errors[field.name] = field.errors
+        for name in res:
+            assert errors[name], (name, formdata)
+        checked += 1
+        failed += bool(res)
+    assert failed > checked / 2
+
+
+def test_precheck_codes():
+    formdata = MultiDict(
+        {
+            "name": "a" * 20,
+            "nick": " ",
+            "bio": "ab",
+            "age": "x",
+            "size": "0.1",
+            "price": "11",
+            "address-zip": "1",
+        }
+    )
+    res = precheck(PrecheckForm, formdata)
+    assert res == {
+        "name": ["maxlength"],
+        "nick": ["required"],
+        "bio": ["minlength"],
+        "age": ["invalid"],
+        "size": ["min"],
+        "price": ["max"],
+        "address-zip": ["minlength"],
+    }
+
+
+def test_precheck_missing():
+    res = precheck(PrecheckForm, MultiDict())
+    assert res == {
+        "name": ["required"],
+        "nick": ["required"],
+        "age": ["required"],
+        "price": ["required"],
+        "address-zip": ["required"],
+    }
+
+
+def test_precheck_optional_clears_errors():
+    formdata = MultiDict({"bio": "  ", "size": ""})
+    res = precheck(PrecheckForm, formdata)
+    assert "bio" not in res
+    assert "size" not in res
+
+
+def test_precheck_prefix():
+    formdata = MultiDict({"p-name": "a" * 20})
+    res = precheck(PrecheckForm, formdata, prefix="p")
+    assert res["p-name"] == ["maxlength"]
+    assert "name" not in res
+
+
+def test_precheck_skips_unknown():
+    class OtherForm(Form):
+        code = StringField(validators=[Regexp("^x$"), InputRequired()])
+        stripped = StringField(
+            validators=[InputRequired()],
+            filters=[lambda x: x or "default"],
+        )
+        inline = StringField(validators=[InputRequired()])
+        called = StringField(default=lambda: "", validators=[DataRequired()])
+
+        def validate_inline(self, field):
+            pass
+
+    assert [entry[0] for entry in get_precheck_plan(OtherForm)] == ["called"]
+    assert precheck(OtherForm, MultiDict()) == {}
+
+
+def test_precheck_empty_message():
+    class OtherForm(Form):
+        name = StringField(validators=[InputRequired(message="")])
+
+    assert precheck(OtherForm, MultiDict()) == {}
+    assert OtherForm(MultiDict()).validate() is True
+
+
+def test_precheck_plan_cached(monkeypatch):
+    plan = get_precheck_plan(PrecheckForm)
+
+    def fail(form_class, prefix=""):
+        raise AssertionError("plan compiled again")
+
+    monkeypatch.setattr(wtforms_html5.precheck, "_compile_form", fail)
+    assert get_precheck_plan(PrecheckForm) is plan
+    assert [entry[0] for entry in plan] == [
+        "name",
+        "nick",
+        "bio",
+        "age",
+        "size",
+        "price",
+        "fallback",
+        "address-zip",
+    ]
@@ -0,0 +1,169 @@
+# pylama:ignore=C0111
+"""
+Tests for :func:`wtforms_html5.profile` and :cls:`wtforms_html5.RenderProfile`.
+
+"""
+
+import io
+import pstats
+import re
+
+from wtforms import FieldList
+from wtforms import Form
+from wtforms import FormField
+from wtforms import IntegerField
+from wtforms import StringField
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+
+import wtforms_html5
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import RenderProfile
+from wtforms_html5 import profile
+
+RENDER_STAGES = {"render_field", "get_plan", "merge", "set_invalid", "widget"}
+
+
+class RowForm(Form):
+    class Meta(AutoAttrMeta):
+        pass
+
+    sku = StringField(validators=[Length(max=8)])
+
+
+class ProfileForm(Form):
+    class Meta(AutoAttrMeta):
+        pass
+
+    name = StringField(
+        validators=[InputRequired(), Length(max=12)],
+        description="Name",
+    )
+    age = IntegerField(validators=[NumberRange(max=99)])
+    tags = FieldList(StringField(), min_entries=3)
+    row = FormField(RowForm)
+
+
+def test_render_stages():
+    form = ProfileForm()
+    with profile() as prof:
+        form.name()
+        form.name()
+    res = prof.snapshot()["ProfileForm"]["name"]
+    assert RENDER_STAGES <= set(res)
+    assert res["widget"]["calls"] == 2
+    assert res["render_field"]["total_ns"] >= res["widget"]["total_ns"]
+
+
+def test_plan_stages():
+    wtforms_html5.invalidate(ProfileForm)
+    with profile() as prof:
+        ProfileForm()
+    res = prof.snapshot()["ProfileForm"]
+    assert set(res["name"]) == {
+        "get_html5_plan",
+        "set_required",
+        "minmaxlength_attrs",
+        "set_title",
+    }
+    assert "minmax_attrs" in res["age"]
+
+
+def test_same_output():
+    form = ProfileForm()
+    form.validate()
+    exp = [field() for field in form]
+    with profile():
+        assert [field() for field in form] == exp
+
+
+def test_fieldlist_entries_counted_together():
+    form = ProfileForm()
+    with profile() as prof:
+        for entry in form.tags:
+            entry()
+    assert prof.snapshot()["ProfileForm"]["tags-*"]["widget"]["calls"] == 3
+
+
+def test_inactive():
+    form = ProfileForm()
+    with profile() as prof:
+        pass
+    form.name()
+    assert prof.snapshot() == {}
+    assert wtforms_html5._profiler is None
+
+
+def test_nested():
+    form = ProfileForm()
+    with profile() as outer:
+        with profile() as inner:
+            form.name()
+        form.age()
+    assert list(inner.snapshot()["ProfileForm"]) == ["name"]
+    assert list(outer.snapshot()["ProfileForm"]) == ["age"]
+
+
+def test_given_profiler():
+    prof = RenderProfile()
+    form = ProfileForm()
+    with profile(prof) as res:
+        form.name()
+    assert res is prof
+    prof.reset()
+    assert prof.snapshot() == {}
+
+
+def test_custom_get_render_kw():
+    class CustomMeta(AutoAttrMeta):
+        def get_render_kw(self, field, render_kw):
+            return {**super().get_render_kw(field, render_kw), "data_x": "1"}
+
+    class CustomForm(Form):
+        class Meta(CustomMeta):
+            pass
+
+        name = StringField()
+
+    form = CustomForm()
+    with profile() as prof:
+        assert 'data-x="1"' in form.name()
+    res = prof.snapshot()[CustomForm.__qualname__]["name"]
+    assert "get_render_kw" in res
+
+
+def test_collapsed():
+    form = ProfileForm()
+    with profile() as prof:
+        form.row()
+    lines = prof.collapsed().splitlines()
+    assert lines
+    assert all(re.fullmatch(r"[^ ]+ \d+", line) for line in lines)
+    assert any(
+        line.startswith("ProfileForm;row;render_field;widget;RowForm;row-sku;")
+        for line in lines
+    )
+
+
+def test_pstats():
+    form = ProfileForm()
+    with profile() as prof:
+        form.row()
+    stream = io.StringIO()
+    stats = pstats.Stats(prof, stream=stream)
+    stats.sort_stats("tottime").print_stats()
+    assert "ProfileForm.row:0(widget)" in stream.getvalue()
+    cc, nc, _tt, _ct, callers = stats.stats[("RowForm.row-sku", 0, "render_field")]
+    assert (cc, nc) == (1, 1)
+    assert list(callers) == [("ProfileForm.row", 0, "widget")]
+
+
+def test_dump_stats(tmp_path):
+    form = ProfileForm()
+    with profile() as prof:
+        form.name()
+    path = tmp_path / "render.prof"
+    prof.dump_stats(path)
+    stats = pstats.Stats(str(path))
+    assert ("ProfileForm.name", 0, "widget") in stats.stats
@@ -0,0 +1,365 @@
+# pylama:ignore=C0111
+"""
+Tests for the :mod:`wtforms_html5.render` module.
+
+"""
+
+from types import GeneratorType
+
+import pytest
+from markupsafe import Markup
+from wtforms import BooleanField
+from wtforms import FieldList
+from wtforms import Form
+from wtforms import FormField
+from wtforms import HiddenField
+from wtforms import IntegerField
+from wtforms import SelectField
+from wtforms import StringField
+from wtforms import TextAreaField
+from wtforms.validators import DataRequired
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5.render import field_fingerprint
+from wtforms_html5.render import form_etag
+from wtforms_html5.render import iter_fields
+from wtforms_html5.render import iter_render
+from wtforms_html5.render import render_changed
+from wtforms_html5.render import render_errors
+from wtforms_html5.render import render_rows
+
+
+class RowForm(Form):
+    class Meta(AutoAttrMeta):
+        pass
+
+    sku = StringField(validators=[Length(max=8)])
+
+
+class BulkForm(Form):
+    class Meta(AutoAttrMeta):
+        pass
+
+    token = HiddenField()
+    name = StringField(validators=[InputRequired()])
+    tags = FieldList(StringField(validators=[Length(max=5)]), min_entries=3)
+    rows = FieldList(FormField(RowForm), min_entries=2)
+
+
+def test_iter_fields_flattens():
+    form = BulkForm()
+    names = [field.name for field in iter_fields(form)]
+    exp = [
+        "token",
+        "name",
+        "tags-0",
+        "tags-1",
+        "tags-2",
+        "rows-0-sku",
+        "rows-1-sku",
+    ]
+    assert names == exp
+
+
+def test_iter_render_is_lazy():
+    form = BulkForm()
+    chunks = iter_render(form)
+    assert isinstance(chunks, GeneratorType)
+    assert next(chunks) == form.token()
+
+
+def test_iter_render_fields():
+    form = BulkForm()
+    chunks = list(iter_render(form))
+    assert chunks == [field() for field in iter_fields(form)]
+    assert 'maxlength="5"' in chunks[2]
+    assert 'maxlength="8"' in chunks[-1]
+
+
+def test_iter_render_labels_and_errors():
+    form = BulkForm()
+    form.validate()
+    chunks = list(iter_render(form, labels=True, errors=True))
+    assert chunks[0] == form.token()
+    exp = (
+        form.name.label()
+        + form.name()
+        + Markup('<ul class="errors"><li>This field is required.</li></ul>')
+    )
+    assert chunks[1] == exp
+
+
+def test_iter_render_render_kw():
+    form = BulkForm()
+    chunks = list(iter_render(form, render_kw={"tags-1": {"class_": "x"}}))
+    assert 'class="x"' in chunks[3]
+    assert "class" not in chunks[2]
+
+
+def test_render_errors_escaped():
+    form = BulkForm()
+    assert render_errors(form.name) == ""
+    form.name.errors = ["<b>bad</b>"]
+    exp = '<ul class="e"><li>&lt;b&gt;bad&lt;/b&gt;</li></ul>'
+    assert render_errors(form.name, "e") == exp
+
+
+# DIFFERENTIAL RENDERING
+
+
+class ChoiceForm(Form):
+    class Meta(AutoAttrMeta):
+        pass
+
+    color = SelectField(choices=["red", "green"])
+
+
+def test_render_changed_first():
+    form = BulkForm()
+    res = render_changed(form)
+    assert list(res.html.values()) == list(iter_render(form))
+    assert list(res.fingerprints) == list(res.html)
+    assert res.removed == []
+
+
+def test_render_changed_unchanged():
+    first = render_changed(BulkForm())
+    res = render_changed(BulkForm(), first.fingerprints)
+    assert res.html == {}
+    assert res.fingerprints == first.fingerprints
+
+
+def test_render_changed_after_validate():
+    form = BulkForm()
+    first = render_changed(form, errors=True)
+    form.validate()
+    res = render_changed(form, first.fingerprints, errors=True)
+    assert list(res.html) == ["name"]
+    assert res.html["name"] == form.name() + render_errors(form.name)
+    assert 'class="invalid"' in res.html["name"]
+
+
+def test_render_changed_value():
+    first = render_changed(BulkForm())
+    form = BulkForm(data={"tags": ["a", "b", "c"]})
+    res = render_changed(form, first.fingerprints)
+    assert list(res.html) == ["tags-0", "tags-1", "tags-2"]
+
+
+def test_render_changed_removed():
+    form = BulkForm()
+    first = render_changed(form)
+    form.tags.pop_entry()
+    res = render_changed(form, first.fingerprints)
+    assert res.html == {}
+    assert res.removed == ["tags-2"]
+
+
+def test_render_changed_labels():
+    form = BulkForm()
+    first = render_changed(form, labels=True)
+    assert list(first.html.values()) == list(iter_render(form, labels=True))
+    form.name.label.text = "Full name"
+    res = render_changed(form, first.fingerprints, labels=True)
+    assert list(res.html) == ["name"]
+
+
+def test_render_changed_flags():
+    form = BulkForm()
+    first = render_changed(form)
+    form.name.flags.disabled = True
+    res = render_changed(form, first.fingerprints)
+    assert list(res.html) == ["name"]
+    assert "disabled" in res.html["name"]
+
+
+class CheckboxForm(Form):
+    class Meta(AutoAttrMeta):
+        pass
+
+    agree = BooleanField()
+
+
+def test_render_changed_checked():
+    first = render_changed(CheckboxForm(data={"agree": True}))
+    assert "checked" in first.html["agree"]
+    form = CheckboxForm(data={"agree": False})
+    res = render_changed(form, first.fingerprints)
+    assert res.html == {"agree": form.agree()}
+    assert "checked" not in res.html["agree"]
+
+
+def test_render_changed_choices():
+    first = render_changed(ChoiceForm())
+    assert render_changed(ChoiceForm(), first.fingerprints).html == {}
+    form = ChoiceForm(data={"color": "green"})
+    res = render_changed(form, first.fingerprints)
+    assert res.html == {"color": form.color()}
+
+
+def test_field_fingerprint():
+    form = BulkForm()
+    res = field_fingerprint(form.name)
+    assert res == render_changed(form).fingerprints["name"]
+    assert res == field_fingerprint(BulkForm().name)
+    assert res != field_fingerprint(form.name, {"class_": "x"})
+    assert len(res) == 16
+
+
+# ETAG
+
+
+class LazyString:
+    def __init__(self, text):
+        self.text = text
+
+    def __str__(self):
+        return self.text
+
+
+def test_form_etag_stable():
+    res = form_etag(BulkForm())
+    assert res == form_etag(BulkForm())
+    assert res.startswith('"') and res.endswith('"')
+    assert len(res) == 34
+
+
+def test_form_etag_data():
+    res = form_etag(BulkForm())
+    assert form_etag(BulkForm(data={"name": "x"})) != res
+    assert form_etag(BulkForm(data={"tags": ["", "", ""]})) != res
+
+
+def test_form_etag_errors():
+    form = BulkForm()
+    res = form_etag(form)
+    form.validate()
+    assert form_etag(form) != res
+
+
+def test_form_etag_render_kw():
+    form = BulkForm()
+    res = form_etag(form)
+    assert form_etag(form, {"name": {"class_": "x"}}) != res
+    form.name.render_kw = {"placeholder": "Name"}
+    assert form_etag(form) != res
+
+
+def test_form_etag_plan_changes():
+    form = BulkForm()
+    res = form_etag(form)
+    form.name.validators = [Length(max=3)]
+    assert form_etag(form) != res
+
+
+def test_form_etag_lazy_description():
+    form = BulkForm()
+    res = form_etag(form)
+    form.name.description = LazyString("Name")
+    assert form_etag(form) != res
+    tag = form_etag(form)
+    form.name.description.text = "Full name"
+    assert form_etag(form) != tag
+
+
+def test_form_etag_entries():
+    form = BulkForm()
+    res = form_etag(form)
+    form.tags.append_entry()
+    assert form_etag(form) != res
+
+
+def test_form_etag_form_class():
+    class OtherForm(BulkForm):
+        pass
+
+    assert form_etag(OtherForm()) != form_etag(BulkForm())
+
+
+# ROWS
+
+
+class GridForm(Form):
+    class Meta(AutoAttrMeta):
+        pass
+
+    sku = StringField(
+        validators=[DataRequired(), Length(max=4)],
+        description="SKU & code",
+        render_kw={"class": "sku"},
+    )
+    qty = IntegerField(validators=[NumberRange(min=1, max=99)])
+    active = BooleanField()
+    size = SelectField(choices=[("s", "S"), ("m", "M")])
+    note = TextAreaField(id="grid-note")
+
+
+class Item:
+    def __init__(self, sku, qty, active=False):
+        self.sku = sku
+        self.qty = qty
+        self.active = active
+
+
+ROWS = [
+    {"sku": "A1", "qty": 3, "active": True, "size": "m", "note": "<b>"},
+    Item("B2", 0),
+    {"sku": "TOO-LONG", "qty": None},
+    Item("", 100, active=True),
+]
+
+
+def expected_rows(form_class, rows, prefix=None, validate=False, errors=False):
+    res = []
+    for index, row in enumerate(rows):
+        data = {"data": row} if isinstance(row, dict) else {"obj": row}
+        row_prefix = "" if prefix is None else prefix.format(index=index)
+        form = form_class(prefix=row_prefix, **data)
+        if validate:
+            form.validate()
+        html = {}
+        for name, field in form._fields.items():
+            html[name] = field()
+            if errors:
+                html[name] += render_errors(field)
+        res.append(html)
+    return res
+
+
+@pytest.mark.parametrize("prefix", [None, "row{index}", "r-{index}-"])
+@pytest.mark.parametrize("validate", [False, True])
+def test_render_rows(prefix, validate):
+    res = list(render_rows(GridForm, ROWS, prefix, validate, errors=validate))
+    assert res == expected_rows(GridForm, ROWS, prefix, validate, validate)
+
+
+def test_render_rows_errors_reset():
+    rows = [{"sku": ""}, {"sku": "ok"}]
+    res = list(render_rows(GridForm, rows, validate=True))
+    assert res[0]["sku"].startswith('<input class="invalid sku"')
+    assert res[1]["sku"].startswith('<input class="sku"')
+
+
+def test_render_rows_nested():
+    rows = [{"name": "a", "tags": ["x", "y"]}, {"name": "b"}]
+    res = list(render_rows(BulkForm, rows, "row{index}", validate=True))
+    assert res == expected_rows(BulkForm, rows, "row{index}", validate=True)
+    assert 'name="row0-tags-1"' in res[0]["tags"]
+
+
+def test_render_rows_render_kw():
+    render_kw = {"sku": {"class_": "x", "id": "own"}, "qty": {"value": "7"}}
+    res = next(render_rows(GridForm, [{"qty": 2}], render_kw=render_kw))
+    form = GridForm(data={"qty": 2})
+    assert res["sku"] == form.sku(**render_kw["sku"])
+    assert res["qty"] == form.qty(**render_kw["qty"])
+
+
+def test_render_rows_is_lazy():
+    rows = iter([{"sku": "A1"}])
+    res = render_rows(GridForm, rows)
+    assert isinstance(res, GeneratorType)
+    assert next(res)["sku"] == GridForm(data={"sku": "A1"}).sku()
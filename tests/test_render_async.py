@@ -0,0 +1,110 @@
+# pylama:ignore=C0111
+"""
+Tests for :func:`wtforms_html5.render.aiter_render`.
+
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from wtforms import FieldList
+from wtforms import Form
+from wtforms import IntegerField
+from wtforms import StringField
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5.render import aiter_render
+from wtforms_html5.render import iter_render
+
+
+class LargeForm(Form):
+    class Meta(AutoAttrMeta):
+        pass
+
+    name = StringField(validators=[InputRequired(), Length(max=12)])
+    ages = FieldList(IntegerField(validators=[NumberRange(max=99)]), min_entries=20)
+    items = FieldList(
+        StringField(validators=[Length(max=5)], description="Item"),
+        min_entries=3000,
+    )
+
+
+def collect(form, **kwargs):
+    async def main():
+        return [chunk async for chunk in aiter_render(form, **kwargs)]
+
+    return asyncio.run(main())
+
+
+def test_same_output():
+    form = LargeForm()
+    form.validate()
+    exp = "".join(iter_render(form, errors=True))
+    assert "".join(collect(form, errors=True)) == exp
+
+
+def test_chunk_size():
+    form = LargeForm()
+    chunks = collect(form, chunk_size=1000, time_budget=None)
+    assert [chunk.count("<input") for chunk in chunks] == [1000, 1000, 1000, 21]
+
+
+def test_single_chunk():
+    chunks = collect(LargeForm(), time_budget=None)
+    assert len(chunks) == 1
+
+
+def test_executor():
+    form = LargeForm()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        chunks = collect(form, chunk_size=500, executor=executor)
+    assert "".join(chunks) == "".join(iter_render(form))
+
+
+def measure_lag(render, interval=0.001):
+    """
+    Returns the longest delay of a ticker task while *render* runs (and the
+    time *render* took).
+
+    """
+
+    async def main():
+        lag = 0.0
+        done = False
+
+        async def ticker():
+            nonlocal lag
+            while not done:
+                start = perf_counter()
+                await asyncio.sleep(interval)
+                lag = max(lag, perf_counter() - start - interval)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(interval * 2)
+        start = perf_counter()
+        await render()
+        duration = perf_counter() - start
+        done = True
+        await task
+        return lag, duration
+
+    return asyncio.run(main())
+
+
+def test_loop_lag():
+    form = LargeForm()
+
+    async def blocking():
+        return list(iter_render(form))
+
+    async def chunked():
+        return [chunk async for chunk in aiter_render(form, time_budget=0.002)]
+
+    blocking_lag, duration = measure_lag(blocking)
+    chunked_lag, _duration = measure_lag(chunked)
+    assert blocking_lag >= duration * 0.5
+    assert chunked_lag < blocking_lag / 2
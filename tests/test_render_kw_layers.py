@@ -0,0 +1,87 @@
+# pylama:ignore=C0111
+"""
+Tests for the layering of render keywords in :cls:`wtforms_html5.AutoAttrMeta`.
+
+"""
+
+import sys
+import tracemalloc
+
+import pytest
+from wtforms import Form
+from wtforms import StringField
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+
+from wtforms_html5 import AttrPlan
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import apply_html5_plan
+
+
+class LayerForm(Form):
+    class Meta(AutoAttrMeta):
+        pass
+
+    name = StringField(
+        validators=[InputRequired(), Length(max=8)],
+        description="Plan title",
+        render_kw={"maxlength": 4, "class_": "field"},
+    )
+
+
+def test_precedence():
+    form = LayerForm()
+    res = form.meta.get_render_kw(form.name, {"class_": "call", "title": "Call"})
+    exp = {
+        "required": True,
+        "maxlength": 4,
+        "title": "Call",
+        "class_": "call",
+    }
+    assert res == exp
+
+
+def test_precedence_invalid():
+    form = LayerForm()
+    form.validate()
+    res = form.meta.get_render_kw(form.name, {})
+    assert res["class"] == "invalid field"
+    assert "class_" not in res
+    assert form.name.render_kw == {"maxlength": 4, "class_": "field"}
+
+
+def test_force_with_field_kw():
+    form = LayerForm()
+    plan = AttrPlan({"maxlength": 8, "title": "Plan title"})
+    res = apply_html5_plan(plan, form.name, {}, True, {"maxlength": 4, "title": "F"})
+    assert res == {"maxlength": 8, "title": "F"}
+    res = apply_html5_plan(plan, form.name, {"title": "R"}, True, {"title": "F"})
+    assert res == {"maxlength": 8, "title": "R"}
+
+
+def test_layers_not_changed():
+    form = LayerForm()
+    form.validate()
+    render_kw = {"class": "call"}
+    form.meta.get_render_kw(form.name, render_kw)
+    assert render_kw == {"class": "call"}
+
+
+@pytest.mark.parametrize("errors", [False, True])
+def test_one_mapping_allocated(errors):
+    form = LayerForm()
+    if errors:
+        form.validate()
+    # many keywords, so the size of the dictionaries dominates
+    render_kw = {f"data_{i}": str(i) for i in range(500)}
+    form.meta.get_render_kw(form.name, render_kw)  # warm up
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        res = form.meta.get_render_kw(form.name, render_kw)
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+    # a second copy of the keywords would at least double the peak
+    assert peak < 1.5 * sys.getsizeof(res)
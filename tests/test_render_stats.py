@@ -0,0 +1,116 @@
+# pylama:ignore=C0111
+"""
+Tests for the :cls:`wtforms_html5.RenderStats` instrumentation.
+
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from wtforms import FieldList
+from wtforms import Form
+from wtforms import PasswordField
+from wtforms import StringField
+from wtforms.validators import Length
+
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import RenderStats
+
+
+def make_form_class(stats, fragment_cache=False):
+    class StatsForm(Form):
+        class Meta(AutoAttrMeta):
+            html5_stats = stats
+            html5_fragment_cache = fragment_cache
+
+        name = StringField(validators=[Length(max=5)])
+        secret = PasswordField()
+        items = FieldList(StringField(), min_entries=3)
+
+    return StatsForm
+
+
+def test_disabled_by_default():
+    assert AutoAttrMeta.html5_stats is None
+
+
+def test_render_counters():
+    stats = RenderStats()
+    form = make_form_class(stats)()
+    form.name()
+    form.name()
+    for entry in form.items:
+        entry()
+    res = stats.snapshot()["forms"]["make_form_class.<locals>.StatsForm"]
+    assert set(res) == {"name", "items-*"}
+    assert res["name"]["renders"] == 2
+    assert res["items-*"]["renders"] == 3
+    assert res["name"]["attrs_ns"] > 0
+    assert res["name"]["widget_ns"] > 0
+
+
+def test_output_unchanged():
+    stats = RenderStats()
+    form = make_form_class(stats)()
+    plain = make_form_class(None)()
+    assert form.name(class_="x") == plain.name(class_="x")
+    assert form.items() == plain.items()
+
+
+def test_plan_cache_counters():
+    stats = RenderStats()
+    form_class = make_form_class(stats)
+    form_class()  # 3 fields + 3 list entries sharing one plan
+    assert stats.snapshot()["caches"]["plan"] == {"hits": 2, "misses": 4}
+    form_class()
+    assert stats.snapshot()["caches"]["plan"] == {"hits": 8, "misses": 4}
+
+
+def test_fragment_cache_counters():
+    stats = RenderStats()
+    form = make_form_class(stats, fragment_cache=True)()
+    form.name(data_x="fragment-counter")
+    form.name(data_x="fragment-counter")
+    form.secret()  # not cached
+    assert stats.snapshot()["caches"]["fragment"] == {"hits": 1, "misses": 1}
+
+
+def test_fragment_cache_counters_threads():
+    stats = RenderStats()
+    form_class = make_form_class(stats, fragment_cache=True)
+    form_class().name(data_x="warm")
+
+    def render(thread):
+        form = form_class()
+        for i in range(200):
+            # odd threads always miss, even ones always hit
+            form.name(data_x=f"miss-{thread}-{i}" if thread % 2 else "warm")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(render, range(8)))
+    res = stats.snapshot()["caches"]["fragment"]
+    assert res == {"hits": 800, "misses": 801}
+
+
+def test_reset():
+    stats = RenderStats()
+    make_form_class(stats)().name()
+    stats.reset()
+    assert stats.snapshot() == {
+        "forms": {},
+        "caches": {
+            "plan": {"hits": 0, "misses": 0},
+            "fragment": {"hits": 0, "misses": 0},
+        },
+    }
+
+
+def test_subclass_hook():
+    records = []
+
+    class ExportStats(RenderStats):
+        def record_render(self, form_name, field_name, *args):
+            records.append((form_name, field_name))
+            super().record_render(form_name, field_name, *args)
+
+    make_form_class(ExportStats())().name()
+    assert records == [("make_form_class.<locals>.StatsForm", "name")]
@@ -0,0 +1,121 @@
+# pylama:ignore=C0111
+"""
+Multi-threaded stress tests for the caches of :mod:`wtforms_html5`.
+
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from wtforms import FieldList
+from wtforms import Form
+from wtforms import IntegerField
+from wtforms import StringField
+from wtforms.validators import InputRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+
+from wtforms_html5 import AttrPlan
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import set_invalid
+from wtforms_html5 import set_minmax
+from wtforms_html5 import set_minmaxlength
+from wtforms_html5 import set_required
+from wtforms_html5 import set_title
+
+from . import MultiDict
+
+THREADS = 16
+RENDERS = 50
+
+
+def reference_render(field, render_kw):
+    """
+    Renders *field* like `AutoAttrMeta` did before caching was added.
+
+    """
+    kwargs = dict(field.render_kw or {}, **render_kw)
+    set_required(field, kwargs)
+    set_invalid(field, kwargs)
+    set_minmax(field, kwargs)
+    set_minmaxlength(field, kwargs)
+    set_title(field, kwargs)
+    return field.widget(field, **kwargs)
+
+
+def make_form_classes(fragment_cache):
+    classes = []
+    for i in range(4):
+
+        class StressForm(Form):
+            class Meta(AutoAttrMeta):
+                html5_fragment_cache = fragment_cache
+
+            name = StringField(
+                validators=[InputRequired(), Length(min=2, max=8 + i)],
+                description=f"Name {i}",
+                render_kw={"class": "name"},
+            )
+            age = IntegerField(validators=[NumberRange(min=0, max=99 + i)])
+            tags = FieldList(
+                StringField(validators=[Length(max=4 + i)]),
+                min_entries=3,
+            )
+
+        classes.append(StressForm)
+    return classes
+
+
+def leaf_fields(form):
+    for field in form:
+        if isinstance(field, FieldList):
+            yield from field
+        else:
+            yield field
+
+
+def render(form_class, i):
+    if i % 2 and MultiDict is not None:
+        form = form_class(MultiDict({"name": "x" * 20, "age": "200"}))
+        form.validate()
+    else:
+        form = form_class()
+    render_kw = {"data_i": str(i % 3)}
+    return [
+        (field(**render_kw), reference_render(field, render_kw))
+        for field in leaf_fields(form)
+    ]
+
+
+@pytest.fixture
+def switch_often():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.mark.usefixtures("switch_often")
+@pytest.mark.parametrize("fragment_cache", [False, True])
+def test_concurrent_renders(fragment_cache):
+    classes = make_form_classes(fragment_cache)  # cold caches
+    jobs = [(cls, i) for i in range(RENDERS) for cls in classes]
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        results = list(pool.map(lambda job: render(*job), jobs))
+    for result in results:
+        for html, exp in result:
+            assert html == exp
+    # one plan per unbound field, shared by all forms
+    for cls in classes:
+        plans = {id(cls().name._html5_plan) for _ in range(3)}
+        assert len(plans) == 1
+
+
+def test_plan_is_immutable():
+    plan = AttrPlan({"min": 1})
+    with pytest.raises(AttributeError):
+        plan._values = (2,)
+    with pytest.raises(AttributeError):
+        del plan._keys
+    assert plan == {"min": 1}
@@ -0,0 +1,125 @@
+# pylama:ignore=C0111
+"""
+Tests for the validator registry of :mod:`wtforms_html5`.
+
+"""
+
+import pytest
+from wtforms.validators import AnyOf
+from wtforms.validators import DataRequired
+from wtforms.validators import Length
+from wtforms.validators import NumberRange
+from wtforms.validators import Regexp
+
+import wtforms_html5
+from wtforms_html5 import VALIDATOR_EXTRACTORS
+from wtforms_html5 import get_extractor
+from wtforms_html5 import get_html5_kwargs
+from wtforms_html5 import get_validator_attrs
+from wtforms_html5 import minmax_attrs
+from wtforms_html5 import minmaxlength_attrs
+from wtforms_html5 import pattern_attrs
+from wtforms_html5 import register_validator
+from wtforms_html5 import unregister_validator
+
+from . import get_form
+
+
+class MyLength(Length):
+    pass
+
+
+@pytest.fixture
+def anyof_registered():
+    calls = []
+
+    @register_validator(AnyOf)
+    def anyof_attrs(validator, field):
+        calls.append(validator)
+        return {"data_values": " ".join(validator.values)}
+
+    yield calls
+    unregister_validator(AnyOf)
+
+
+def test_default_registry():
+    assert VALIDATOR_EXTRACTORS[NumberRange] is minmax_attrs
+    assert VALIDATOR_EXTRACTORS[Length] is minmaxlength_attrs
+
+
+def test_lookup_exact_type():
+    assert get_extractor(Length) is minmaxlength_attrs
+    assert get_extractor(Regexp) is pattern_attrs
+    assert get_extractor(DataRequired) is None
+
+
+def test_lookup_mro_fallback():
+    assert MyLength not in VALIDATOR_EXTRACTORS
+    assert get_extractor(MyLength) is minmaxlength_attrs
+    form = get_form(validators=[MyLength(max=3)])
+    assert get_html5_kwargs(form.test_field) == {"maxlength": 3}
+
+
+def test_lookup_cache_cleared_on_register():
+    assert get_extractor(MyLength) is minmaxlength_attrs
+    register_validator(MyLength, minmax_attrs)
+    try:
+        assert get_extractor(MyLength) is minmax_attrs
+    finally:
+        unregister_validator(MyLength)
+    assert get_extractor(MyLength) is minmaxlength_attrs
+
+
+def test_custom_extractor(anyof_registered):
+    form = get_form(validators=[AnyOf(["a", "b"]), Length(max=1)])
+    res = get_html5_kwargs(form.test_field)
+    assert res == {"data_values": "a b", "maxlength": 1}
+
+
+def test_single_walk(anyof_registered):
+    validators = [AnyOf(["a"]), AnyOf(["b"])]
+    form = get_form(validators=validators)
+    res = get_validator_attrs(form.test_field)
+    assert anyof_registered == validators
+    assert res == {"data_values": "a"}
+
+
+def test_first_validator_wins():
+    form = get_form(validators=[Length(max=3), Length(min=1, max=9)])
+    res = get_validator_attrs(form.test_field)
+    assert res == {"minlength": 1, "maxlength": 3}
+
+
+# PUBLIC TUPLES
+
+
+class MyRange:
+    def __init__(self, min=None, max=None):
+        self.min = min
+        self.max = max
+
+    def __call__(self, form, field):
+        pass
+
+
+def test_tuple_extended(monkeypatch):
+    form = get_form(validators=[MyRange(min=1, max=4)])
+    assert get_html5_kwargs(form.test_field) == {}
+    monkeypatch.setattr(wtforms_html5, "MINMAX_VALIDATORS", (NumberRange, MyRange))
+    assert get_html5_kwargs(form.test_field) == {"min": 1, "max": 4}
+    assert get_extractor(MyRange) is minmax_attrs
+
+
+def test_tuple_reduced(monkeypatch):
+    form = get_form(validators=[Length(max=3)])
+    monkeypatch.setattr(wtforms_html5, "MINMAXLENGTH_VALIDATORS", ())
+    assert get_html5_kwargs(form.test_field) == {}
+    monkeypatch.undo()
+    assert get_html5_kwargs(form.test_field) == {"maxlength": 3}
+
+
+def test_tuple_extended_cached_plans(monkeypatch):
+    form_class = type(get_form(use_meta=True, validators=[MyRange(max=4)]))
+    assert form_class().test_field._html5_plan == {}
+    monkeypatch.setattr(wtforms_html5, "MINMAX_VALIDATORS", (NumberRange, MyRange))
+    assert form_class().test_field._html5_plan == {"max": 4}
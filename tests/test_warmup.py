@@ -0,0 +1,109 @@
+# pylama:ignore=C0111
+"""
+Tests for the :func:`wtforms_html5.warmup` function.
+
+"""
+
+import gc
+import sys
+from types import ModuleType
+
+import pytest
+from wtforms import FieldList
+from wtforms import Form
+from wtforms import FormField
+from wtforms import StringField
+from wtforms.validators import Length
+
+import wtforms_html5
+from wtforms_html5 import AutoAttrMeta
+from wtforms_html5 import iter_unbound_fields
+from wtforms_html5 import warmup
+
+
+def make_forms():
+    class RowForm(Form):
+        class Meta(AutoAttrMeta):
+            pass
+
+        sku = StringField(validators=[Length(max=8)])
+
+    class MainForm(Form):
+        class Meta(AutoAttrMeta):
+            pass
+
+        name = StringField(validators=[Length(max=12)])
+        tags = FieldList(StringField(validators=[Length(max=4)]))
+        rows = FieldList(FormField(RowForm))
+
+    class PlainForm(Form):
+        name = StringField(validators=[Length(max=12)])
+
+    return MainForm, RowForm, PlainForm
+
+
+@pytest.fixture
+def plan_calls(monkeypatch):
+    calls = []
+    orig = wtforms_html5.get_html5_plan
+
+    def counting(field):
+        calls.append(field.name)
+        return orig(field)
+
+    monkeypatch.setattr(wtforms_html5, "get_html5_plan", counting)
+    return calls
+
+
+def test_warmup_form_class(plan_calls):
+    main_form, row_form, _ = make_forms()
+    assert warmup(main_form) == [main_form]
+    assert sorted(plan_calls) == ["name", "rows", "rows-0", "sku", "tags", "tags-0"]
+    plan_calls.clear()
+    form = main_form(
+        data={"tags": ["a", "b"], "rows": [{"sku": "x"}, {"sku": "y"}]},
+    )
+    assert 'maxlength="12"' in form.name()
+    assert 'maxlength="4"' in form.tags[1]()
+    assert 'maxlength="8"' in form.rows[1].sku()
+    assert 'maxlength="8"' in row_form().sku()
+    assert plan_calls == []
+
+
+def test_warmup_sets_plans():
+    main_form, _, _ = make_forms()
+    warmup([main_form])
+    for _, unbound_field in iter_unbound_fields(main_form):
+        assert unbound_field._html5_plan is not None
+    assert main_form.name._html5_plan == {"maxlength": 12}
+    assert main_form.tags.args[0]._html5_plan == {"maxlength": 4}
+    assert main_form.tags.args[0]._html5_planned is not None
+
+
+def test_warmup_skips_other_forms(plan_calls):
+    _, _, plain_form = make_forms()
+    assert warmup([plain_form]) == []
+    assert plan_calls == []
+    assert not hasattr(plain_form.name, "_html5_plan")
+
+
+def test_warmup_module(monkeypatch):
+    main_form, row_form, plain_form = make_forms()
+    module = ModuleType("warmup_forms")
+    module.Form = Form
+    module.MainForm = main_form
+    module.RowForm = row_form
+    module.PlainForm = plain_form
+    monkeypatch.setitem(sys.modules, "warmup_forms", module)
+    assert warmup(module) == [main_form, row_form]
+    assert warmup(["warmup_forms"]) == [main_form, row_form]
+
+
+def test_warmup_freeze(monkeypatch):
+    calls = []
+    monkeypatch.setattr(gc, "freeze", lambda: calls.append(True))
+    main_form, _, _ = make_forms()
+    warmup(main_form)
+    assert calls == []
+    warmup(main_form, freeze=True)
+    assert calls == [True]